@@ -0,0 +1,157 @@
+"""Property-based fuzzing and throughput of the four calculation functions
+
+Generates random valid and invalid inputs for each function, checks every
+result against an independent reference formula (and every invalid input
+for a ValueError), and reports calls/sec per function. Exits non-zero if
+any case disagrees with the reference.
+
+Run with: python -m benchmarks.fuzz [--cases 1000000] [--invalid 0.2] [--seed 0]
+"""
+import argparse
+import random
+import sys
+import time
+
+import skeleton
+
+# Reference formulas below spell out the prices, capacities and row width
+# instead of reading skeleton's constants, so a wrong constant is caught too
+CAPACITIES = (200, 300, 500)
+
+# Inputs that are not whole numbers
+NOT_WHOLE = (1.5, 2.0, "10", None, [1], 3 + 0j)
+
+def reference_revenue(a, b, c):
+    return a * 5000 + b * 3000 + c * 1500
+
+def reference_seats_remaining(a, b, c):
+    return (200 - a, 300 - b, 500 - c)
+
+def reference_occupancy(sold, capacity):
+    return (sold * 100) / capacity
+
+def reference_rows(seats):
+    return (seats // 20, seats % 20)
+
+def _break(rng, value, limit=None):
+    """Return an invalid replacement for one valid argument"""
+    choice = rng.randrange(3 if limit is not None else 2)
+    if choice == 0:
+        return -rng.randint(1, 10 ** 6)
+    if choice == 1:
+        return rng.choice(NOT_WHOLE)
+    return limit + rng.randint(1, 10 ** 6)
+
+def _counts(rng, limits, invalid, exceed):
+    args = [rng.randint(0, limit) for limit in limits]
+    if rng.random() < invalid:
+        i = rng.randrange(len(args))
+        args[i] = _break(rng, args[i], limits[i] if exceed else None)
+        return tuple(args), None
+    return tuple(args), True
+
+def revenue_cases(rng, count, invalid):
+    """(args, expected) pairs for calculate_ticket_revenue; expected None means ValueError"""
+    cases = []
+    for _ in range(count):
+        # Revenue does not enforce capacity, so valid counts may go past it
+        args, valid = _counts(rng, (10 ** 6,) * 3, invalid, False)
+        cases.append((args, reference_revenue(*args) if valid else None))
+    return cases
+
+def seats_remaining_cases(rng, count, invalid):
+    cases = []
+    for _ in range(count):
+        args, valid = _counts(rng, CAPACITIES, invalid, True)
+        cases.append((args, reference_seats_remaining(*args) if valid else None))
+    return cases
+
+def occupancy_cases(rng, count, invalid):
+    cases = []
+    for _ in range(count):
+        capacity = rng.randint(1, 10 ** 5)
+        sold = rng.randint(0, capacity)
+        if rng.random() < invalid:
+            choice = rng.randrange(3)
+            if choice == 0:
+                sold = _break(rng, sold, capacity)
+            elif choice == 1:
+                capacity = rng.choice((0, -rng.randint(1, 10 ** 5)) + NOT_WHOLE)
+            else:
+                sold, capacity = capacity + rng.randint(1, 100), capacity
+            cases.append(((sold, capacity), None))
+        else:
+            cases.append(((sold, capacity), reference_occupancy(sold, capacity)))
+    return cases
+
+def rows_cases(rng, count, invalid):
+    cases = []
+    for _ in range(count):
+        # Mostly venue-sized counts, with some far beyond any zone
+        seats = rng.randint(0, 500) if rng.random() < 0.9 else rng.randint(0, 10 ** 9)
+        if rng.random() < invalid:
+            cases.append(((_break(rng, seats),), None))
+        else:
+            cases.append(((seats,), reference_rows(seats)))
+    return cases
+
+FUNCTIONS = [
+    ("calculate_ticket_revenue", revenue_cases),
+    ("calculate_seats_remaining", seats_remaining_cases),
+    ("calculate_zone_occupancy", occupancy_cases),
+    ("calculate_seats_per_row", rows_cases),
+]
+
+def run_cases(function, cases):
+    """Call function on every case; return (results, seconds)
+    A call that raised records the exception instead of a result"""
+    results = []
+    append = results.append
+    start = time.perf_counter()
+    for args, _ in cases:
+        try:
+            append(function(*args))
+        except Exception as e:
+            append(e)
+    return results, time.perf_counter() - start
+
+def check_results(cases, results):
+    """Return the (args, expected, actual) cases that disagree with the reference"""
+    mismatches = []
+    for (args, expected), actual in zip(cases, results):
+        if expected is None:
+            ok = isinstance(actual, ValueError)
+        else:
+            ok = type(actual) is type(expected) and actual == expected
+        if not ok:
+            mismatches.append((args, "ValueError" if expected is None else expected, actual))
+    return mismatches
+
+def fuzz(cases=10 ** 6, invalid=0.2, seed=0, module=skeleton):
+    """Fuzz every function; return a list of (name, cases, calls/sec, mismatches)"""
+    report = []
+    for name, generate in FUNCTIONS:
+        rng = random.Random(f"{seed}:{name}")
+        function_cases = generate(rng, cases, invalid)
+        results, seconds = run_cases(getattr(module, name), function_cases)
+        report.append((name, cases, cases / seconds, check_results(function_cases, results)))
+    return report
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cases", type=int, default=10 ** 6, help="cases per function")
+    parser.add_argument("--invalid", type=float, default=0.2, help="fraction of invalid inputs")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    failed = False
+    print(f"{'function':<28} {'cases':>10} {'calls/s':>14} {'mismatches':>11}")
+    for name, count, rate, mismatches in fuzz(args.cases, args.invalid, args.seed):
+        print(f"{name:<28} {count:>10} {rate:>14,.0f} {len(mismatches):>11}")
+        for case_args, expected, actual in mismatches[:5]:
+            print(f"    {name}{case_args!r}: expected {expected!r}, got {actual!r}")
+        failed = failed or bool(mismatches)
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
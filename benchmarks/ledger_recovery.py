@@ -0,0 +1,75 @@
+"""Restart time of the sales ledger: snapshot plus tail versus a full replay
+
+Builds a ledger holding a day of sale and refund events, then times opening
+it with no snapshot (every event replayed) and with a snapshot taken
+`--tail` events before the end (the worst case between two snapshots).
+
+Run with: python -m benchmarks.ledger_recovery [--events 10000000] [--tail 999999]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from sales_ledger import LOG_NAME, SNAPSHOT_NAME, SalesLedger
+from sales_log import HEADER, MAGIC, RECORD
+
+# Sales and refunds in every zone; each block leaves the totals unchanged
+BLOCK = [(0, 5), (1, 7), (2, 9), (0, -5), (1, -7), (2, -9)]
+
+def write_day(path, events):
+    """Write a sales log of events records directly, as a day of sales would leave it"""
+    block = b"".join(RECORD.pack(zone_id, count, 0) for zone_id, count in BLOCK)
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC))
+        blocks, extra = divmod(events, len(BLOCK))
+        step = 100000
+        for first in range(0, blocks, step):
+            file.write(block * min(step, blocks - first))
+        file.write(block[:extra * RECORD.size])
+
+def time_open(directory):
+    start = time.perf_counter()
+    ledger = SalesLedger(directory)
+    elapsed = time.perf_counter() - start
+    return ledger, elapsed
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=10 ** 7)
+    parser.add_argument("--tail", type=int, default=10 ** 6 - 1, help="events after the last snapshot")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        head = args.events - args.tail
+        head += -head % len(BLOCK)
+        write_day(os.path.join(directory, LOG_NAME), head)
+        ledger, _ = time_open(directory)
+        ledger.snapshot()
+        for i in range(args.events - head):
+            zone_id, count = BLOCK[i % len(BLOCK)]
+            if count > 0:
+                ledger.sell(zone_id, count)
+            else:
+                ledger.refund(zone_id, -count)
+        expected = ledger.sold(), ledger.revenue
+        ledger.close(snapshot=False)
+
+        ledger, recovery = time_open(directory)
+        recovered = ledger.sold(), ledger.revenue
+        ledger.close(snapshot=False)
+        os.remove(os.path.join(directory, SNAPSHOT_NAME))
+        ledger, full = time_open(directory)
+        ledger.close(snapshot=False)
+
+    print(f"{args.events:,} events, {args.events - head:,} after the last snapshot")
+    print(f"Full replay:       {full:.3f} s")
+    print(f"Snapshot + tail:   {recovery:.3f} s")
+    if recovered != expected:
+        print(f"Recovered {recovered}, expected {expected}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
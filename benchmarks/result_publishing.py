@@ -0,0 +1,47 @@
+"""Per-assertion versus batched result publishing against a local stub receiver
+
+Run with: python -m benchmarks.result_publishing [--results 200] [--delay 0.005]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from test.ResultCollector import ResultCollector
+from test.StubResultReceiver import StubResultReceiver
+from test.TestCaseResultDto import TestCaseResultDto
+from test.TestUtils import TestUtils
+
+def publish(url, custom_path, results, flush_size):
+    """Time adding results through a collector, then waiting for the upload
+    Returns (test-thread seconds, total seconds, requests)"""
+    collector = ResultCollector(url, custom_path, flush_size)
+    start = time.perf_counter()
+    for i in range(results):
+        collector.add(TestUtils.GUID, TestCaseResultDto(f"Test{i}", "functional", 1, 1, "Passed", True, ""))
+    collector.flush()
+    added = time.perf_counter() - start
+    collector.close()
+    return added, time.perf_counter() - start, collector.posts
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--results", type=int, default=200)
+    parser.add_argument("--delay", type=float, default=0.005, help="simulated server latency in seconds")
+    args = parser.parse_args(argv)
+
+    handle, custom_path = tempfile.mkstemp(suffix=".ih")
+    with os.fdopen(handle, "w") as f:
+        f.write("x" * 4096)
+    try:
+        with StubResultReceiver(delay=args.delay) as receiver:
+            single_added, single, single_posts = publish(receiver.url, custom_path, args.results, 1)
+            batched_added, batched, batched_posts = publish(receiver.url, custom_path, args.results, 0)
+    finally:
+        os.remove(custom_path)
+    print(f"Per-assertion: {single * 1000:.1f} ms total, {single_added * 1000:.1f} ms in tests ({single_posts} requests)")
+    print(f"Batched:       {batched * 1000:.1f} ms total, {batched_added * 1000:.1f} ms in tests ({batched_posts} requests)")
+    print(f"Speedup:       {single / batched:.1f}x")
+
+if __name__ == "__main__":
+    main()
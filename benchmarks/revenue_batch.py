@@ -0,0 +1,52 @@
+"""Throughput of calculate_ticket_revenue_batch versus the scalar function
+
+Run with: python -m benchmarks.revenue_batch [--sizes 1000 1000000 10000000]
+"""
+import argparse
+import random
+import time
+from array import array
+
+import skeleton
+
+DEFAULT_SIZES = [10 ** 3, 10 ** 6, 10 ** 7]
+
+def make_columns(rows, seed=0):
+    """Build random zone A/B/C sales columns within zone capacity"""
+    if skeleton.np is not None:
+        gen = skeleton.np.random.default_rng(seed)
+        return tuple(gen.integers(0, cap + 1, rows, dtype=skeleton.np.int64) for cap in skeleton.DEFAULT_ZONES.capacities)
+    rng = random.Random(seed)
+    return tuple(array("q", [rng.randrange(cap + 1) for _ in range(rows)]) for cap in skeleton.DEFAULT_ZONES.capacities)
+
+def time_scalar(zone_a, zone_b, zone_c):
+    """Time one scalar call per row"""
+    calculate = skeleton.calculate_ticket_revenue
+    rows = [(int(a), int(b), int(c)) for a, b, c in zip(zone_a, zone_b, zone_c)]
+    start = time.perf_counter()
+    for a, b, c in rows:
+        calculate(a, b, c)
+    return time.perf_counter() - start
+
+def time_batch(zone_a, zone_b, zone_c):
+    """Time a single batch call over all rows"""
+    start = time.perf_counter()
+    skeleton.calculate_ticket_revenue_batch(zone_a, zone_b, zone_c)
+    return time.perf_counter() - start
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    args = parser.parse_args(argv)
+
+    backend = "numpy" if skeleton.np is not None else "array"
+    print(f"Batch backend: {backend}")
+    print(f"{'rows':>10} {'scalar rows/s':>15} {'batch rows/s':>15} {'speedup':>8}")
+    for rows in args.sizes:
+        columns = make_columns(rows)
+        scalar = time_scalar(*columns)
+        batch = time_batch(*columns)
+        print(f"{rows:>10} {rows / scalar:>15,.0f} {rows / batch:>15,.0f} {scalar / batch:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
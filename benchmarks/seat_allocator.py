@@ -0,0 +1,86 @@
+"""Group booking throughput: segment-tree SeatAllocator versus a row scan
+
+Replays the same stream of group requests (sizes 1-8, with earlier bookings
+released at random so the zone churns instead of selling out) against the
+SeatAllocator and against a linear scan of every row.
+
+Run with: python -m benchmarks.seat_allocator [--rows 500] [--requests 100000]
+"""
+import argparse
+import random
+import sys
+import time
+
+from seat_allocator import SeatAllocator, first_run
+from skeleton import SEATS_PER_ROW
+
+class RowScanAllocator:
+    """Reference allocator: check every row in order for k adjacent free seats"""
+
+    def __init__(self, capacity, seats_per_row=SEATS_PER_ROW):
+        self.free = [(1 << seats_per_row) - 1] * (capacity // seats_per_row)
+
+    def reserve(self, k):
+        for row, mask in enumerate(self.free):
+            column = first_run(mask, k)
+            if column >= 0:
+                self.free[row] = mask & ~(((1 << k) - 1) << column)
+                return row, column
+        return None
+
+    def release(self, row, column, k):
+        self.free[row] |= ((1 << k) - 1) << column
+
+def make_requests(count, seed=0, max_group=8, release_rate=0.45):
+    """Return a list of ("reserve", k) and ("release", booking index) operations"""
+    rng = random.Random(seed)
+    operations = []
+    booked = 0
+    for _ in range(count):
+        if booked and rng.random() < release_rate:
+            operations.append(("release", rng.randrange(booked)))
+        else:
+            operations.append(("reserve", rng.randint(1, max_group)))
+            booked += 1
+    return operations
+
+def replay(allocator, operations):
+    """Apply operations in order; return (seconds, bookings made, requests refused)"""
+    bookings = []
+    refused = 0
+    start = time.perf_counter()
+    for op, value in operations:
+        if op == "reserve":
+            seats = allocator.reserve(value)
+            if seats is None:
+                refused += 1
+            bookings.append(seats and (seats[0], seats[1], value))
+        else:
+            booking = bookings[value]
+            if booking is not None:
+                allocator.release(*booking)
+                bookings[value] = None
+    return time.perf_counter() - start, len(bookings) - refused, refused
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    capacity = args.rows * SEATS_PER_ROW
+    operations = make_requests(args.requests, args.seed)
+    print(f"{args.rows} rows x {SEATS_PER_ROW} seats, {args.requests} requests")
+    results = []
+    for name, allocator in (("segment tree", SeatAllocator(capacity)), ("row scan", RowScanAllocator(capacity))):
+        seconds, booked, refused = replay(allocator, operations)
+        results.append((booked, refused))
+        print(f"{name:<13} {args.requests / seconds:>12,.0f} requests/s  booked {booked}, refused {refused}")
+    if results[0] != results[1]:
+        print("Allocators disagree")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,67 @@
+"""SQLite ingestion rate: batched inserts into SalesDatabase
+
+Generates a day of sale and refund events across the default zones, loads
+them into a fresh WAL-mode database file with SalesDatabase.add_many and
+reports events per second, then times an occupancy and a revenue query.
+
+Run with: python -m benchmarks.sqlite_ingest [--events 1000000] [--batch 50000]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+from sales_db import SalesDatabase
+from skeleton import DEFAULT_ZONES
+
+TARGET = 200000
+
+def make_events(count, seed=0, zones=DEFAULT_ZONES):
+    """Return count (zone id, count, timestamp) events that never oversell a zone"""
+    rng = random.Random(seed)
+    capacities = list(zones.capacities)
+    sold = [0] * len(zones)
+    events = []
+    for timestamp in range(count):
+        zone_id = rng.randrange(len(zones))
+        tickets = rng.randint(1, 4)
+        if sold[zone_id] + tickets > capacities[zone_id] or (sold[zone_id] >= tickets and rng.random() < 0.45):
+            tickets = -min(tickets, sold[zone_id])
+        sold[zone_id] += tickets
+        events.append((zone_id, tickets, timestamp))
+    return events
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=1000000)
+    parser.add_argument("--batch", type=int, default=50000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    events = make_events(args.events, args.seed)
+    with tempfile.TemporaryDirectory() as directory:
+        with SalesDatabase(os.path.join(directory, "sales.db"), batch_size=args.batch) as db:
+            start = time.perf_counter()
+            db.add_many(events)
+            db.flush()
+            seconds = time.perf_counter() - start
+            rate = args.events / seconds
+            print(f"ingest      {rate:>12,.0f} events/s  ({args.events} events, batches of {args.batch})")
+
+            middle = args.events // 2
+            start = time.perf_counter()
+            occupancy = db.occupancy_at(middle)
+            print(f"occupancy   {(time.perf_counter() - start) * 1000:>12.1f} ms  "
+                  + "  ".join(f"{percent:.1f}%" for percent in occupancy))
+            start = time.perf_counter()
+            revenue = db.revenue_between(middle, middle + args.events // 10)
+            print(f"revenue     {(time.perf_counter() - start) * 1000:>12.1f} ms  ₹{revenue:,}")
+    if rate < TARGET:
+        print(f"Below the {TARGET:,} events/s target")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,186 @@
+"""Microbenchmarks for the calculation functions with stored baselines
+
+Times each calculation function (scalar and batch variants) and the
+console report rendering, then compares every result with the baseline
+stored in benchmarks/baseline.json. Exits non-zero if any benchmark is
+slower than its baseline by more than the threshold.
+
+Timings on a shared machine drift by tens of percent between runs, so each
+benchmark is measured relative to a fixed calibration loop timed right
+before it in each round, and the median relative costs are compared.
+Benchmarks under 10 microseconds get twice the threshold, since timer and
+call overhead dominate them.
+
+Run with:   python -m benchmarks.suite [--threshold 0.25] [--filter revenue]
+Save with:  python -m benchmarks.suite --save
+"""
+import argparse
+import functools
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import timeit
+
+import occupancy
+import sales_stream
+import skeleton
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+SKELETON_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "skeleton.py")
+BATCH_ROWS = 10000
+REPEAT = 15
+THRESHOLD = 0.25
+# Benchmarks faster than this get SHORT_THRESHOLD_FACTOR times the threshold
+SHORT_BENCHMARK = 1e-5
+SHORT_THRESHOLD_FACTOR = 2
+
+def _calibration_loop():
+    """Fixed pure-Python workload (calls, integer arithmetic, type checks) used as the unit of cost"""
+    total = 0
+    for i in range(200):
+        if isinstance(i, int):
+            total += divmod(i * 7, 13)[1]
+    return total
+
+def _console_report():
+    """Run skeleton.py as the console program, with scripted input and discarded output"""
+    with open(SKELETON_PATH, encoding="utf-8") as file:
+        code = compile(file.read(), SKELETON_PATH, "exec")
+    answers = ("120", "210", "380")
+    sink = io.StringIO()
+
+    def run():
+        replies = iter(answers)
+        sink.seek(0)
+        sink.truncate(0)
+        exec(code, {"__name__": "__main__", "input": lambda prompt: next(replies),
+                    "print": functools.partial(print, file=sink)})
+    return run
+
+def _stream_report():
+    tracker = sales_stream.SalesTracker()
+    for zone_id, count in ((0, 120), (1, 210), (2, 380)):
+        tracker.apply(zone_id, count)
+    return tracker.report
+
+def _sales_snapshot():
+    snapshot = skeleton.SalesSnapshot(10, 15, 20)
+    return snapshot.total_revenue(), snapshot.seats_remaining(), snapshot.occupancy(), snapshot.row_layout()
+
+def _columns():
+    from benchmarks.revenue_batch import make_columns
+    return make_columns(BATCH_ROWS)
+
+BENCHMARKS = {
+    # Both variants pass validate positionally, so the difference is the validation cost alone
+    "calculate_ticket_revenue": lambda: functools.partial(skeleton.calculate_ticket_revenue, 10, 15, 20, True),
+    "calculate_ticket_revenue[validate=False]":
+        lambda: functools.partial(skeleton.calculate_ticket_revenue, 10, 15, 20, False),
+    "calculate_seats_remaining": lambda: functools.partial(skeleton.calculate_seats_remaining, 50, 100, 200),
+    "calculate_zone_occupancy": lambda: functools.partial(skeleton.calculate_zone_occupancy, 75, 200),
+    "calculate_seats_per_row": lambda: functools.partial(skeleton.calculate_seats_per_row, 45),
+    "calculate_seats_per_row[large]": lambda: functools.partial(skeleton.calculate_seats_per_row, 10 ** 6),
+    "calculate_ticket_revenue_zones":
+        lambda: functools.partial(skeleton.calculate_ticket_revenue_zones, (10, 15, 20)),
+    "sales_snapshot": lambda: _sales_snapshot,
+    f"calculate_ticket_revenue_batch[{BATCH_ROWS}]":
+        lambda: functools.partial(skeleton.calculate_ticket_revenue_batch, *_columns()),
+    f"occupancy_bp_batch[{BATCH_ROWS}]":
+        lambda: functools.partial(occupancy.occupancy_bp_batch, _columns()[0],
+                                  [skeleton.ZONE_A_CAPACITY] * BATCH_ROWS),
+    "report[stream]": _stream_report,
+    "report[console]": _console_report,
+}
+
+def time_call(function, repeat=REPEAT):
+    """Return (best seconds per call, median cost in calibration loops) over repeat rounds
+    Each round times the calibration loop and then the function, so both
+    see the same machine state"""
+    timer = timeit.Timer(function)
+    calibration = timeit.Timer(_calibration_loop)
+    # autorange aims for 0.2 s; a quarter of that per round keeps more rounds affordable
+    loops = max(1, timer.autorange()[0] // 4)
+    calibration_loops = max(1, calibration.autorange()[0] // 4)
+    best = float("inf")
+    ratios = []
+    for _ in range(repeat):
+        unit = calibration.timeit(calibration_loops) / calibration_loops
+        seconds = timer.timeit(loops) / loops
+        best = min(best, seconds)
+        ratios.append(seconds / unit)
+    return best, statistics.median(ratios)
+
+def run(names=None, repeat=REPEAT):
+    """Time the named benchmarks (all by default)
+    Returns {name: {"seconds": seconds per call, "relative": cost in calibration loops}}"""
+    results = {}
+    for name, setup in BENCHMARKS.items():
+        if names is None or name in names:
+            seconds, relative = time_call(setup(), repeat)
+            results[name] = {"seconds": seconds, "relative": relative}
+    return results
+
+def load_baseline(path=BASELINE_PATH):
+    """Return the stored {name: {"seconds": ..., "relative": ...}}, or {} if there is no baseline"""
+    try:
+        with open(path) as file:
+            return json.load(file)["benchmarks"]
+    except FileNotFoundError:
+        return {}
+
+def save_baseline(results, path=BASELINE_PATH):
+    data = {"python": platform.python_version(), "machine": platform.machine(),
+            "benchmarks": {name: results[name] for name in sorted(results)}}
+    with open(path, "w") as file:
+        json.dump(data, file, indent=2)
+        file.write("\n")
+
+def compare(results, baseline, threshold=THRESHOLD):
+    """Return (name, seconds, baseline seconds or None, ratio or None, regressed) per result
+    ratio compares costs relative to the calibration loop"""
+    rows = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            rows.append((name, result["seconds"], None, None, False))
+            continue
+        ratio = result["relative"] / base["relative"]
+        allowed = threshold * (SHORT_THRESHOLD_FACTOR if base["seconds"] < SHORT_BENCHMARK else 1)
+        rows.append((name, result["seconds"], base["seconds"], ratio, ratio > 1 + allowed))
+    return rows
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline JSON file")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD,
+                        help="allowed slowdown as a fraction of the baseline, doubled for "
+                             "benchmarks under 10 us (default 0.25)")
+    parser.add_argument("--filter", help="only run benchmarks whose name contains this text")
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--save", action="store_true", help="store this run as the new baseline")
+    args = parser.parse_args(argv)
+
+    names = [name for name in BENCHMARKS if args.filter is None or args.filter in name]
+    results = run(names, args.repeat)
+    if args.save:
+        # Keep stored entries only for benchmarks that still exist and were not re-run
+        baseline = {name: value for name, value in load_baseline(args.baseline).items()
+                    if name in BENCHMARKS and name not in results}
+        baseline.update(results)
+        save_baseline(baseline, args.baseline)
+        print(f"Saved {len(results)} benchmarks to {args.baseline}")
+
+    regressed = False
+    print(f"{'benchmark':<44} {'time/call':>12} {'baseline':>12} {'change':>8}")
+    for name, seconds, base, ratio, slower in compare(results, load_baseline(args.baseline), args.threshold):
+        base_text = f"{base * 1e6:>9.3f} us" if base else f"{'-':>12}"
+        change = f"{(ratio - 1) * 100:>+7.1f}%" if ratio else f"{'new':>8}"
+        print(f"{name:<44} {seconds * 1e6:>9.3f} us {base_text} {change}{'  REGRESSED' if slower else ''}")
+        regressed = regressed or slower
+    return 1 if regressed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+"""Thread-safe ticket sales for multi-gate deployments
+
+ConcurrentSeatInventory wraps a SeatInventory with one lock per zone
+(lock striping), so gates selling into different zones never wait on each
+other while the capacity rule from calculate_seats_remaining still holds
+for every zone.
+"""
+import threading
+
+from skeleton import DEFAULT_ZONES, SeatInventory, _check_ticket_count
+
+class ConcurrentSeatInventory:
+    """SeatInventory that can be shared between threads"""
+
+    def __init__(self, zones=DEFAULT_ZONES):
+        self.zones = zones
+        self._inventory = SeatInventory(zones)
+        self._locks = [threading.Lock() for _ in range(len(zones))]
+
+    def _zone(self, zone, count):
+        _check_ticket_count(count)
+        return self.zones.zone_id(zone)
+
+    def sell(self, zone, count=1):
+        """Record count tickets sold in zone and return the seats left there
+        Raises ValueError if the zone does not have count seats left"""
+        i = self._zone(zone, count)
+        with self._locks[i]:
+            return self._inventory.apply(i, count)
+
+    def try_sell(self, zone, count=1):
+        """Sell count tickets in zone if that many seats are left
+        Returns True on success and False, without raising, when sold out"""
+        i = self._zone(zone, count)
+        with self._locks[i]:
+            return self._inventory.try_sell(i, count)
+
+    def refund(self, zone, count=1):
+        """Return count sold tickets in zone to sale and return the seats left there"""
+        i = self._zone(zone, count)
+        with self._locks[i]:
+            return self._inventory.apply(i, -count)
+
+    def seats_remaining(self):
+        """Return a consistent snapshot of remaining seats for every zone
+        Takes every zone lock in zone id order, so it never deadlocks with sales"""
+        for lock in self._locks:
+            lock.acquire()
+        try:
+            return self._inventory.seats_remaining()
+        finally:
+            for lock in self._locks:
+                lock.release()
+
+    def sold(self):
+        """Return a consistent snapshot of tickets sold for every zone"""
+        for lock in self._locks:
+            lock.acquire()
+        try:
+            return tuple(self._inventory.sold)
+        finally:
+            for lock in self._locks:
+                lock.release()
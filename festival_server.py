@@ -0,0 +1,219 @@
+"""asyncio box-office server for the Music Festival Console
+
+Box-office terminals connect over TCP (or a Unix socket) and send one JSON
+request per line. Requests may be pipelined: the server reads whatever has
+arrived, answers every complete request in order and writes the responses
+back in a single batch.
+
+Requests:
+
+    {"id": 1, "op": "sell", "zone": "A", "count": 2}
+    {"id": 2, "op": "refund", "zone": "A", "count": 1}
+    {"id": 3, "op": "revenue"}
+    {"id": 4, "op": "remaining"}
+    {"id": 5, "op": "occupancy"}
+    {"id": 6, "op": "rows"}
+    {"id": 7, "op": "call", "function": "calculate_zone_occupancy", "args": [75, 200]}
+
+Responses are {"id": ..., "ok": true, "result": ...} or
+{"id": ..., "ok": false, "error": "..."}. A request line longer than
+MAX_LINE bytes is answered with an error and the connection is closed.
+
+Run a server:      python festival_server.py serve --port 8765
+Run a load test:   python festival_server.py bench --connections 1000
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+
+import skeleton
+from skeleton import (DEFAULT_ZONES, SeatInventory, calculate_seats_per_row_zones, calculate_seats_remaining_zones,
+                      calculate_ticket_revenue_zones, calculate_zone_occupancy_zones)
+
+READ_SIZE = 1 << 16
+MAX_LINE = 1 << 20
+
+# Calculation functions a client may call directly with the "call" op, with
+# their public argument counts. The trusted-path validate flag is not public:
+# calls always run with validation on
+CALLABLE = {name: (getattr(skeleton, name), arity) for name, arity in
+            (("calculate_ticket_revenue", 3), ("calculate_seats_remaining", 3),
+             ("calculate_zone_occupancy", 2), ("calculate_seats_per_row", 1))}
+
+def _encode(response):
+    return json.dumps(response, separators=(",", ":")).encode() + b"\n"
+
+class FestivalServer:
+    """Shared seat inventory served to many box-office connections"""
+
+    def __init__(self, zones=DEFAULT_ZONES):
+        self.zones = zones
+        self.inventory = SeatInventory(zones)
+
+    def handle_request(self, request):
+        """Apply one decoded request and return its result"""
+        op = request.get("op")
+        inventory = self.inventory
+        if op == "sell":
+            return inventory.sell(request["zone"], request.get("count", 1))
+        if op == "refund":
+            return inventory.refund(request["zone"], request.get("count", 1))
+        if op == "revenue":
+            return calculate_ticket_revenue_zones(inventory.sold, self.zones)
+        if op == "remaining":
+            return calculate_seats_remaining_zones(inventory.sold, self.zones)
+        if op == "occupancy":
+            return calculate_zone_occupancy_zones(inventory.sold, self.zones)
+        if op == "rows":
+            return calculate_seats_per_row_zones(inventory.remaining)
+        if op == "call":
+            name = request.get("function")
+            if name not in CALLABLE:
+                raise ValueError(f"Unknown function: {name!r}")
+            function, arity = CALLABLE[name]
+            args = request.get("args", [])
+            if not isinstance(args, list) or len(args) != arity:
+                raise ValueError(f"{name} takes {arity} arguments")
+            return function(*args, validate=True)
+        raise ValueError(f"Unknown op: {op!r}")
+
+    def respond(self, line):
+        """Return the encoded response line for one raw request line"""
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get("id")
+            return _encode({"id": request_id, "ok": True, "result": self.handle_request(request)})
+        except Exception as e:
+            # Any failure, encoding the result included, is the client's
+            # answer; it must not end the connection
+            error = str(e) or type(e).__name__
+        try:
+            return _encode({"id": request_id, "ok": False, "error": error})
+        except Exception:
+            return _encode({"id": None, "ok": False, "error": error})
+
+    async def handle_connection(self, reader, writer):
+        tail = b""
+        try:
+            while True:
+                data = await reader.read(READ_SIZE)
+                if not data:
+                    break
+                lines = (tail + data).split(b"\n")
+                tail = lines.pop()
+                responses = [self.respond(line) for line in lines if line.strip()]
+                if len(tail) > MAX_LINE:
+                    responses.append(_encode({"id": None, "ok": False, "error": "Request line too long"}))
+                if responses:
+                    writer.write(b"".join(responses))
+                    await writer.drain()
+                if len(tail) > MAX_LINE:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host="127.0.0.1", port=8765, path=None):
+        """Start listening on TCP host:port, or on a Unix socket at path"""
+        if path is not None:
+            return await asyncio.start_unix_server(self.handle_connection, path=path, backlog=4096)
+        return await asyncio.start_server(self.handle_connection, host, port, backlog=4096)
+
+async def _client(host, port, requests, pipeline, latencies, start_line):
+    try:
+        reader, writer = await asyncio.open_connection(host, port)
+    finally:
+        start_line.arrive()
+    await start_line.go.wait()
+    try:
+        for first in range(0, requests, pipeline):
+            batch = range(first, min(first + pipeline, requests))
+            lines = []
+            for i in batch:
+                if i % 2:
+                    lines.append({"id": i, "op": "revenue"})
+                else:
+                    lines.append({"id": i, "op": "call", "function": "calculate_zone_occupancy",
+                                  "args": [i % 200, 200]})
+            sent = time.perf_counter()
+            writer.write(b"".join(json.dumps(line).encode() + b"\n" for line in lines))
+            await writer.drain()
+            for _ in batch:
+                await reader.readline()
+                latencies.append(time.perf_counter() - sent)
+    finally:
+        writer.close()
+
+class _StartLine:
+    """Hold clients until every connection is open, so only request traffic is timed"""
+
+    def __init__(self, clients):
+        self.waiting = clients
+        self.ready = asyncio.Event()
+        self.go = asyncio.Event()
+
+    def arrive(self):
+        self.waiting -= 1
+        if self.waiting == 0:
+            self.ready.set()
+
+def _percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+async def run_load_test(connections=1000, requests=20, pipeline=4, host="127.0.0.1", port=0):
+    """Run a local server and `connections` concurrent clients against it
+    Returns (requests per second, p50 latency, p99 latency) in seconds"""
+    server = FestivalServer()
+    listener = await server.start(host, port)
+    port = listener.sockets[0].getsockname()[1]
+    latencies = []
+    start_line = _StartLine(connections)
+    clients = [asyncio.create_task(_client(host, port, requests, pipeline, latencies, start_line))
+               for _ in range(connections)]
+    await start_line.ready.wait()
+    start = time.perf_counter()
+    start_line.go.set()
+    await asyncio.gather(*clients)
+    elapsed = time.perf_counter() - start
+    listener.close()
+    await listener.wait_closed()
+    latencies.sort()
+    return len(latencies) / elapsed, _percentile(latencies, 0.50), _percentile(latencies, 0.99)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Music Festival Console box-office server")
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve = commands.add_parser("serve", help="run the server")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--unix", metavar="PATH", help="listen on a Unix socket instead of TCP")
+    bench = commands.add_parser("bench", help="load test a local server")
+    bench.add_argument("--connections", type=int, default=1000)
+    bench.add_argument("--requests", type=int, default=20, help="requests per connection")
+    bench.add_argument("--pipeline", type=int, default=4, help="requests in flight per connection")
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        async def serve_forever():
+            listener = await FestivalServer().start(args.host, args.port, args.unix)
+            async with listener:
+                await listener.serve_forever()
+        try:
+            asyncio.run(serve_forever())
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    rate, p50, p99 = asyncio.run(run_load_test(args.connections, args.requests, args.pipeline))
+    print(f"{args.connections} connections, {args.requests} requests each, pipeline {args.pipeline}")
+    print(f"Throughput: {rate:,.0f} requests/sec")
+    print(f"Latency p50: {p50 * 1000:.2f} ms")
+    print(f"Latency p99: {p99 * 1000:.2f} ms")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,247 @@
+"""Opt-in call metrics for the Music Festival Console calculation functions
+
+enable() swaps the calculation functions (and the validation helpers they
+call) on skeleton, and on any other module passed in, for wrappers that
+record per-function call counts, error counts per ValueError message and
+log-linear latency histograms. disable() puts the original functions back,
+so when instrumentation is off the hot path is exactly the uninstrumented
+code. Validation helpers are timed separately from the public functions,
+so validation cost can be read apart from the arithmetic.
+
+    import instrumentation, skeleton
+    instrumentation.enable()
+    skeleton.calculate_ticket_revenue(10, 15, 20)
+    instrumentation.REGISTRY.write("metrics.prom")         # Prometheus text
+    instrumentation.REGISTRY.write("metrics.json", "json")
+    instrumentation.disable()
+
+Only calls made through a module attribute are seen: a module that did
+`from skeleton import calculate_zone_occupancy` keeps the original unless
+it is passed to enable() as well.
+"""
+import functools
+import json
+import os
+import tempfile
+import threading
+import time
+
+import skeleton
+
+INSTRUMENTED = ("calculate_ticket_revenue", "calculate_seats_remaining",
+                "calculate_zone_occupancy", "calculate_seats_per_row",
+                "_check_ticket_counts", "_check_zone_capacities", "_check_occupancy", "_check_seat_count")
+
+# Histogram buckets keep SUB_BUCKET_BITS significant bits of each latency
+# in nanoseconds, so a bucket is at most 1/16 of its value wide
+SUB_BUCKET_BITS = 5
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+HALF_BUCKETS = SUB_BUCKETS >> 1
+
+def bucket_index(value):
+    """Return the histogram bucket for a non-negative integer value"""
+    if value < SUB_BUCKETS:
+        return value
+    shift = value.bit_length() - SUB_BUCKET_BITS
+    return SUB_BUCKETS + (shift - 1) * HALF_BUCKETS + (value >> shift) - HALF_BUCKETS
+
+def bucket_bounds(index):
+    """Return the (lowest, highest) values that fall in bucket index"""
+    if index < SUB_BUCKETS:
+        return index, index
+    shift, top = divmod(index - SUB_BUCKETS, HALF_BUCKETS)
+    shift += 1
+    low = (top + HALF_BUCKETS) << shift
+    return low, low + (1 << shift) - 1
+
+class LatencyHistogram:
+    """HDR-style histogram of latencies in nanoseconds with sparse buckets"""
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        self.counts = {}
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def record(self, nanoseconds):
+        index = bucket_index(nanoseconds)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += nanoseconds
+        if nanoseconds > self.max:
+            self.max = nanoseconds
+
+    def percentile(self, fraction):
+        """Return the upper bound of the bucket holding the given fraction of values"""
+        if not self.count:
+            return 0
+        rank = max(1, round(fraction * self.count))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(bucket_bounds(index)[1], self.max)
+        return self.max
+
+class FunctionMetrics:
+    """Calls, errors and latencies recorded for one function"""
+    __slots__ = ("name", "calls", "errors", "latency", "lock")
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+        self.errors = {}
+        self.latency = LatencyHistogram()
+        self.lock = threading.Lock()
+
+    def reset(self):
+        with self.lock:
+            self.calls = 0
+            self.errors = {}
+            self.latency = LatencyHistogram()
+
+    def record(self, nanoseconds, error=None):
+        with self.lock:
+            self.calls += 1
+            self.latency.record(nanoseconds)
+            if error is not None:
+                self.errors[error] = self.errors.get(error, 0) + 1
+
+def _error_key(error):
+    if isinstance(error, ValueError):
+        return str(error)
+    return f"{type(error).__name__}: {error}"
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+class Registry:
+    """Metrics for every instrumented function, by name"""
+
+    def __init__(self):
+        self.metrics = {}
+        self.lock = threading.Lock()
+
+    def function_metrics(self, name):
+        """Return the FunctionMetrics for name, creating it on first use"""
+        metrics = self.metrics.get(name)
+        if metrics is None:
+            with self.lock:
+                metrics = self.metrics.setdefault(name, FunctionMetrics(name))
+        return metrics
+
+    def wrap(self, function, name=None):
+        """Return function wrapped to record its calls here; usable as a decorator"""
+        metrics = self.function_metrics(name or function.__name__)
+        record = metrics.record
+        clock = time.perf_counter_ns
+
+        @functools.wraps(function)
+        def instrumented(*args, **kwargs):
+            start = clock()
+            try:
+                result = function(*args, **kwargs)
+            except Exception as e:
+                record(clock() - start, _error_key(e))
+                raise
+            record(clock() - start)
+            return result
+        return instrumented
+
+    def reset(self):
+        """Zero every function's metrics in place, so active wrappers keep recording here"""
+        with self.lock:
+            metrics = list(self.metrics.values())
+        for function_metrics in metrics:
+            function_metrics.reset()
+
+    def snapshot(self):
+        """Return every function's metrics as plain data (latencies in nanoseconds)"""
+        data = {}
+        for name, metrics in sorted(self.metrics.items()):
+            with metrics.lock:
+                latency = metrics.latency
+                data[name] = {
+                    "calls": metrics.calls,
+                    "errors": dict(metrics.errors),
+                    "latency_ns": {
+                        "count": latency.count, "sum": latency.total, "max": latency.max,
+                        "p50": latency.percentile(0.50), "p90": latency.percentile(0.90),
+                        "p99": latency.percentile(0.99), "p999": latency.percentile(0.999),
+                        "buckets": [[bucket_bounds(i)[1], latency.counts[i]] for i in sorted(latency.counts)],
+                    },
+                }
+        return data
+
+    def to_json(self):
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self, prefix="festival"):
+        """Render the metrics in the Prometheus text exposition format"""
+        snapshot = self.snapshot()
+        lines = [f"# HELP {prefix}_calls_total Calls per calculation function",
+                 f"# TYPE {prefix}_calls_total counter"]
+        for name, data in snapshot.items():
+            lines.append(f'{prefix}_calls_total{{function="{name}"}} {data["calls"]}')
+        lines += [f"# HELP {prefix}_errors_total Failed calls per function and error message",
+                  f"# TYPE {prefix}_errors_total counter"]
+        for name, data in snapshot.items():
+            for message, count in sorted(data["errors"].items()):
+                lines.append(f'{prefix}_errors_total{{function="{name}",message="{_label(message)}"}} {count}')
+        lines += [f"# HELP {prefix}_call_duration_seconds Call latency per function",
+                  f"# TYPE {prefix}_call_duration_seconds histogram"]
+        for name, data in snapshot.items():
+            latency = data["latency_ns"]
+            cumulative = 0
+            for upper, count in latency["buckets"]:
+                cumulative += count
+                lines.append(f'{prefix}_call_duration_seconds_bucket{{function="{name}",le="{upper / 1e9:.9g}"}} '
+                             f'{cumulative}')
+            lines.append(f'{prefix}_call_duration_seconds_bucket{{function="{name}",le="+Inf"}} {latency["count"]}')
+            lines.append(f'{prefix}_call_duration_seconds_sum{{function="{name}"}} {latency["sum"] / 1e9:.9g}')
+            lines.append(f'{prefix}_call_duration_seconds_count{{function="{name}"}} {latency["count"]}')
+        return "\n".join(lines) + "\n"
+
+    def write(self, path, format="prometheus"):
+        """Atomically replace path with the metrics as "prometheus" text or "json"
+        A scraper reading the file never sees a partly written export"""
+        if format not in ("prometheus", "json"):
+            raise ValueError(f"Unknown metrics format: {format!r}")
+        text = self.to_prometheus() if format == "prometheus" else self.to_json()
+        directory = os.path.dirname(os.path.abspath(path))
+        handle, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "w") as file:
+                file.write(text)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+REGISTRY = Registry()
+
+# (module, attribute, original) for every attribute enable() replaced
+_patched = []
+
+def is_enabled():
+    return bool(_patched)
+
+def enable(*modules, names=INSTRUMENTED, registry=REGISTRY):
+    """Instrument names on skeleton and on every module given
+    A module's attribute is only replaced if it is skeleton's own function"""
+    if _patched:
+        disable()
+    originals = {name: getattr(skeleton, name) for name in names}
+    wrappers = {name: registry.wrap(function, name) for name, function in originals.items()}
+    for module in (skeleton,) + tuple(m for m in modules if m is not skeleton):
+        for name, original in originals.items():
+            if getattr(module, name, None) is original:
+                setattr(module, name, wrappers[name])
+                _patched.append((module, name, original))
+
+def disable():
+    """Restore every original function replaced by enable()"""
+    while _patched:
+        module, name, original = _patched.pop()
+        setattr(module, name, original)
@@ -0,0 +1,86 @@
+"""Integer occupancy engine for the Music Festival Console
+
+calculate_zone_occupancy returns a float percentage. On hot paths
+(per-sale threshold checks across many zones and venues) this module
+keeps occupancy as integers: floor basis points (1/100 of a percent)
+for ranking and dashboards, and exact integer comparisons for
+thresholds. The float percentage is only produced at display time, from
+the original (sold, capacity) pair, so it is bit-identical to
+calculate_zone_occupancy.
+"""
+from array import array
+
+from skeleton import _as_int_column, _check_occupancy, np
+
+BASIS_POINTS = 10000
+
+def occupancy_bp(zone_sold, zone_capacity, validate=True):
+    """Return occupancy in whole basis points, rounded down
+    Uses multiplication (*) and floor division (//)"""
+    if validate:
+        _check_occupancy(zone_sold, zone_capacity)
+    return (zone_sold * BASIS_POINTS) // zone_capacity
+
+def occupancy_at_least(zone_sold, zone_capacity, percent, validate=True):
+    """Return True if occupancy is at least percent (an int), compared exactly"""
+    if validate:
+        _check_occupancy(zone_sold, zone_capacity)
+    return zone_sold * 100 >= percent * zone_capacity
+
+def occupancy_percent(zone_sold, zone_capacity):
+    """Convert a (sold, capacity) pair to the display percentage
+    Identical to calculate_zone_occupancy for valid inputs"""
+    return (zone_sold * 100) / zone_capacity
+
+def _check_occupancy_columns(zone_sold, zone_capacity):
+    """Validate (sold, capacity) columns as a whole and return them"""
+    if np is not None:
+        sold, capacity = np.asarray(zone_sold), np.asarray(zone_capacity)
+        if sold.dtype.kind not in "iu" or capacity.dtype.kind not in "iu" or sold.ndim != 1 or capacity.ndim != 1:
+            raise ValueError("Values must be whole numbers")
+        if sold.shape != capacity.shape:
+            raise ValueError("Occupancy columns must have the same length")
+        if sold.size:
+            if sold.min() < 0:
+                raise ValueError("Tickets sold cannot be negative")
+            if capacity.min() <= 0:
+                raise ValueError("Capacity must be positive")
+            if (sold > capacity).any():
+                raise ValueError("Sold tickets cannot exceed capacity")
+        return sold.astype(np.int64, copy=False), capacity.astype(np.int64, copy=False)
+
+    try:
+        sold, capacity = _as_int_column(zone_sold), _as_int_column(zone_capacity)
+    except ValueError:
+        raise ValueError("Values must be whole numbers")
+    if len(sold) != len(capacity):
+        raise ValueError("Occupancy columns must have the same length")
+    if len(sold):
+        if min(sold) < 0:
+            raise ValueError("Tickets sold cannot be negative")
+        if min(capacity) <= 0:
+            raise ValueError("Capacity must be positive")
+        if any(s > c for s, c in zip(sold, capacity)):
+            raise ValueError("Sold tickets cannot exceed capacity")
+    return sold, capacity
+
+def occupancy_bp_batch(zone_sold, zone_capacity):
+    """Return floor basis-point occupancy for arrays of (sold, capacity) pairs"""
+    sold, capacity = _check_occupancy_columns(zone_sold, zone_capacity)
+    if np is not None:
+        return (sold * BASIS_POINTS) // capacity
+    return array("q", [(s * BASIS_POINTS) // c for s, c in zip(sold, capacity)])
+
+def occupancy_at_least_batch(zone_sold, zone_capacity, percent):
+    """Return, per pair, whether occupancy is at least percent, compared exactly"""
+    sold, capacity = _check_occupancy_columns(zone_sold, zone_capacity)
+    if np is not None:
+        return sold * 100 >= percent * capacity
+    return [s * 100 >= percent * c for s, c in zip(sold, capacity)]
+
+def occupancy_percent_batch(zone_sold, zone_capacity):
+    """Convert arrays of (sold, capacity) pairs to display percentages"""
+    sold, capacity = _check_occupancy_columns(zone_sold, zone_capacity)
+    if np is not None:
+        return (sold * 100) / capacity
+    return array("d", [(s * 100) / c for s, c in zip(sold, capacity)])
@@ -0,0 +1,163 @@
+"""Optional SQLite storage for sale events and occupancy history
+
+SalesDatabase keeps every sale (positive count) and refund (negative count)
+with its zone and timestamp in a local SQLite file. Events are buffered and
+written in batched transactions with executemany, on a WAL-mode database
+with one covering index on (zone, timestamp, count).
+
+Events must arrive in non-decreasing timestamp order (merge the feeds of
+several gates before adding them) and are checked against the zone
+capacities through SeatInventory as they arrive. Every point in the
+history therefore satisfies the capacity rules, so history queries can sum
+sales and refunds per zone in SQL, one index range scan per zone, and apply
+the venue's prices and capacities through calculate_ticket_revenue_zones
+and calculate_zone_occupancy_zones.
+"""
+import sqlite3
+
+from skeleton import DEFAULT_ZONES, SeatInventory, calculate_ticket_revenue_zones, calculate_zone_occupancy_zones
+
+BATCH_SIZE = 50000
+# Range of SQLite's INTEGER; counts and timestamps outside it cannot be stored
+FIRST_TIMESTAMP = -(1 << 63)
+LAST_TIMESTAMP = (1 << 63) - 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS zones (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    price INTEGER NOT NULL,
+    capacity INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sales (
+    zone INTEGER NOT NULL REFERENCES zones(id),
+    count INTEGER NOT NULL,
+    timestamp INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sales_zone_timestamp ON sales (zone, timestamp, count);
+"""
+
+class SalesDatabase:
+    """Sale events and occupancy history in a SQLite database"""
+
+    def __init__(self, path, zones=DEFAULT_ZONES, batch_size=BATCH_SIZE):
+        self.zones = zones
+        self.batch_size = batch_size
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        with self.connection:
+            self.connection.executescript(SCHEMA)
+            stored = self.connection.execute("SELECT id, name, price, capacity FROM zones ORDER BY id").fetchall()
+            expected = [(zone_id, str(name), price, capacity) for zone_id, (name, price, capacity)
+                        in enumerate(zip(zones.names, zones.prices, zones.capacities))]
+            if not stored:
+                self.connection.executemany("INSERT INTO zones VALUES (?, ?, ?, ?)", expected)
+        if stored and stored != expected:
+            self.connection.close()
+            raise ValueError("Database was created for a different venue")
+        self._pending = []
+        self.inventory = SeatInventory.from_sold(*self.sold_at(None), zones=zones)
+        last = self.connection.execute("SELECT MAX(timestamp) FROM sales").fetchone()[0]
+        self.last_timestamp = FIRST_TIMESTAMP if last is None else last
+
+    def add(self, zone, count, timestamp):
+        """Record a sale (count > 0) or refund (count < 0) at timestamp
+        Raises ValueError if it would break a zone's capacity or timestamp is
+        earlier than the last event's"""
+        zone_id = self.zones.zone_id(zone)
+        if not isinstance(count, int) or not isinstance(timestamp, int):
+            raise ValueError("Values must be whole numbers")
+        if not FIRST_TIMESTAMP <= count <= LAST_TIMESTAMP or timestamp > LAST_TIMESTAMP:
+            raise ValueError("Values do not fit in a 64-bit integer")
+        if timestamp < self.last_timestamp:
+            raise ValueError("Timestamps cannot go backwards")
+        self.inventory.apply(zone_id, count)
+        self.last_timestamp = timestamp
+        self._pending.append((zone_id, count, timestamp))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def add_many(self, events):
+        """Record (zone id, count, timestamp) events, validated and written in batches
+        Events before the first invalid one are kept; it raises ValueError"""
+        apply = self.inventory.apply
+        last_timestamp = self.last_timestamp
+        zone_count = len(self.zones)
+        pending = self._pending
+        add = pending.append
+        batch_size = self.batch_size
+        for event in events:
+            zone_id, count, timestamp = event
+            if not isinstance(zone_id, int) or not isinstance(count, int) or not isinstance(timestamp, int):
+                raise ValueError("Values must be whole numbers")
+            if not 0 <= zone_id < zone_count:
+                raise ValueError(f"Unknown zone: {zone_id!r}")
+            if not FIRST_TIMESTAMP <= count <= LAST_TIMESTAMP or timestamp > LAST_TIMESTAMP:
+                raise ValueError("Values do not fit in a 64-bit integer")
+            if timestamp < last_timestamp:
+                raise ValueError("Timestamps cannot go backwards")
+            apply(zone_id, count)
+            self.last_timestamp = last_timestamp = timestamp
+            add(event)
+            if len(pending) >= batch_size:
+                self.flush()
+                pending = self._pending
+                add = pending.append
+
+    def flush(self):
+        """Write buffered events in one transaction"""
+        if self._pending:
+            with self.connection:
+                self.connection.executemany("INSERT INTO sales VALUES (?, ?, ?)", self._pending)
+            self._pending = []
+
+    def _totals(self, where, args):
+        """Return (tickets sold, tickets refunded) per zone for the matching events
+        Each zone is one range scan of the covering (zone, timestamp, count) index"""
+        self.flush()
+        query = ("SELECT COALESCE(SUM(MAX(count, 0)), 0), COALESCE(-SUM(MIN(count, 0)), 0) "
+                 f"FROM sales WHERE zone = ? {where}")
+        sold = []
+        refunded = []
+        for zone_id in range(len(self.zones)):
+            zone_sold, zone_refunded = self.connection.execute(query, (zone_id,) + args).fetchone()
+            sold.append(zone_sold)
+            refunded.append(zone_refunded)
+        return sold, refunded
+
+    def sold_at(self, timestamp):
+        """Return net tickets sold per zone up to and including timestamp (None for all)"""
+        if timestamp is None:
+            sold, refunded = self._totals("", ())
+        else:
+            sold, refunded = self._totals("AND timestamp <= ?", (timestamp,))
+        return [count - returned for count, returned in zip(sold, refunded)]
+
+    def revenue_per_zone(self, start, end):
+        """Return net revenue per zone from events with start <= timestamp < end"""
+        sold, refunded = self._totals("AND timestamp >= ? AND timestamp < ?", (start, end))
+        return tuple((count - returned) * price for count, returned, price in zip(sold, refunded, self.zones.prices))
+
+    def revenue_between(self, start, end):
+        """Return net revenue from events with start <= timestamp < end
+        Sales and refunds are priced separately with calculate_ticket_revenue_zones"""
+        sold, refunded = self._totals("AND timestamp >= ? AND timestamp < ?", (start, end))
+        return calculate_ticket_revenue_zones(sold, self.zones) - calculate_ticket_revenue_zones(refunded, self.zones)
+
+    def occupancy_at(self, timestamp):
+        """Return occupancy percentage per zone as of timestamp"""
+        return calculate_zone_occupancy_zones(self.sold_at(timestamp), self.zones)
+
+    def close(self):
+        """Write buffered events and close the database, even if the write fails"""
+        try:
+            self.flush()
+        finally:
+            self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
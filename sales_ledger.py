@@ -0,0 +1,154 @@
+"""Event-sourced sales ledger with snapshots for fast restart
+
+Every sale and refund is appended to a binary sales log (see sales_log)
+in a ledger directory. Every `snapshot_every` events the ledger flushes the
+log and atomically replaces snapshot.json with the per-zone sold counts,
+the revenue and the number of events the snapshot covers.
+
+On restart the ledger loads the snapshot and replays only the log records
+after it, aggregated straight from the memory-mapped log. The recovered
+totals are then checked against calculate_ticket_revenue and
+calculate_seats_remaining (their N-zone forms for venues other than the
+default one) before the ledger accepts new events.
+
+A record torn by a crash mid-write is dropped from the end of the log, and
+a log cut short inside its header is treated as empty.
+"""
+import json
+import os
+import struct
+
+from sales_log import HEADER, RECORD, SalesLog, SalesLogWriter
+from skeleton import (DEFAULT_ZONES, SeatInventory, calculate_seats_remaining, calculate_seats_remaining_zones,
+                      calculate_ticket_revenue, calculate_ticket_revenue_zones)
+
+LOG_NAME = "sales.log"
+SNAPSHOT_NAME = "snapshot.json"
+SNAPSHOT_EVERY = 1000000
+
+def verify_totals(sold, revenue, zones=DEFAULT_ZONES):
+    """Check recovered sold counts and revenue against the calculation functions
+    Raises ValueError if they disagree or break the capacity rules"""
+    if zones is DEFAULT_ZONES:
+        expected = calculate_ticket_revenue(*sold)
+        calculate_seats_remaining(*sold)
+    else:
+        expected = calculate_ticket_revenue_zones(sold, zones)
+        calculate_seats_remaining_zones(sold, zones)
+    if revenue != expected:
+        raise ValueError(f"Recovered revenue {revenue} does not match ticket sales ({expected})")
+
+def _drop_torn_record(path):
+    """Truncate a partly written final record (or header) left by a crash
+    Returns the log's size afterwards; a log shorter than its header is emptied"""
+    size = os.path.getsize(path)
+    if size < HEADER.size:
+        size = 0
+    else:
+        size -= (size - HEADER.size) % RECORD.size
+    if size != os.path.getsize(path):
+        os.truncate(path, size)
+    return size
+
+class SalesLedger:
+    """Append-only sales ledger in a directory, recovered from its latest snapshot"""
+
+    def __init__(self, directory, zones=DEFAULT_ZONES, snapshot_every=SNAPSHOT_EVERY):
+        os.makedirs(directory, exist_ok=True)
+        self.zones = zones
+        self.snapshot_every = snapshot_every
+        self.log_path = os.path.join(directory, LOG_NAME)
+        self.snapshot_path = os.path.join(directory, SNAPSHOT_NAME)
+        sold, self.revenue, self.events, self.snapshot_events = self._recover()
+        self.inventory = SeatInventory.from_sold(*sold, zones=zones)
+        self._log = SalesLogWriter(self.log_path)
+
+    def _load_snapshot(self):
+        try:
+            with open(self.snapshot_path) as file:
+                snapshot = json.load(file)
+        except FileNotFoundError:
+            return [0] * len(self.zones), 0, 0
+        if len(snapshot["sold"]) != len(self.zones):
+            raise ValueError("Snapshot does not match the venue's zones")
+        return snapshot["sold"], snapshot["revenue"], snapshot["events"]
+
+    def _recover(self):
+        """Return (sold per zone, revenue, events, events covered by the snapshot)"""
+        sold, revenue, snapshot_events = self._load_snapshot()
+        events = snapshot_events
+        log_size = _drop_torn_record(self.log_path) if os.path.exists(self.log_path) else 0
+        if log_size:
+            with SalesLog(self.log_path) as log:
+                events = len(log)
+                if events < snapshot_events:
+                    raise ValueError("Sales log is shorter than its snapshot")
+                tail = log.sold_per_zone(self.zones, start=snapshot_events)
+            sold = [count + more for count, more in zip(sold, tail)]
+            revenue += sum(count * price for count, price in zip(tail, self.zones.prices))
+        elif snapshot_events:
+            raise ValueError("Snapshot found without its sales log")
+        verify_totals(sold, revenue, self.zones)
+        return sold, revenue, events, snapshot_events
+
+    def sell(self, zone, count=1, timestamp=0):
+        """Record count tickets sold in zone and return the seats left there"""
+        zone_id = self._check_record(zone, count, timestamp)
+        left = self.inventory.sell(zone_id, count)
+        self._append(zone_id, count, timestamp)
+        return left
+
+    def refund(self, zone, count=1, timestamp=0):
+        """Record count tickets refunded in zone and return the seats left there"""
+        zone_id = self._check_record(zone, count, timestamp)
+        left = self.inventory.refund(zone_id, count)
+        self._append(zone_id, -count, timestamp)
+        return left
+
+    def _check_record(self, zone, count, timestamp):
+        """Return the zone id, raising ValueError before any change if a log record cannot hold the event"""
+        zone_id = self.zones.zone_id(zone)
+        if not isinstance(count, int) or not isinstance(timestamp, int):
+            raise ValueError("Values must be whole numbers")
+        try:
+            RECORD.pack(zone_id, count, timestamp)
+        except struct.error:
+            raise ValueError("Event does not fit in a sales log record")
+        return zone_id
+
+    def _append(self, zone_id, count, timestamp):
+        self._log.append(zone_id, count, timestamp)
+        self.revenue += count * self.zones.prices[zone_id]
+        self.events += 1
+        if self.events - self.snapshot_events >= self.snapshot_every:
+            self.snapshot()
+
+    def snapshot(self):
+        """Flush the log and atomically replace the snapshot with the current totals"""
+        self._log.sync()
+        data = {"events": self.events, "sold": list(self.inventory.sold), "revenue": self.revenue}
+        temp_path = self.snapshot_path + ".tmp"
+        with open(temp_path, "w") as file:
+            json.dump(data, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, self.snapshot_path)
+        self.snapshot_events = self.events
+
+    def sold(self):
+        return tuple(self.inventory.sold)
+
+    def seats_remaining(self):
+        return self.inventory.seats_remaining()
+
+    def close(self, snapshot=True):
+        """Close the log, taking a final snapshot unless snapshot is False"""
+        if snapshot:
+            self.snapshot()
+        self._log.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,138 @@
+"""Fixed-width binary sales log for the Music Festival Console
+
+A log is a 16-byte header followed by 16-byte little-endian records:
+
+    zone id   uint16
+    padding   2 bytes (zero)
+    count     int32   (negative for refunds)
+    timestamp int64
+
+SalesLog memory-maps a log and aggregates it through memoryviews (or a
+NumPy structured array when NumPy is installed) without creating a Python
+object per record. SalesLogWriter appends records, e.g. from the streaming
+console.
+"""
+import mmap
+import os
+import struct
+import sys
+
+from skeleton import (DEFAULT_ZONES, np, calculate_seats_remaining_zones, calculate_ticket_revenue_zones,
+                      calculate_zone_occupancy_zones)
+
+MAGIC = b"MFSALES1"
+HEADER = struct.Struct("<8s8x")
+RECORD = struct.Struct("<H2xiq")
+
+if np is not None:
+    RECORD_DTYPE = np.dtype({"names": ["zone", "count", "timestamp"],
+                             "formats": ["<u2", "<i4", "<i8"],
+                             "offsets": [0, 4, 8],
+                             "itemsize": RECORD.size})
+
+class SalesLogWriter:
+    """Append sale records to a binary sales log, creating it if needed"""
+
+    def __init__(self, path, buffering=1 << 20):
+        self.path = path
+        self._file = open(path, "ab", buffering=buffering)
+        if self._file.tell() == 0:
+            # The header goes to disk straight away, so a crash before the
+            # first flush leaves a valid empty log rather than a 0-byte file
+            self._file.write(HEADER.pack(MAGIC))
+            self.sync()
+        elif (self._file.tell() - HEADER.size) % RECORD.size:
+            self._file.close()
+            raise ValueError(f"{path} is not a sales log or has a truncated record")
+
+    def append(self, zone_id, count, timestamp=0):
+        """Append one sale (count > 0) or refund (count < 0)"""
+        self._file.write(RECORD.pack(zone_id, count, timestamp))
+
+    def extend(self, events):
+        """Append (zone_id, count, timestamp) events in one write"""
+        pack = RECORD.pack
+        self._file.write(b"".join(pack(zone_id, count, timestamp) for zone_id, count, timestamp in events))
+
+    def flush(self):
+        self._file.flush()
+
+    def sync(self):
+        """Flush and force appended records to disk"""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class SalesLog:
+    """Read-only, memory-mapped view of a binary sales log"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < HEADER.size or (size - HEADER.size) % RECORD.size:
+                raise ValueError(f"{path} is not a sales log or has a truncated record")
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if HEADER.unpack_from(self._mmap)[0] != MAGIC:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a sales log")
+        self._view = memoryview(self._mmap)[HEADER.size:]
+
+    def __len__(self):
+        return len(self._view) // RECORD.size
+
+    def records(self):
+        """Return the records as a zero-copy NumPy structured array"""
+        if np is None:
+            raise RuntimeError("NumPy is required for SalesLog.records()")
+        return np.frombuffer(self._view, dtype=RECORD_DTYPE)
+
+    def sold_per_zone(self, zones=DEFAULT_ZONES, start=0):
+        """Return net tickets sold per zone, in zone id order
+        Only records from index start onwards are counted"""
+        if np is not None:
+            records = self.records()[start:]
+            sold = np.bincount(records["zone"], weights=records["count"], minlength=len(zones))
+            if len(sold) > len(zones):
+                raise ValueError("Sales log refers to an unknown zone")
+            return [int(x) for x in sold]
+
+        sold = [0] * len(zones)
+        view = self._view[start * RECORD.size:]
+        try:
+            if sys.byteorder == "little":
+                # Each record is four int32 words: zone (+ zero padding), count, timestamp
+                words = view.cast("i")
+                for zone_id, count in zip(words[0::4], words[1::4]):
+                    sold[zone_id] += count
+            else:
+                for zone_id, count, _ in RECORD.iter_unpack(view):
+                    sold[zone_id] += count
+        except IndexError:
+            raise ValueError("Sales log refers to an unknown zone")
+        return sold
+
+    def totals(self, zones=DEFAULT_ZONES):
+        """Return (total_revenue, seats_remaining, occupancy) for the whole log"""
+        sold = self.sold_per_zone(zones)
+        return (calculate_ticket_revenue_zones(sold, zones),
+                calculate_seats_remaining_zones(sold, zones),
+                calculate_zone_occupancy_zones(sold, zones))
+
+    def close(self):
+        self._view.release()
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
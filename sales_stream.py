@@ -0,0 +1,135 @@
+"""Streaming sales ingestion for the Music Festival Console
+
+Reads sale events from a file or stdin in large buffered chunks and keeps
+revenue, remaining seats, occupancy and row counts up to date as they
+arrive. Memory use is bounded by the chunk size, not the input size.
+
+Each event is one line, either CSV or NDJSON:
+
+    zone,count[,timestamp]
+    {"zone": "A", "count": 2, "timestamp": 1718000000}
+
+A negative count is a refund. Lines starting with "#" and a CSV header
+line starting with "zone" are skipped.
+"""
+import argparse
+import json
+import sys
+
+from sales_log import SalesLogWriter
+from skeleton import DEFAULT_ZONES, SeatInventory, calculate_seats_per_row, calculate_zone_occupancy
+
+CHUNK_SIZE = 1 << 20
+REPORT_EVERY = 100000
+
+def iter_lines(stream, chunk_size=CHUNK_SIZE):
+    """Yield raw lines from a binary stream, reading chunk_size bytes at a time"""
+    tail = b""
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        lines = (tail + chunk).split(b"\n")
+        tail = lines.pop()
+        yield from lines
+    if tail:
+        yield tail
+
+def parse_sale_events(lines, zones=DEFAULT_ZONES):
+    """Yield (zone_id, count, timestamp) for each CSV or NDJSON sale line"""
+    csv_zones = {str(name).encode(): zone_id for zone_id, name in enumerate(zones.names)}
+    for line_number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line[:1] == b"#":
+            continue
+        try:
+            if line[:1] == b"{":
+                record = json.loads(line)
+                zone_id = zones.zone_id(record["zone"])
+                count = record["count"]
+                timestamp = record.get("timestamp", 0)
+                if not isinstance(count, int) or not isinstance(timestamp, int):
+                    raise ValueError("Number of tickets must be whole numbers")
+            else:
+                fields = line.split(b",")
+                if fields[0] == b"zone":
+                    continue
+                zone_id = csv_zones.get(fields[0])
+                if zone_id is None:
+                    zone_id = zones.zone_id(fields[0].decode())
+                count = int(fields[1])
+                timestamp = int(fields[2]) if len(fields) > 2 else 0
+        except (ValueError, KeyError, IndexError) as e:
+            raise ValueError(f"Malformed sale event on line {line_number}: {e}")
+        yield zone_id, count, timestamp
+
+class SalesTracker:
+    """Running revenue and seating totals for a stream of sale events"""
+    __slots__ = ("zones", "inventory", "total_revenue", "events")
+
+    def __init__(self, zones=DEFAULT_ZONES):
+        self.zones = zones
+        self.inventory = SeatInventory(zones)
+        self.total_revenue = 0
+        self.events = 0
+
+    def apply(self, zone_id, count):
+        """Apply one sale (count > 0) or refund (count < 0) to the totals"""
+        self.inventory.apply(zone_id, count)
+        self.total_revenue += count * self.zones.prices[zone_id]
+        self.events += 1
+
+    def report(self):
+        """Render the "Sales Summary"/"Seating Status" report for the current totals"""
+        lines = ["Sales Summary", f"Total Revenue: ₹{self.total_revenue}", "Seating Status"]
+        inventory = self.inventory
+        for zone_id, name in enumerate(self.zones.names):
+            left = inventory.remaining[zone_id]
+            occupancy = calculate_zone_occupancy(inventory.sold[zone_id], inventory.capacity[zone_id], validate=False)
+            complete_rows, remaining_seats = calculate_seats_per_row(left, validate=False)
+            lines += [f"Zone {name}:",
+                      f"Remaining Seats: {left}",
+                      f"Occupancy: {occupancy}%",
+                      f"Complete Rows: {complete_rows}",
+                      f"Extra Seats: {remaining_seats}"]
+        return "\n".join(lines)
+
+def run_stream(stream, out=sys.stdout, every=REPORT_EVERY, zones=DEFAULT_ZONES, chunk_size=CHUNK_SIZE, log=None):
+    """Consume every event in stream, printing a report every `every` events and once at the end
+    Each applied event is also appended to log (a SalesLogWriter) when given"""
+    tracker = SalesTracker(zones)
+    apply = tracker.apply
+    for zone_id, count, timestamp in parse_sale_events(iter_lines(stream, chunk_size), zones):
+        apply(zone_id, count)
+        if log is not None:
+            log.append(zone_id, count, timestamp)
+        if every and tracker.events % every == 0:
+            print(tracker.report(), file=out)
+    # The final report, unless the last periodic one already covered every event
+    if not every or not tracker.events or tracker.events % every:
+        print(tracker.report(), file=out)
+    return tracker
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stream sale events into the Music Festival Console")
+    parser.add_argument("--stream", metavar="PATH", nargs="?", const="-", required=True,
+                        help="CSV/NDJSON sales file, or '-' for stdin")
+    parser.add_argument("--every", type=int, default=REPORT_EVERY,
+                        help="print a report every N events (0 for only the final report)")
+    parser.add_argument("--log", metavar="PATH", help="append applied events to a binary sales log")
+    args = parser.parse_args(argv)
+
+    log = SalesLogWriter(args.log) if args.log else None
+    try:
+        if args.stream == "-":
+            run_stream(sys.stdin.buffer, every=args.every, log=log)
+        else:
+            with open(args.stream, "rb") as stream:
+                run_stream(stream, every=args.every, log=log)
+    finally:
+        if log is not None:
+            log.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
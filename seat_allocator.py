@@ -0,0 +1,131 @@
+"""Best-available contiguous seat allocation for group bookings
+
+A zone is laid out in rows of SEATS_PER_ROW seats, as calculate_seats_per_row
+counts them (a final partial row holds the extra seats). Each row keeps its
+free seats as a bitmask, and a segment tree over the rows keeps the longest
+free run below each node. Finding the best row (the lowest-numbered row with
+k adjacent free seats) walks down the tree, and a booking or release updates
+one leaf-to-root path, so both are O(log rows).
+"""
+from skeleton import SEATS_PER_ROW, calculate_seats_per_row_width
+
+def longest_run(mask):
+    """Return the length of the longest run of set bits in mask"""
+    run = 0
+    while mask:
+        mask &= mask >> 1
+        run += 1
+    return run
+
+def first_run(mask, k):
+    """Return the lowest bit position starting k consecutive set bits, or -1"""
+    starts = mask
+    for shift in range(1, k):
+        starts &= mask >> shift
+    if not starts:
+        return -1
+    return (starts & -starts).bit_length() - 1
+
+class SeatAllocator:
+    """Reserve k adjacent seats in the best available row of one zone
+    If a SeatMap is given, seats already sold in it are taken, and every
+    reservation and release is made in the map first"""
+
+    def __init__(self, capacity, seats_per_row=SEATS_PER_ROW, seat_map=None):
+        complete_rows, extra_seats = calculate_seats_per_row_width(capacity, seats_per_row)
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+        self.capacity = capacity
+        self.seats_per_row = seats_per_row
+        self.seat_map = seat_map
+        widths = [seats_per_row] * complete_rows + ([extra_seats] if extra_seats else [])
+        self.full = [(1 << width) - 1 for width in widths]
+        self.free = list(self.full)
+        self.rows = len(widths)
+        if seat_map is not None:
+            if seat_map.capacity != capacity or seat_map.seats_per_row != seats_per_row:
+                raise ValueError("Seat map does not match the zone")
+            self.free = [full & ~seat_map.row_mask(row) for row, full in enumerate(self.full)]
+        size = 1
+        while size < self.rows:
+            size <<= 1
+        self.size = size
+        self.tree = [0] * (2 * size)
+        for row, mask in enumerate(self.free):
+            self.tree[size + row] = longest_run(mask)
+        for node in range(size - 1, 0, -1):
+            self.tree[node] = max(self.tree[2 * node], self.tree[2 * node + 1])
+
+    def _update(self, row):
+        node = self.size + row
+        tree = self.tree
+        tree[node] = longest_run(self.free[row])
+        node >>= 1
+        while node:
+            best = max(tree[2 * node], tree[2 * node + 1])
+            if tree[node] == best:
+                break
+            tree[node] = best
+            node >>= 1
+
+    def _check_group(self, k):
+        if not isinstance(k, int):
+            raise ValueError("Group size must be a whole number")
+        if not 1 <= k <= self.seats_per_row:
+            raise ValueError(f"Group size must be between 1 and {self.seats_per_row}")
+
+    def longest_free_run(self):
+        """Return the largest group that can still be seated together"""
+        return self.tree[1]
+
+    def best_row(self, k):
+        """Return the lowest row with k adjacent free seats, or None"""
+        self._check_group(k)
+        tree = self.tree
+        if tree[1] < k:
+            return None
+        node = 1
+        while node < self.size:
+            node = 2 * node if tree[2 * node] >= k else 2 * node + 1
+        return node - self.size
+
+    def reserve(self, k):
+        """Reserve k adjacent seats in the best row and return (row, first column)
+        Returns None, reserving nothing, if no row has k adjacent free seats"""
+        while True:
+            row = self.best_row(k)
+            if row is None:
+                return None
+            column = first_run(self.free[row], k)
+            if self.seat_map is not None:
+                start = row * self.seats_per_row + column
+                try:
+                    self.seat_map.mark_range(start, start + k)
+                except ValueError:
+                    # Some of these seats were sold in the map directly: take
+                    # the row's sold seats from the map and search again
+                    self.free[row] = self.full[row] & ~self.seat_map.row_mask(row)
+                    self._update(row)
+                    continue
+            self.free[row] &= ~(((1 << k) - 1) << column)
+            self._update(row)
+            return row, column
+
+    def release(self, row, column, k):
+        """Return k seats starting at (row, column) to sale"""
+        self._check_group(k)
+        if not 0 <= row < self.rows or column < 0:
+            raise ValueError(f"No seat at row {row}, column {column}")
+        seats = ((1 << k) - 1) << column
+        if seats & ~self.full[row]:
+            raise ValueError(f"No seat at row {row}, column {column + k - 1}")
+        if seats & self.free[row]:
+            raise ValueError("Seat is not sold")
+        if self.seat_map is not None:
+            start = row * self.seats_per_row + column
+            self.seat_map.unmark_range(start, start + k)
+        self.free[row] |= seats
+        self._update(row)
+
+    def seats_remaining(self):
+        return sum(mask.bit_count() for mask in self.free)
@@ -0,0 +1,156 @@
+"""Per-seat bitmap seat maps for the Music Festival Console
+
+calculate_seats_per_row only counts complete rows and extra seats. A
+SeatMap records which seats are sold, one bit per seat, in a bytearray
+laid out in rows of SEATS_PER_ROW: seat (row, column) is bit
+row * seats_per_row + column. A 100,000 seat stadium fits in 12.5 KB.
+
+Ranges are marked and counted a whole slice of bytes at a time, and the
+remaining count is a popcount of the bitmap, so it always agrees with
+calculate_seats_remaining for the same number of seats sold.
+"""
+from skeleton import DEFAULT_ZONES, SEATS_PER_ROW, _check_seat_count, calculate_seats_per_row_width
+
+class SeatMap:
+    """Sold/free state of every seat in one zone, packed one bit per seat"""
+    __slots__ = ("capacity", "seats_per_row", "bits", "sold")
+
+    def __init__(self, capacity, seats_per_row=SEATS_PER_ROW):
+        if not isinstance(capacity, int) or not isinstance(seats_per_row, int):
+            raise ValueError("Values must be whole numbers")
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+        if seats_per_row <= 0:
+            raise ValueError("Seats per row must be positive")
+        self.capacity = capacity
+        self.seats_per_row = seats_per_row
+        self.bits = bytearray((capacity + 7) >> 3)
+        self.sold = 0
+
+    @property
+    def rows(self):
+        """Number of rows, counting a final partial row"""
+        complete_rows, extra_seats = calculate_seats_per_row_width(self.capacity, self.seats_per_row)
+        return complete_rows + (1 if extra_seats else 0)
+
+    def seat(self, row, column):
+        """Return the seat number of (row, column)"""
+        seat = row * self.seats_per_row + column
+        if not 0 <= column < self.seats_per_row or not 0 <= seat < self.capacity:
+            raise ValueError(f"No seat at row {row}, column {column}")
+        return seat
+
+    def row_range(self, row):
+        """Return the (start, stop) seat numbers of row"""
+        start = row * self.seats_per_row
+        if not 0 <= start < self.capacity:
+            raise ValueError(f"No row {row}")
+        return start, min(start + self.seats_per_row, self.capacity)
+
+    def _check_seat(self, seat):
+        _check_seat_count(seat)
+        if seat >= self.capacity:
+            raise ValueError(f"No seat {seat}")
+
+    def is_sold(self, seat):
+        self._check_seat(seat)
+        return bool(self.bits[seat >> 3] >> (seat & 7) & 1)
+
+    def _span(self, start, stop):
+        """Return (first byte, end byte, bits as an int, mask of start..stop) for a seat range"""
+        _check_seat_count(start)
+        _check_seat_count(stop)
+        if not start <= stop <= self.capacity:
+            raise ValueError(f"No seats {start}..{stop}")
+        first, end = start >> 3, (stop + 7) >> 3
+        value = int.from_bytes(self.bits[first:end], "little")
+        mask = ((1 << (stop - start)) - 1) << (start - (first << 3))
+        return first, end, value, mask
+
+    def count_sold(self, start=0, stop=None):
+        """Popcount of sold seats in start..stop (the whole zone by default)"""
+        _, _, value, mask = self._span(start, self.capacity if stop is None else stop)
+        return (value & mask).bit_count()
+
+    def mark_range(self, start, stop):
+        """Mark seats start..stop (stop exclusive) as sold
+        Raises ValueError, changing nothing, if any of them is already sold"""
+        first, end, value, mask = self._span(start, stop)
+        if value & mask:
+            raise ValueError("Seat already sold")
+        self.bits[first:end] = (value | mask).to_bytes(end - first, "little")
+        self.sold += stop - start
+
+    def unmark_range(self, start, stop):
+        """Return seats start..stop to sale
+        Raises ValueError, changing nothing, if any of them is not sold"""
+        first, end, value, mask = self._span(start, stop)
+        if value & mask != mask:
+            raise ValueError("Seat is not sold")
+        self.bits[first:end] = (value & ~mask).to_bytes(end - first, "little")
+        self.sold -= stop - start
+
+    def mark(self, seats):
+        """Mark every seat number in seats as sold, all or nothing"""
+        seats = self._unique(seats)
+        bits = self.bits
+        if any(bits[seat >> 3] >> (seat & 7) & 1 for seat in seats):
+            raise ValueError("Seat already sold")
+        for seat in seats:
+            bits[seat >> 3] |= 1 << (seat & 7)
+        self.sold += len(seats)
+
+    def unmark(self, seats):
+        """Return every seat number in seats to sale, all or nothing"""
+        seats = self._unique(seats)
+        bits = self.bits
+        if not all(bits[seat >> 3] >> (seat & 7) & 1 for seat in seats):
+            raise ValueError("Seat is not sold")
+        for seat in seats:
+            bits[seat >> 3] &= ~(1 << (seat & 7))
+        self.sold -= len(seats)
+
+    def _unique(self, seats):
+        seats = list(seats)
+        for seat in seats:
+            self._check_seat(seat)
+        if len(set(seats)) != len(seats):
+            raise ValueError("Seat listed more than once")
+        return seats
+
+    def seats_remaining(self):
+        """Return the number of free seats, counted from the bitmap"""
+        return self.capacity - self.count_sold()
+
+    def row_free(self, row):
+        """Return the number of free seats in row"""
+        start, stop = self.row_range(row)
+        return stop - start - self.count_sold(start, stop)
+
+    def row_mask(self, row):
+        """Return the sold seats of row as a bitmask, bit i for column i"""
+        start, stop = self.row_range(row)
+        first, _, value, mask = self._span(start, stop)
+        return (value & mask) >> (start - (first << 3))
+
+    def row_layout(self):
+        """Return (complete_rows, extra_seats) of the free seats, as calculate_seats_per_row_width would"""
+        return calculate_seats_per_row_width(self.seats_remaining(), self.seats_per_row)
+
+class VenueSeatMap:
+    """One SeatMap per zone of a ZoneTable"""
+
+    def __init__(self, zones=DEFAULT_ZONES, seats_per_row=SEATS_PER_ROW):
+        self.zones = zones
+        self.maps = [SeatMap(capacity, seats_per_row) for capacity in zones.capacities]
+
+    def zone(self, zone):
+        """Return the SeatMap of a zone given its name or id"""
+        return self.maps[self.zones.zone_id(zone)]
+
+    def sold(self):
+        return tuple(seat_map.sold for seat_map in self.maps)
+
+    def seats_remaining(self):
+        """Return free seats per zone, equal to calculate_seats_remaining(*self.sold())"""
+        return tuple(seat_map.seats_remaining() for seat_map in self.maps)
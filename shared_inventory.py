@@ -0,0 +1,158 @@
+"""Seat inventory shared between gate worker processes
+
+SharedSeatInventory keeps each zone's capacity and sold count in one
+multiprocessing.shared_memory block, so every process sees the same
+counters and the capacity rule from calculate_seats_remaining holds across
+all of them.
+
+Each zone has a sequence number next to its counters (a seqlock). Writers
+take the zone's multiprocessing lock, make the sequence odd, update the
+counters and make it even again. Readers take no lock: they read the
+sequence, the counters they need and the sequence again, and retry if a
+write was in progress. The 8-byte aligned counter stores are single
+machine writes, so a reader never sees a torn value.
+
+Pass the inventory to worker processes as a Process argument, or to Pool
+workers through the pool's initializer; it re-attaches to the same block
+(and shares the same locks) on the other side. Its locks cannot travel as
+arguments to Pool.map or apply, so neither can the inventory.
+
+A writer that dies inside an update leaves its zone locked with an odd
+sequence number. Further sales in that zone block on the lock, and readers
+raise TimeoutError after READ_TIMEOUT seconds instead of spinning forever.
+"""
+import multiprocessing
+import time
+from multiprocessing import shared_memory
+
+from skeleton import DEFAULT_ZONES, _check_ticket_count
+
+# Counters per zone in the shared block: sequence, capacity, sold
+SLOTS = 3
+SEQUENCE, CAPACITY, SOLD = range(SLOTS)
+
+# Seconds a reader waits for a zone to leave a write before giving up
+READ_TIMEOUT = 1.0
+
+def _attach(name):
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Before Python 3.13 attaching always registers the block with the
+        # resource tracker. Processes started by multiprocessing share the
+        # creator's tracker, where registering again is a no-op
+        return shared_memory.SharedMemory(name=name)
+
+class SharedSeatInventory:
+    """Per-zone sold counts in shared memory, safe to update from many processes"""
+
+    def __init__(self, zones=DEFAULT_ZONES, name=None, context=None):
+        """Create a new shared inventory for zones with nothing sold
+        name is the shared memory block name (random by default)"""
+        self.zones = zones
+        context = context or multiprocessing.get_context()
+        self._locks = [context.Lock() for _ in range(len(zones))]
+        self._block = shared_memory.SharedMemory(name=name, create=True, size=8 * SLOTS * len(zones))
+        self._owner = True
+        self._counters = self._block.buf.cast("q")
+        for zone_id, capacity in enumerate(zones.capacities):
+            base = zone_id * SLOTS
+            self._counters[base + SEQUENCE] = 0
+            self._counters[base + CAPACITY] = capacity
+            self._counters[base + SOLD] = 0
+
+    @property
+    def name(self):
+        return self._block.name
+
+    def __getstate__(self):
+        return self.zones, self._block.name, self._locks
+
+    def __setstate__(self, state):
+        self.zones, name, self._locks = state
+        self._block = _attach(name)
+        self._owner = False
+        self._counters = self._block.buf.cast("q")
+
+    def _write(self, zone, count, refund):
+        _check_ticket_count(count)
+        zone_id = self.zones.zone_id(zone)
+        base = zone_id * SLOTS
+        counters = self._counters
+        with self._locks[zone_id]:
+            sold = counters[base + SOLD]
+            if refund:
+                if count > sold:
+                    raise ValueError("Refunds cannot exceed tickets sold")
+                sold -= count
+            else:
+                if count > counters[base + CAPACITY] - sold:
+                    raise ValueError("Tickets sold cannot exceed zone capacity")
+                sold += count
+            counters[base + SEQUENCE] += 1
+            counters[base + SOLD] = sold
+            counters[base + SEQUENCE] += 1
+        return counters[base + CAPACITY] - sold
+
+    def sell(self, zone, count=1):
+        """Record count tickets sold in zone and return the seats left there
+        Raises ValueError if the zone does not have count seats left"""
+        return self._write(zone, count, False)
+
+    def try_sell(self, zone, count=1):
+        """Sell count tickets in zone if that many seats are left
+        Returns True on success and False, without raising, when sold out"""
+        try:
+            self._write(zone, count, False)
+        except ValueError as e:
+            if str(e) != "Tickets sold cannot exceed zone capacity":
+                raise
+            return False
+        return True
+
+    def refund(self, zone, count=1):
+        """Return count sold tickets in zone to sale and return the seats left there"""
+        return self._write(zone, count, True)
+
+    def _read_sold(self, zone_ids):
+        """Seqlock read of the sold counts of zone_ids, consistent across those zones
+        Raises TimeoutError if they stay mid-update for READ_TIMEOUT seconds"""
+        counters = self._counters
+        bases = [zone_id * SLOTS for zone_id in zone_ids]
+        deadline = None
+        while True:
+            before = [counters[base + SEQUENCE] for base in bases]
+            if not any(sequence & 1 for sequence in before):
+                sold = [counters[base + SOLD] for base in bases]
+                if [counters[base + SEQUENCE] for base in bases] == before:
+                    return sold
+            if deadline is None:
+                deadline = time.monotonic() + READ_TIMEOUT
+            elif time.monotonic() > deadline:
+                raise TimeoutError("Seat counters stayed mid-update; a writer process may have died")
+
+    def remaining(self, zone):
+        """Return the seats left in one zone, reading only that zone's counters"""
+        zone_id = self.zones.zone_id(zone)
+        return self.zones.capacities[zone_id] - self._read_sold([zone_id])[0]
+
+    def sold(self):
+        """Return a consistent snapshot of tickets sold for every zone"""
+        return tuple(self._read_sold(range(len(self.zones))))
+
+    def seats_remaining(self):
+        """Return a consistent snapshot of remaining seats for every zone"""
+        return tuple(capacity - sold for capacity, sold in zip(self.zones.capacities, self.sold()))
+
+    def close(self):
+        """Detach from the shared block; the creating process also removes it"""
+        self._counters.release()
+        self._block.close()
+        if self._owner:
+            self._block.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
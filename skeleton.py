@@ -1,51 +1,100 @@
-def calculate_ticket_revenue(zone_a_sold, zone_b_sold, zone_c_sold):
-    """Calculate total revenue from ticket sales across all zones
-    Uses multiplication (*) for zone revenue and addition (+) for total"""
-    # TODO: Define constants for zone prices
-    # ZONE_A_PRICE = ?
-    # ZONE_B_PRICE = ?
-    # ZONE_C_PRICE = ?
-    
-    if not all(isinstance(x, int) for x in [zone_a_sold, zone_b_sold, zone_c_sold]):
+import sys
+from array import array
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Buffer format codes accepted as integer ticket counts
+_INT_FORMATS = "bBhHiIlLqQnN"
+
+# Largest revenue a batch result array can hold
+_MAX_BATCH_REVENUE = 2 ** 63 - 1
+
+ZONE_A_PRICE = 5000
+ZONE_B_PRICE = 3000
+ZONE_C_PRICE = 1500
+
+ZONE_A_CAPACITY = 200
+ZONE_B_CAPACITY = 300
+ZONE_C_CAPACITY = 500
+
+SEATS_PER_ROW = 20
+
+class ZoneTable:
+    """Prices and capacities for every zone of a venue
+    Stored as parallel arrays indexed by zone id, with an O(1) lookup
+    from zone name to zone id"""
+    __slots__ = ("names", "prices", "capacities", "index")
+
+    def __init__(self, zones):
+        """Build the table from (name, price, capacity) records"""
+        self.names = []
+        self.prices = array("q")
+        self.capacities = array("q")
+        self.index = {}
+        for name, price, capacity in zones:
+            if not isinstance(price, int) or not isinstance(capacity, int):
+                raise ValueError("Values must be whole numbers")
+            if price < 0:
+                raise ValueError("Price cannot be negative")
+            if capacity <= 0:
+                raise ValueError("Capacity must be positive")
+            if name in self.index:
+                raise ValueError(f"Duplicate zone: {name!r}")
+            zone_id = len(self.names)
+            self.index[name] = zone_id
+            self.names.append(name)
+            self.prices.append(price)
+            self.capacities.append(capacity)
+        if not self.names:
+            raise ValueError("A venue needs at least one zone")
+
+    def __len__(self):
+        return len(self.names)
+
+    def zone_id(self, zone):
+        """Return the id of a zone given its name or id
+        A zone name takes precedence over a zone id with the same value"""
+        try:
+            return self.index[zone]
+        except KeyError:
+            pass
+        except TypeError:
+            raise ValueError(f"Unknown zone: {zone!r}")
+        if isinstance(zone, int) and 0 <= zone < len(self.names):
+            return zone
+        raise ValueError(f"Unknown zone: {zone!r}")
+
+DEFAULT_ZONES = ZoneTable([
+    ("A", ZONE_A_PRICE, ZONE_A_CAPACITY),
+    ("B", ZONE_B_PRICE, ZONE_B_CAPACITY),
+    ("C", ZONE_C_PRICE, ZONE_C_CAPACITY),
+])
+
+# Shared validation. Each check raises the same ValueError messages the
+# public functions have always raised; pass validate=False (or use a
+# SalesSnapshot) to skip them for counts that were already checked.
+
+def _check_ticket_count(count):
+    if not isinstance(count, int):
         raise ValueError("Number of tickets must be whole numbers")
-    if any(x < 0 for x in [zone_a_sold, zone_b_sold, zone_c_sold]):
+    if count < 0:
         raise ValueError("Number of tickets cannot be negative")
-    
-    # TODO: Calculate revenue for each zone using multiplication (*)
-    # zone_a_revenue = ?
-    # zone_b_revenue = ?
-    # zone_c_revenue = ?
-    
-    # TODO: Calculate and return total revenue using addition (+)
-    # total_revenue = ?
-    pass
-
-def calculate_seats_remaining(zone_a_sold, zone_b_sold, zone_c_sold):
-    """Calculate remaining seats in each zone
-    Uses subtraction (-)"""
-    # TODO: Define constants for zone capacities
-    # ZONE_A_CAPACITY = ?
-    # ZONE_B_CAPACITY = ?
-    # ZONE_C_CAPACITY = ?
-    
-    if not all(isinstance(x, int) for x in [zone_a_sold, zone_b_sold, zone_c_sold]):
+
+def _check_ticket_counts(zone_a_sold, zone_b_sold, zone_c_sold):
+    if not (isinstance(zone_a_sold, int) and isinstance(zone_b_sold, int) and isinstance(zone_c_sold, int)):
         raise ValueError("Number of tickets must be whole numbers")
-    if any(x < 0 for x in [zone_a_sold, zone_b_sold, zone_c_sold]):
+    if zone_a_sold < 0 or zone_b_sold < 0 or zone_c_sold < 0:
         raise ValueError("Number of tickets cannot be negative")
+
+def _check_zone_capacities(zone_a_sold, zone_b_sold, zone_c_sold):
     if zone_a_sold > ZONE_A_CAPACITY or zone_b_sold > ZONE_B_CAPACITY or zone_c_sold > ZONE_C_CAPACITY:
         raise ValueError("Tickets sold cannot exceed zone capacity")
-    
-    # TODO: Calculate remaining seats using subtraction (-)
-    # zone_a_left = ?
-    # zone_b_left = ?
-    # zone_c_left = ?
-    
-    # TODO: Return the remaining seats for all zones
-    pass
-
-def calculate_zone_occupancy(zone_sold, zone_capacity):
-    """Calculate occupancy percentage for a zone
-    Uses multiplication (*) and division (/)"""
+
+def _check_occupancy(zone_sold, zone_capacity):
     if not isinstance(zone_sold, int) or not isinstance(zone_capacity, int):
         raise ValueError("Values must be whole numbers")
     if zone_sold < 0:
@@ -54,52 +103,361 @@ def calculate_zone_occupancy(zone_sold, zone_capacity):
         raise ValueError("Capacity must be positive")
     if zone_sold > zone_capacity:
         raise ValueError("Sold tickets cannot exceed capacity")
-    
-    # TODO: Calculate and return occupancy percentage using multiplication (*) and division (/)
-    # return ?
-    pass
 
-def calculate_seats_per_row(total_seats):
-    """Calculate complete rows and remaining seats
-    Uses floor division (//) and modulus (%)"""
-    # TODO: Define constant for seats per row
-    # SEATS_PER_ROW = 20
-    
+def _check_seat_count(total_seats):
     if not isinstance(total_seats, int):
         raise ValueError("Seats must be a whole number")
     if total_seats < 0:
         raise ValueError("Seats cannot be negative")
-    
-    # TODO: Calculate complete rows using floor division (//)
-    # complete_rows = ?
-    
-    # TODO: Calculate remaining seats using modulus (%)
-    # remaining_seats = ?
-    
-    # TODO: Return both values
-    pass
+
+def calculate_ticket_revenue(zone_a_sold, zone_b_sold, zone_c_sold, validate=True, use_table=False):
+    """Calculate total revenue from ticket sales across all zones
+    Uses multiplication (*) for zone revenue and addition (+) for total
+    use_table=True answers counts within capacity from precomputed tables"""
+    if validate:
+        _check_ticket_counts(zone_a_sold, zone_b_sold, zone_c_sold)
+    if use_table:
+        try:
+            if zone_a_sold >= 0 and zone_b_sold >= 0 and zone_c_sold >= 0:
+                return _ZONE_A_REVENUE[zone_a_sold] + _ZONE_B_REVENUE[zone_b_sold] + _ZONE_C_REVENUE[zone_c_sold]
+        except (IndexError, TypeError):
+            pass
+
+    zone_a_revenue = zone_a_sold * ZONE_A_PRICE
+    zone_b_revenue = zone_b_sold * ZONE_B_PRICE
+    zone_c_revenue = zone_c_sold * ZONE_C_PRICE
+
+    total_revenue = zone_a_revenue + zone_b_revenue + zone_c_revenue
+    return total_revenue
+
+def _as_int_column(values):
+    """Return a 1-D integer memoryview over values, copying only non-buffer inputs"""
+    try:
+        view = memoryview(values)
+    except TypeError:
+        try:
+            view = memoryview(array("q", values))
+        except TypeError:
+            raise ValueError("Number of tickets must be whole numbers")
+    if view.ndim != 1 or view.format.lstrip("@=<>!") not in _INT_FORMATS:
+        raise ValueError("Number of tickets must be whole numbers")
+    return view
+
+def _check_batch_range(largest, prices=(ZONE_A_PRICE, ZONE_B_PRICE, ZONE_C_PRICE)):
+    # Counts are non-negative, so the largest count per zone bounds every revenue
+    if sum(count * price for count, price in zip(largest, prices)) > _MAX_BATCH_REVENUE:
+        raise ValueError("Number of tickets is too large")
+
+def calculate_ticket_revenue_batch(zone_a_sold, zone_b_sold, zone_c_sold):
+    """Calculate total revenue for many sales records in one pass
+    Accepts NumPy arrays or buffer-protocol integer arrays of equal length
+    and returns an array of revenues, validating each column as a whole
+    Raises ValueError if a revenue would not fit in a 64-bit integer"""
+    if np is not None:
+        columns = [np.asarray(x) for x in (zone_a_sold, zone_b_sold, zone_c_sold)]
+        if any(c.ndim != 1 or c.dtype.kind not in "iu" for c in columns):
+            raise ValueError("Number of tickets must be whole numbers")
+        if len({c.shape[0] for c in columns}) != 1:
+            raise ValueError("Sales columns must have the same length")
+        if columns[0].shape[0] and any(c.dtype.kind == "i" and c.min() < 0 for c in columns):
+            raise ValueError("Number of tickets cannot be negative")
+        if columns[0].shape[0]:
+            _check_batch_range([int(c.max()) for c in columns])
+        zone_a, zone_b, zone_c = (c.astype(np.int64, copy=False) for c in columns)
+        return zone_a * ZONE_A_PRICE + zone_b * ZONE_B_PRICE + zone_c * ZONE_C_PRICE
+
+    zone_a, zone_b, zone_c = (_as_int_column(x) for x in (zone_a_sold, zone_b_sold, zone_c_sold))
+    if not len(zone_a) == len(zone_b) == len(zone_c):
+        raise ValueError("Sales columns must have the same length")
+    if len(zone_a) and min(min(zone_a), min(zone_b), min(zone_c)) < 0:
+        raise ValueError("Number of tickets cannot be negative")
+    if len(zone_a):
+        _check_batch_range([max(zone_a), max(zone_b), max(zone_c)])
+    return array("q", [a * ZONE_A_PRICE + b * ZONE_B_PRICE + c * ZONE_C_PRICE
+                       for a, b, c in zip(zone_a, zone_b, zone_c)])
+
+@lru_cache(maxsize=64)
+def revenue_table(price, capacity):
+    """Return precomputed revenue for 0..capacity tickets sold at price
+    Tables are built once per (price, capacity) and kept in a bounded LRU cache"""
+    if not isinstance(price, int) or not isinstance(capacity, int):
+        raise ValueError("Values must be whole numbers")
+    if price < 0:
+        raise ValueError("Price cannot be negative")
+    if capacity < 0:
+        raise ValueError("Capacity cannot be negative")
+    return tuple(sold * price for sold in range(capacity + 1))
+
+# With use_table=True, non-negative counts within capacity are answered from
+# these tables with three indexed loads and two additions; other counts fall
+# back to the arithmetic
+_ZONE_A_REVENUE = revenue_table(ZONE_A_PRICE, ZONE_A_CAPACITY)
+_ZONE_B_REVENUE = revenue_table(ZONE_B_PRICE, ZONE_B_CAPACITY)
+_ZONE_C_REVENUE = revenue_table(ZONE_C_PRICE, ZONE_C_CAPACITY)
+
+def calculate_ticket_revenue_grid(zone_a_sold, zone_b_sold, zone_c_sold, prices=None):
+    """Calculate total revenue for every combination of zone A, B and C sales
+    Each argument is a sequence (e.g. a range) of ticket counts; prices is an
+    optional (zone A, zone B, zone C) price triple for what-if scenarios.
+    Returns grid[i][j][k] = revenue for zone_a_sold[i], zone_b_sold[j] and
+    zone_c_sold[k]: a NumPy array when NumPy is installed, else nested lists
+    of integer arrays"""
+    if prices is None:
+        prices = (ZONE_A_PRICE, ZONE_B_PRICE, ZONE_C_PRICE)
+    if len(prices) != 3 or not all(isinstance(price, int) for price in prices):
+        raise ValueError("Expected one whole-number price per zone")
+    if min(prices) < 0:
+        raise ValueError("Price cannot be negative")
+    price_a, price_b, price_c = prices
+
+    if np is not None:
+        columns = [np.asarray(x) for x in (zone_a_sold, zone_b_sold, zone_c_sold)]
+        if any(c.ndim != 1 or c.dtype.kind not in "iu" for c in columns):
+            raise ValueError("Number of tickets must be whole numbers")
+        if any(c.dtype.kind == "i" and c.shape[0] and c.min() < 0 for c in columns):
+            raise ValueError("Number of tickets cannot be negative")
+        if all(c.shape[0] for c in columns):
+            _check_batch_range([int(c.max()) for c in columns], prices)
+        zone_a, zone_b, zone_c = (c.astype(np.int64, copy=False) for c in columns)
+        return (zone_a[:, None, None] * price_a + zone_b[None, :, None] * price_b
+                + zone_c[None, None, :] * price_c)
+
+    zone_a, zone_b, zone_c = (_as_int_column(x) for x in (zone_a_sold, zone_b_sold, zone_c_sold))
+    if any(len(c) and min(c) < 0 for c in (zone_a, zone_b, zone_c)):
+        raise ValueError("Number of tickets cannot be negative")
+    if all(len(c) for c in (zone_a, zone_b, zone_c)):
+        _check_batch_range([max(zone_a), max(zone_b), max(zone_c)], prices)
+    zone_c_revenue = [c * price_c for c in zone_c]
+    return [[array("q", [a * price_a + b * price_b + c for c in zone_c_revenue]) for b in zone_b]
+            for a in zone_a]
+
+def calculate_seats_remaining(zone_a_sold, zone_b_sold, zone_c_sold, validate=True):
+    """Calculate remaining seats in each zone
+    Uses subtraction (-)"""
+    if validate:
+        _check_ticket_counts(zone_a_sold, zone_b_sold, zone_c_sold)
+        _check_zone_capacities(zone_a_sold, zone_b_sold, zone_c_sold)
+
+    zone_a_left = ZONE_A_CAPACITY - zone_a_sold
+    zone_b_left = ZONE_B_CAPACITY - zone_b_sold
+    zone_c_left = ZONE_C_CAPACITY - zone_c_sold
+
+    return zone_a_left, zone_b_left, zone_c_left
+
+class SeatInventory:
+    """Track sold and remaining seats per zone as sales happen
+    Keeps remaining seats up to date with subtraction (-) on every sale
+    and refund instead of recomputing all zones from scratch"""
+    __slots__ = ("zones", "capacity", "sold", "remaining")
+
+    def __init__(self, zones=DEFAULT_ZONES):
+        self.zones = zones
+        self.capacity = array("l", zones.capacities)
+        self.sold = array("l", bytes(self.capacity.itemsize * len(zones)))
+        self.remaining = array("l", zones.capacities)
+
+    @classmethod
+    def from_sold(cls, *sold, zones=DEFAULT_ZONES):
+        """Build an inventory with existing sales, one count per zone"""
+        if len(sold) != len(zones):
+            raise ValueError("Expected one ticket count per zone")
+        inventory = cls(zones)
+        for name, count in zip(zones.names, sold):
+            inventory.sell(name, count)
+        return inventory
+
+    def _zone(self, zone, count):
+        _check_ticket_count(count)
+        return self.zones.zone_id(zone)
+
+    def apply(self, zone_id, delta):
+        """Apply a sale (delta > 0) or refund (delta < 0) to a zone id and return the seats left there
+        Trusts zone_id and delta to be valid; raises ValueError if the capacity rule breaks"""
+        left = self.remaining[zone_id] - delta
+        if left < 0:
+            raise ValueError("Tickets sold cannot exceed zone capacity")
+        if left > self.capacity[zone_id]:
+            raise ValueError("Refunds cannot exceed tickets sold")
+        self.remaining[zone_id] = left
+        self.sold[zone_id] += delta
+        return left
+
+    def try_sell(self, zone_id, count):
+        """Sell count tickets in a zone id if that many seats are left
+        Returns True on success and False, without raising, when sold out"""
+        if count > self.remaining[zone_id]:
+            return False
+        self.remaining[zone_id] -= count
+        self.sold[zone_id] += count
+        return True
+
+    def sell(self, zone, count=1):
+        """Record count tickets sold in zone and return the seats left there"""
+        return self.apply(self._zone(zone, count), count)
+
+    def refund(self, zone, count=1):
+        """Return count sold tickets in zone to sale and return the seats left there"""
+        return self.apply(self._zone(zone, count), -count)
+
+    def seats_remaining(self):
+        """Return remaining seats for every zone, in zone id order"""
+        return tuple(self.remaining)
+
+def calculate_zone_occupancy(zone_sold, zone_capacity, validate=True):
+    """Calculate occupancy percentage for a zone
+    Uses multiplication (*) and division (/)"""
+    if validate:
+        _check_occupancy(zone_sold, zone_capacity)
+
+    return (zone_sold * 100) / zone_capacity
+
+@lru_cache(maxsize=64)
+def row_layout_table(seats_per_row, max_seats=max(DEFAULT_ZONES.capacities)):
+    """Return precomputed (complete_rows, remaining_seats) for 0..max_seats seats
+    Tables are built once per row width and kept in a bounded LRU cache"""
+    if not isinstance(seats_per_row, int) or not isinstance(max_seats, int):
+        raise ValueError("Seats must be a whole number")
+    if seats_per_row <= 0:
+        raise ValueError("Seats per row must be positive")
+    return tuple((total_seats // seats_per_row, total_seats % seats_per_row)
+                 for total_seats in range(max_seats + 1))
+
+_ROW_TABLE = row_layout_table(SEATS_PER_ROW)
+_ROW_TABLE_SIZE = len(_ROW_TABLE)
+
+def calculate_seats_per_row(total_seats, validate=True):
+    """Calculate complete rows and remaining seats
+    Uses floor division (//) and modulus (%)"""
+    if validate:
+        _check_seat_count(total_seats)
+    if 0 <= total_seats < _ROW_TABLE_SIZE:
+        return _ROW_TABLE[total_seats]
+
+    complete_rows = total_seats // SEATS_PER_ROW
+
+    remaining_seats = total_seats % SEATS_PER_ROW
+
+    return complete_rows, remaining_seats
+
+def calculate_seats_per_row_width(total_seats, seats_per_row, validate=True):
+    """Calculate complete rows and remaining seats for a zone's own row width
+    Uses floor division (//) and modulus (%)"""
+    if validate:
+        _check_seat_count(total_seats)
+    table = row_layout_table(seats_per_row)
+    if 0 <= total_seats < len(table):
+        return table[total_seats]
+    return total_seats // seats_per_row, total_seats % seats_per_row
+
+class SalesSnapshot:
+    """Ticket counts for zones A, B and C, validated once on construction
+    The calculations on a snapshot skip re-validation, so repeated queries
+    on the same counts only pay for the arithmetic"""
+    __slots__ = ("zone_a_sold", "zone_b_sold", "zone_c_sold")
+
+    def __init__(self, zone_a_sold, zone_b_sold, zone_c_sold):
+        _check_ticket_counts(zone_a_sold, zone_b_sold, zone_c_sold)
+        _check_zone_capacities(zone_a_sold, zone_b_sold, zone_c_sold)
+        self.zone_a_sold = zone_a_sold
+        self.zone_b_sold = zone_b_sold
+        self.zone_c_sold = zone_c_sold
+
+    def __repr__(self):
+        return f"SalesSnapshot({self.zone_a_sold}, {self.zone_b_sold}, {self.zone_c_sold})"
+
+    def total_revenue(self):
+        return calculate_ticket_revenue(self.zone_a_sold, self.zone_b_sold, self.zone_c_sold, validate=False)
+
+    def seats_remaining(self):
+        return calculate_seats_remaining(self.zone_a_sold, self.zone_b_sold, self.zone_c_sold, validate=False)
+
+    def occupancy(self):
+        """Return occupancy percentages for zones A, B and C"""
+        return (calculate_zone_occupancy(self.zone_a_sold, ZONE_A_CAPACITY, validate=False),
+                calculate_zone_occupancy(self.zone_b_sold, ZONE_B_CAPACITY, validate=False),
+                calculate_zone_occupancy(self.zone_c_sold, ZONE_C_CAPACITY, validate=False))
+
+    def row_layout(self):
+        """Return (complete_rows, extra_seats) of the remaining seats in zones A, B and C"""
+        return tuple(calculate_seats_per_row(left, validate=False) for left in self.seats_remaining())
+
+def _check_zone_sales(sold, zones, check_capacity):
+    """Validate one ticket count per zone in a single pass"""
+    if len(sold) != len(zones):
+        raise ValueError("Expected one ticket count per zone")
+    for count, capacity in zip(sold, zones.capacities):
+        _check_ticket_count(count)
+        if check_capacity and count > capacity:
+            raise ValueError("Tickets sold cannot exceed zone capacity")
+
+def calculate_ticket_revenue_zones(sold, zones=DEFAULT_ZONES):
+    """Calculate total revenue for any number of zones
+    Uses multiplication (*) per zone and addition (+) for the total"""
+    _check_zone_sales(sold, zones, False)
+    total_revenue = 0
+    for count, price in zip(sold, zones.prices):
+        total_revenue += count * price
+    return total_revenue
+
+def calculate_seats_remaining_zones(sold, zones=DEFAULT_ZONES):
+    """Calculate remaining seats for any number of zones
+    Uses subtraction (-)"""
+    _check_zone_sales(sold, zones, True)
+    return tuple(capacity - count for count, capacity in zip(sold, zones.capacities))
+
+def calculate_zone_occupancy_zones(sold, zones=DEFAULT_ZONES):
+    """Calculate occupancy percentage for any number of zones
+    Uses multiplication (*) and division (/)"""
+    _check_zone_sales(sold, zones, True)
+    return tuple((count * 100) / capacity for count, capacity in zip(sold, zones.capacities))
+
+def calculate_seats_per_row_zones(seats, seats_per_row=SEATS_PER_ROW):
+    """Calculate complete rows and extra seats for a seat count per zone
+    seats_per_row is one row width for every zone or a sequence with one width per zone"""
+    if isinstance(seats_per_row, int):
+        return tuple(calculate_seats_per_row_width(total_seats, seats_per_row) for total_seats in seats)
+    if len(seats_per_row) != len(seats):
+        raise ValueError("Expected one row width per zone")
+    return tuple(calculate_seats_per_row_width(total_seats, width) for total_seats, width in zip(seats, seats_per_row))
 
 if __name__ == "__main__":
+    # Streaming mode: python skeleton.py --stream [sales.csv]
+    if "--stream" in sys.argv[1:]:
+        import sales_stream
+        sys.exit(sales_stream.main(sys.argv[1:]))
+
     # Display header
     print("Concert Management System")
 
     # Get input for tickets sold in each zone
-    # TODO: Get zone_a_sold using input()
-    # TODO: Get zone_b_sold using input()
-    # TODO: Get zone_c_sold using input()
-
-    # TODO: Calculate total revenue using calculate_ticket_revenue()
-    # TODO: Calculate remaining seats using calculate_seats_remaining()
-    # TODO: Calculate occupancy for each zone using calculate_zone_occupancy()
-    # TODO: Calculate row distribution for each zone using calculate_seats_per_row()
-
-    # TODO: Display results according to the specified format:
-    # Show "Sales Summary"
-    # Show "Total Revenue: ₹{value}"
-    # Show "Seating Status"
-    # For each zone (A, B, C):
-    #   Show "Zone [X]:"
-    #   Show "Remaining Seats: {value}"
-    #   Show "Occupancy: {value}%"
-    #   Show "Complete Rows: {value}"
-    #   Show "Extra Seats: {value}"
\ No newline at end of file
+    zone_a_sold = int(input("Enter Zone A tickets sold: "))
+    zone_b_sold = int(input("Enter Zone B tickets sold: "))
+    zone_c_sold = int(input("Enter Zone C tickets sold: "))
+
+    total_revenue = calculate_ticket_revenue(zone_a_sold, zone_b_sold, zone_c_sold)
+    a_left, b_left, c_left = calculate_seats_remaining(zone_a_sold, zone_b_sold, zone_c_sold)
+    a_occupancy = calculate_zone_occupancy(zone_a_sold, ZONE_A_CAPACITY)
+    b_occupancy = calculate_zone_occupancy(zone_b_sold, ZONE_B_CAPACITY)
+    c_occupancy = calculate_zone_occupancy(zone_c_sold, ZONE_C_CAPACITY)
+    a_rows, a_extra = calculate_seats_per_row(a_left)
+    b_rows, b_extra = calculate_seats_per_row(b_left)
+    c_rows, c_extra = calculate_seats_per_row(c_left)
+
+    print("Sales Summary")
+    print(f"Total Revenue: ₹{total_revenue}")
+    print("Seating Status")
+    print("Zone A:")
+    print(f"Remaining Seats: {a_left}")
+    print(f"Occupancy: {a_occupancy}%")
+    print(f"Complete Rows: {a_rows}")
+    print(f"Extra Seats: {a_extra}")
+    print("Zone B:")
+    print(f"Remaining Seats: {b_left}")
+    print(f"Occupancy: {b_occupancy}%")
+    print(f"Complete Rows: {b_rows}")
+    print(f"Extra Seats: {b_extra}")
+    print("Zone C:")
+    print(f"Remaining Seats: {c_left}")
+    print(f"Occupancy: {c_occupancy}%")
+    print(f"Complete Rows: {c_rows}")
+    print(f"Extra Seats: {c_extra}")
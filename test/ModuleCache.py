@@ -0,0 +1,154 @@
+import ast
+import importlib
+import os
+
+OPERATORS = {ast.Add: "+", ast.Sub: "-", ast.Mult: "*", ast.Div: "/", ast.FloorDiv: "//", ast.Mod: "%",
+             ast.Pow: "**"}
+
+
+def file_mtime(path):
+    """Return the modification time of path in nanoseconds, or None if it does not exist"""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+class FunctionFacts:
+    """What one function body contains, nested functions included.
+
+    operators: arithmetic operator symbols used (+, -, *, /, //, %, **)
+    assigned:  names bound by assignments
+    names:     names read (constants such as ZONE_A_PRICE)
+    constants: literal numbers used (5000, 100, ...)
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.operators = set()
+        self.assigned = set()
+        self.names = set()
+        self.constants = set()
+
+
+class SourceInfo:
+    """Source text, AST and precomputed facts for one Python file.
+
+    The AST is walked once. File-wide facts:
+
+    functions: FunctionFacts per function, keyed by qualified name
+               ("calculate_ticket_revenue", "SeatInventory.sell")
+    operators: arithmetic operator symbols used anywhere in the file
+    assigned:  names bound by assignments anywhere in the file
+    calls:     names of functions called by plain name (print, input, ...)
+    has_main:  True if the file has an `if __name__ == "__main__"` block
+
+    Comments and string literals never count, unlike a text search.
+    """
+
+    def __init__(self, path, mtime, text):
+        self.path = path
+        self.mtime = mtime
+        self.text = text
+        self.tree = ast.parse(text, path)
+        self.functions = {}
+        self.operators = set()
+        self.assigned = set()
+        self.calls = set()
+        self.has_main = False
+        self._visit(self.tree, "", [])
+
+    def function(self, name):
+        """Return the FunctionFacts for the function called name, or None"""
+        return self.functions.get(name)
+
+    def _visit(self, tree, prefix, scopes):
+        # An explicit stack rather than recursion: long expressions such as
+        # a 1500-term sum nest deeper than Python's recursion limit
+        stack = [(tree, prefix, scopes)]
+        while stack:
+            node, prefix, scopes = stack.pop()
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                facts = FunctionFacts(prefix + node.name)
+                self.functions[facts.name] = facts
+                scopes = scopes + [facts]
+                prefix = facts.name + "."
+            elif isinstance(node, ast.ClassDef):
+                prefix = prefix + node.name + "."
+            elif isinstance(node, (ast.BinOp, ast.AugAssign)):
+                symbol = OPERATORS.get(type(node.op))
+                if symbol is not None:
+                    self.operators.add(symbol)
+                    for facts in scopes:
+                        facts.operators.add(symbol)
+            elif isinstance(node, ast.Name):
+                if isinstance(node.ctx, ast.Store):
+                    self.assigned.add(node.id)
+                    for facts in scopes:
+                        facts.assigned.add(node.id)
+                else:
+                    for facts in scopes:
+                        facts.names.add(node.id)
+            elif isinstance(node, ast.Constant):
+                if isinstance(node.value, (int, float)) and not isinstance(node.value, bool):
+                    for facts in scopes:
+                        facts.constants.add(node.value)
+            elif isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+                self.calls.add(node.func.id)
+            elif isinstance(node, ast.Compare) and _is_main_check(node):
+                self.has_main = True
+            # Reversed so nodes are visited in source order, as before
+            stack.extend((child, prefix, scopes) for child in reversed(list(ast.iter_child_nodes(node))))
+
+
+def _is_main_check(node):
+    names = [node.left] + node.comparators
+    return (any(isinstance(n, ast.Name) and n.id == "__name__" for n in names)
+            and any(isinstance(n, ast.Constant) and n.value == "__main__" for n in names))
+
+
+class ModuleCache:
+    """Import and parse each candidate module once per session.
+
+    Entries are keyed by path and modification time, so an edited file is
+    re-imported (or re-parsed) on next use and an unchanged one never is.
+    A module that fails to import is cached as None until a file with
+    that name appears or changes.
+    """
+
+    def __init__(self):
+        self.modules = {}
+        self.sources = {}
+
+    def import_module(self, module_name):
+        """Return the imported module, or None if it cannot be imported"""
+        entry = self.modules.get(module_name)
+        if entry is not None:
+            path, mtime, module = entry
+            if file_mtime(path) == mtime:
+                return module
+        try:
+            if entry is not None and entry[2] is not None:
+                module = importlib.reload(entry[2])
+            else:
+                module = importlib.import_module(module_name)
+        except ImportError:
+            module = None
+        path = getattr(module, "__file__", None) or module_name + ".py"
+        self.modules[module_name] = (path, file_mtime(path), module)
+        return module
+
+    def source(self, path):
+        """Return the SourceInfo for the file at path
+        Raises OSError if it cannot be read and SyntaxError if it cannot be parsed"""
+        mtime = file_mtime(path)
+        info = self.sources.get(path)
+        if info is None or info.mtime != mtime or mtime is None:
+            with open(path, "r") as file:
+                info = SourceInfo(path, mtime, file.read())
+            self.sources[path] = info
+        return info
+
+    def module_source(self, module):
+        """Return the SourceInfo for an imported module's file"""
+        return self.source(module.__file__)
@@ -0,0 +1,68 @@
+import io
+import sys
+
+
+class _NullSink(io.TextIOBase):
+    """Text stream that accepts and discards everything written to it"""
+
+    def writable(self):
+        return True
+
+    def write(self, text):
+        return len(text)
+
+
+class OutputCapture:
+    """Reusable sys.stdout redirect.
+
+    One instance is created per session and entered around every call, so
+    no stream is allocated per call. With keep=True output goes to a single
+    StringIO that is emptied on each entry and read back with getvalue();
+    with keep=False it is discarded. Nested use restores the right stream.
+    """
+
+    def __init__(self, keep=True):
+        self.keep = keep
+        self.stream = io.StringIO() if keep else _NullSink()
+        self._saved = []
+
+    def __enter__(self):
+        if self.keep and not self._saved:
+            self.stream.seek(0)
+            self.stream.truncate(0)
+        self._saved.append(sys.stdout)
+        sys.stdout = self.stream
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        sys.stdout = self._saved.pop()
+        return False
+
+    def getvalue(self):
+        """Return the output captured since the last entry ("" when discarding)"""
+        return self.stream.getvalue() if self.keep else ""
+
+
+# Shared sink for calls whose output is never inspected
+DISCARD = OutputCapture(keep=False)
+
+
+def safely_call_many(module, function_name, arg_list, capture=DISCARD):
+    """Call a function once per row of arguments under a single redirect.
+
+    Each row is a tuple of positional arguments (a non-tuple is a single
+    argument). Returns one entry per row: the result, or the exception the
+    call raised. Returns None if the function does not exist.
+    """
+    function = getattr(module, function_name, None)
+    if not callable(function):
+        return None
+    results = []
+    append = results.append
+    with capture:
+        for args in arg_list:
+            try:
+                append(function(*args) if isinstance(args, tuple) else function(args))
+            except Exception as e:
+                append(e)
+    return results
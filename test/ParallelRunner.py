@@ -0,0 +1,94 @@
+"""Run the grading suites with test methods sharded across a process pool.
+
+Each worker imports the student module once, runs whole test methods and
+returns their console output and TestResults payloads. The parent prints
+the output in the original test order and publishes every payload
+through TestUtils.collector in one session, so pass/fail output matches
+a serial `python -m unittest` run.
+
+Usage: python -m test.ParallelRunner [--workers N] [module ...]
+"""
+import argparse
+import contextlib
+import io
+import multiprocessing
+import sys
+import time
+import unittest
+from test.TestUtils import TestUtils
+
+SUITES = ["test.test_functional", "test.test_boundary", "test.test_exceptional"]
+STUDENT_MODULES = ["skeleton", "solution"]
+
+
+def collect_test_ids(modules):
+    """Return the ids of every test method in modules, in unittest order."""
+    ids = []
+    pending = [unittest.TestLoader().loadTestsFromNames(modules)]
+    while pending:
+        suite = pending.pop(0)
+        for test in suite:
+            if isinstance(test, unittest.TestSuite):
+                pending.append(test)
+            else:
+                ids.append(test.id())
+    return ids
+
+
+def _init_worker():
+    # Workers never upload: their results go back to the parent with each
+    # test, whatever YAKSHA_FLUSH_SIZE is, since the pool may terminate them
+    # before a background upload finishes
+    TestUtils.collector.flush_size = 0
+    # Import the student module once per worker; every setUp then hits sys.modules
+    for name in STUDENT_MODULES:
+        if TestUtils.modules.import_module(name) is not None:
+            break
+
+
+def _run_one(test_id):
+    """Run one test method and return (test_id, output, payloads, problems)."""
+    collector = TestUtils.collector
+    output = io.StringIO()
+    result = unittest.TestResult()
+    with contextlib.redirect_stdout(output):
+        unittest.TestLoader().loadTestsFromName(test_id).run(result)
+    payloads, collector.pending = collector.pending, []
+    problems = [(kind, text) for kind, entries in (("ERROR", result.errors), ("FAIL", result.failures))
+                for _, text in entries]
+    return test_id, output.getvalue(), payloads, problems
+
+
+def run(modules=SUITES, workers=None, stream=sys.stdout):
+    """Run modules in parallel and return True if every test passed."""
+    ids = collect_test_ids(modules)
+    start = time.perf_counter()
+    errors = failures = 0
+    with multiprocessing.Pool(workers, initializer=_init_worker) as pool:
+        for test_id, output, payloads, problems in pool.imap(_run_one, ids):
+            stream.write(output)
+            TestUtils.collector.add_results(payloads)
+            for kind, text in problems:
+                errors += kind == "ERROR"
+                failures += kind == "FAIL"
+                stream.write(f"{'=' * 70}\n{kind}: {test_id}\n{'-' * 70}\n{text}\n")
+    elapsed = time.perf_counter() - start
+    stream.write(f"{'-' * 70}\nRan {len(ids)} tests in {elapsed:.3f}s\n\n")
+    if errors or failures:
+        details = ", ".join(f"{name}={count}" for name, count in (("failures", failures), ("errors", errors)) if count)
+        stream.write(f"FAILED ({details})\n")
+        return False
+    stream.write("OK\n")
+    return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the grading suites across a process pool")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("modules", nargs="*", default=SUITES)
+    args = parser.parse_args(argv)
+    return 0 if run(args.modules, args.workers) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
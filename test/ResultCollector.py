@@ -0,0 +1,77 @@
+import atexit
+import json
+import os
+from test.ResultUploader import ResultUploader
+from test.TestResults import TestResults
+
+
+class ResultCollector:
+    """Buffer test case results for a whole session and publish them in bulk.
+
+    custom.ih is read once, on the first result. Results are posted when
+    flush_size of them are pending, in requests of at most flush_size. The
+    default of 1 posts every result on its own, in the original one-object
+    format. Bulk posting, as a JSON
+    array of the same objects, is opt-in: a larger flush_size, or 0 for only
+    at flush/exit. Posting happens on a background
+    ResultUploader; close() (run at exit) waits for it to finish.
+    """
+
+    def __init__(self, url, custom_path="../custom.ih", flush_size=1, retries=2, backoff=0.25):
+        self.url = url
+        self.custom_path = custom_path
+        self.flush_size = flush_size
+        self.customData = None
+        self.pending = []
+        self.posts = 0
+        self.uploader = ResultUploader(url, retries, backoff, on_failure=self.report_failure)
+        self._exit_hook = False
+
+    def read_custom_data(self):
+        if self.customData is None:
+            with open(self.custom_path, "r") as ref:
+                self.customData = ref.read()
+        return self.customData
+
+    def add(self, guid, test_case_result_dto):
+        customData = self.read_custom_data()
+        hostName = os.environ.get('HOSTNAME')
+        attemptId = os.environ.get('ATTEMPT_ID')
+        test_case_results = {guid: test_case_result_dto}
+        self.add_results([TestResults(json.dumps(test_case_results), customData, hostName, attemptId)])
+
+    def add_results(self, results):
+        """Queue already built TestResults payloads, e.g. merged from worker processes"""
+        if self.customData is None and results:
+            # Workers read custom.ih themselves; keep its text for report_failure
+            self.customData = results[0]["customData"]
+        self.pending.extend(results)
+        if not self._exit_hook:
+            atexit.register(self.close)
+            self._exit_hook = True
+        if self.flush_size and len(self.pending) >= self.flush_size:
+            self.flush()
+
+    def flush(self):
+        if not self.pending:
+            return
+        pending, self.pending = self.pending, []
+        size = self.flush_size or len(pending)
+        for start in range(0, len(pending), size):
+            batch = pending[start:start + size]
+            final_result = json.dumps(batch[0] if len(batch) == 1 else batch)
+            self.uploader.submit(final_result)
+            self.posts += 1
+
+    def drain(self):
+        self.flush()
+        self.uploader.drain()
+
+    def close(self):
+        self.flush()
+        self.uploader.close()
+
+    def report_failure(self, body, status):
+        hostName = os.environ.get('HOSTNAME')
+        length = len(self.customData or "")
+        print(f'⚠️ Unable to push test cases from {hostName}, please try again![{length}]')
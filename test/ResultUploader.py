@@ -0,0 +1,84 @@
+import queue
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class ResultUploader:
+    """Upload result payloads from a background thread.
+
+    Payloads are queued by submit() and posted over one pooled
+    requests.Session, so the test thread never waits on the network.
+    Responses other than 200/201 and connection errors are retried with
+    exponential backoff; on_failure(body, status) is called once a payload
+    has used up its retries. Backoff sleeps share a budget of retry_time
+    seconds for the uploader's lifetime, so an unreachable endpoint delays
+    exit by at most that much however many payloads are queued. drain()
+    blocks until the queue is empty.
+    """
+
+    def __init__(self, url, retries=2, backoff=0.25, timeout=10, pool_size=4, on_failure=None, retry_time=2.0):
+        self.url = url
+        self.retries = retries
+        self.backoff = backoff
+        self.retry_time_left = retry_time
+        self.timeout = timeout
+        self.on_failure = on_failure
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.queue = queue.Queue()
+        self.thread = None
+        self.lock = threading.Lock()
+        self.sent = 0
+        self.failed = 0
+
+    def submit(self, body):
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self._run, name="ResultUploader", daemon=True)
+                self.thread.start()
+        self.queue.put(body)
+
+    def _run(self):
+        while True:
+            body = self.queue.get()
+            try:
+                if body is None:
+                    return
+                self._post(body)
+            finally:
+                self.queue.task_done()
+
+    def _post(self, body):
+        status = None
+        for attempt in range(self.retries + 1):
+            if attempt:
+                delay = self.backoff * 2 ** (attempt - 1)
+                if delay > self.retry_time_left:
+                    break
+                self.retry_time_left -= delay
+                time.sleep(delay)
+            try:
+                response = self.session.post(self.url, body, headers={"Content-Type": "application/json"},
+                                             timeout=self.timeout)
+                status = response.status_code
+                if status in [200, 201]:
+                    self.sent += 1
+                    return
+            except requests.RequestException:
+                status = None
+        self.failed += 1
+        if self.on_failure is not None:
+            self.on_failure(body, status)
+
+    def drain(self):
+        self.queue.join()
+
+    def close(self):
+        if self.thread is not None and self.thread.is_alive():
+            self.queue.put(None)
+            self.thread.join()
+        self.session.close()
@@ -0,0 +1,58 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StubResultReceiver:
+    """Local stand-in for the results endpoint, for offline runs.
+
+    Records every JSON payload posted to it. delay adds latency to each
+    response and status sets the HTTP status code returned. The first
+    fail_first requests are answered with 500 to exercise retries.
+    """
+
+    def __init__(self, delay=0.0, status=200, fail_first=0):
+        self.delay = delay
+        self.status = status
+        self.fail_first = fail_first
+        self.payloads = []
+        self.requests = 0
+        self.lock = threading.Lock()
+        receiver = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                with receiver.lock:
+                    receiver.requests += 1
+                    status = 500 if receiver.requests <= receiver.fail_first else receiver.status
+                if receiver.delay:
+                    time.sleep(receiver.delay)
+                if status in (200, 201):
+                    with receiver.lock:
+                        receiver.payloads.append(json.loads(body))
+                self.send_response(status)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,50 @@
+import os
+import tempfile
+import unittest
+from benchmarks import suite
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+    """Test class for the baseline-comparing benchmark suite."""
+
+    def test_compare_flags_regressions_beyond_threshold(self):
+        """Test that only relative slowdowns beyond the threshold are regressions"""
+        baseline = {"fast": {"seconds": 1e-5, "relative": 1.0}, "slow": {"seconds": 1e-5, "relative": 1.0}}
+        results = {"fast": {"seconds": 2e-5, "relative": 1.2}, "slow": {"seconds": 1e-5, "relative": 1.3},
+                   "new": {"seconds": 5e-5, "relative": 5.0}}
+        rows = {row[0]: row for row in suite.compare(results, baseline, 0.25)}
+        self.assertFalse(rows["fast"][4])
+        self.assertAlmostEqual(rows["fast"][3], 1.2)
+        self.assertTrue(rows["slow"][4])
+        self.assertIsNone(rows["new"][2])
+        self.assertFalse(rows["new"][4])
+
+    def test_compare_widens_threshold_for_short_benchmarks(self):
+        """Test that benchmarks under 10 us get twice the threshold"""
+        baseline = {"tiny": {"seconds": 2e-7, "relative": 1.0}}
+        self.assertFalse(suite.compare({"tiny": {"seconds": 3e-7, "relative": 1.45}}, baseline, 0.25)[0][4])
+        self.assertTrue(suite.compare({"tiny": {"seconds": 3e-7, "relative": 1.55}}, baseline, 0.25)[0][4])
+
+    def test_baseline_round_trip(self):
+        """Test that a saved baseline loads back and a missing one is empty"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "baseline.json")
+            self.assertEqual(suite.load_baseline(path), {})
+            stored = {"calculate_zone_occupancy": {"seconds": 3e-7, "relative": 0.04}}
+            suite.save_baseline(stored, path)
+            self.assertEqual(suite.load_baseline(path), stored)
+
+    def test_time_call_returns_calibration(self):
+        """Test that time_call reports the call time and its cost in calibration loops"""
+        seconds, relative = suite.time_call(lambda: None, repeat=3)
+        self.assertGreater(seconds, 0)
+        self.assertTrue(0 < relative < 1)
+
+    def test_every_benchmark_runs(self):
+        """Test that every benchmark's setup returns a working callable"""
+        for name, setup in suite.BENCHMARKS.items():
+            setup()()
+
+
+if __name__ == '__main__':
+    unittest.main()
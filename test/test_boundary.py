@@ -1,10 +1,8 @@
 import unittest
 import os
-import importlib
 import sys
-import io
-import contextlib
 from test.TestUtils import TestUtils
+from test.OutputCapture import DISCARD, safely_call_many
 
 def check_file_exists(filename):
     """Check if a file exists in the current directory."""
@@ -12,10 +10,7 @@ def check_file_exists(filename):
 
 def safely_import_module(module_name):
     """Safely import a module, returning None if import fails."""
-    try:
-        return importlib.import_module(module_name)
-    except ImportError:
-        return None
+    return TestUtils.modules.import_module(module_name)
 
 def check_function_exists(module, function_name):
     """Check if a function exists in a module."""
@@ -26,7 +21,7 @@ def safely_call_function(module, function_name, *args, **kwargs):
     if not check_function_exists(module, function_name):
         return None
     try:
-        with contextlib.redirect_stdout(io.StringIO()):
+        with DISCARD:
             return getattr(module, function_name)(*args, **kwargs)
     except Exception:
         return None
@@ -268,83 +263,20 @@ class TestMusicFestivalBoundary(unittest.TestCase):
             
             # Test row calculations (SEATS_PER_ROW = 20 based on SRS)
             if check_function_exists(self.module_obj, "calculate_seats_per_row"):
-                # Empty rows test (0 seats)
-                rows_empty = safely_call_function(self.module_obj, "calculate_seats_per_row", 0)
-                if rows_empty is None:
-                    errors.append("calculate_seats_per_row returned None for 0 seats")
-                elif rows_empty != (0, 0):
-                    errors.append(f"0 seats should give (0, 0) rows, got {rows_empty}")
-                
-                # Exact one row test (20 seats)
-                rows_exact = safely_call_function(self.module_obj, "calculate_seats_per_row", 20)
-                if rows_exact is None:
-                    errors.append("calculate_seats_per_row returned None for 20 seats")
-                elif rows_exact != (1, 0):
-                    errors.append(f"20 seats should give (1, 0) rows, got {rows_exact}")
-                
-                # Partial row test (25 seats = 1 complete row + 5 extra)
-                rows_partial = safely_call_function(self.module_obj, "calculate_seats_per_row", 25)
-                if rows_partial is None:
-                    errors.append("calculate_seats_per_row returned None for 25 seats")
-                elif rows_partial != (1, 5):
-                    errors.append(f"25 seats should give (1, 5) rows, got {rows_partial}")
-                
-                # Multiple complete rows test (40 seats = 2 complete rows + 0 extra)
-                rows_multiple = safely_call_function(self.module_obj, "calculate_seats_per_row", 40)
-                if rows_multiple is None:
-                    errors.append("calculate_seats_per_row returned None for 40 seats")
-                elif rows_multiple != (2, 0):
-                    errors.append(f"40 seats should give (2, 0) rows, got {rows_multiple}")
-                
-                # Large number test (150 seats = 7 complete rows + 10 extra)
-                rows_large = safely_call_function(self.module_obj, "calculate_seats_per_row", 150)
-                if rows_large is None:
-                    errors.append("calculate_seats_per_row returned None for 150 seats")
-                elif rows_large != (7, 10):
-                    errors.append(f"150 seats should give (7, 10) rows, got {rows_large}")
-                
-                # Maximum zone capacity tests
-                # Zone A: 200 seats = 10 complete rows + 0 extra
-                rows_zone_a_max = safely_call_function(self.module_obj, "calculate_seats_per_row", 200)
-                if rows_zone_a_max is None:
-                    errors.append("calculate_seats_per_row returned None for Zone A max")
-                elif rows_zone_a_max != (10, 0):
-                    errors.append(f"200 seats should give (10, 0) rows, got {rows_zone_a_max}")
-                
-                # Zone B: 300 seats = 15 complete rows + 0 extra
-                rows_zone_b_max = safely_call_function(self.module_obj, "calculate_seats_per_row", 300)
-                if rows_zone_b_max is None:
-                    errors.append("calculate_seats_per_row returned None for Zone B max")
-                elif rows_zone_b_max != (15, 0):
-                    errors.append(f"300 seats should give (15, 0) rows, got {rows_zone_b_max}")
-                
-                # Zone C: 500 seats = 25 complete rows + 0 extra
-                rows_zone_c_max = safely_call_function(self.module_obj, "calculate_seats_per_row", 500)
-                if rows_zone_c_max is None:
-                    errors.append("calculate_seats_per_row returned None for Zone C max")
-                elif rows_zone_c_max != (25, 0):
-                    errors.append(f"500 seats should give (25, 0) rows, got {rows_zone_c_max}")
-                
-                # Boundary: Just below a complete row (19 seats = 0 complete + 19 extra)
-                rows_just_below = safely_call_function(self.module_obj, "calculate_seats_per_row", 19)
-                if rows_just_below is None:
-                    errors.append("calculate_seats_per_row returned None for 19 seats")
-                elif rows_just_below != (0, 19):
-                    errors.append(f"19 seats should give (0, 19) rows, got {rows_just_below}")
-                
-                # Boundary: Just above a complete row (21 seats = 1 complete + 1 extra)
-                rows_just_above = safely_call_function(self.module_obj, "calculate_seats_per_row", 21)
-                if rows_just_above is None:
-                    errors.append("calculate_seats_per_row returned None for 21 seats")
-                elif rows_just_above != (1, 1):
-                    errors.append(f"21 seats should give (1, 1) rows, got {rows_just_above}")
-                
-                # Single seat test
-                rows_single = safely_call_function(self.module_obj, "calculate_seats_per_row", 1)
-                if rows_single is None:
-                    errors.append("calculate_seats_per_row returned None for 1 seat")
-                elif rows_single != (0, 1):
-                    errors.append(f"1 seat should give (0, 1) rows, got {rows_single}")
+                # (seats, expected rows) - empty, exact/partial/multiple rows, each zone's
+                # maximum capacity and the boundaries either side of a complete row
+                row_cases = [
+                    (0, (0, 0)), (20, (1, 0)), (25, (1, 5)), (40, (2, 0)), (150, (7, 10)),
+                    (200, (10, 0)), (300, (15, 0)), (500, (25, 0)),
+                    (19, (0, 19)), (21, (1, 1)), (1, (0, 1)),
+                ]
+                row_results = safely_call_many(self.module_obj, "calculate_seats_per_row",
+                                               [seats for seats, _ in row_cases])
+                for (seats, expected_rows), rows in zip(row_cases, row_results):
+                    if rows is None or isinstance(rows, Exception):
+                        errors.append(f"calculate_seats_per_row returned None for {seats} seats")
+                    elif rows != expected_rows:
+                        errors.append(f"{seats} seats should give {expected_rows} rows, got {rows}")
             else:
                 errors.append("Function calculate_seats_per_row not found")
             
@@ -0,0 +1,50 @@
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from concurrent_sales import ConcurrentSeatInventory
+from skeleton import ZoneTable, calculate_seats_remaining_zones
+
+THREADS = 32
+
+def sell_until_sold_out(inventory, zone):
+    """Sell one ticket at a time into zone until it is sold out, returning the number sold"""
+    sold = 0
+    while inventory.try_sell(zone):
+        sold += 1
+    return sold
+
+class TestConcurrentSales(unittest.TestCase):
+    """Stress test for lock-striped concurrent ticket sales."""
+
+    def setUp(self):
+        """Setup a venue large enough to keep 32 threads contending."""
+        self.zones = ZoneTable([("A", 5000, 20000), ("B", 3000, 30000), ("C", 1500, 50000)])
+        self.inventory = ConcurrentSeatInventory(self.zones)
+
+    def test_no_oversell_with_32_threads(self):
+        """Test 32 threads selling into three zones never oversell"""
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=THREADS) as pool:
+            futures = [pool.submit(sell_until_sold_out, self.inventory, i % 3) for i in range(THREADS)]
+            total = sum(f.result() for f in futures)
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(total, 100000)
+        self.assertEqual(self.inventory.sold(), (20000, 30000, 50000))
+        self.assertEqual(self.inventory.seats_remaining(), (0, 0, 0))
+        self.assertEqual(self.inventory.seats_remaining(),
+                         calculate_seats_remaining_zones(self.inventory.sold(), self.zones))
+        print(f"TestConcurrentSales: {total / elapsed:,.0f} sales/sec with {THREADS} threads")
+
+    def test_sell_and_refund_raise_on_capacity(self):
+        """Test sell() and refund() keep the capacity rule"""
+        self.inventory.sell("A", 20000)
+        with self.assertRaisesRegex(ValueError, "cannot exceed zone capacity"):
+            self.inventory.sell("A", 1)
+        self.assertFalse(self.inventory.try_sell("A"))
+        self.assertEqual(self.inventory.refund("A", 5), 5)
+        with self.assertRaises(ValueError):
+            self.inventory.refund("B", 1)
+
+if __name__ == '__main__':
+    unittest.main()
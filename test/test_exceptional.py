@@ -1,10 +1,8 @@
 import unittest
 import os
-import importlib
 import sys
-import io
-import contextlib
 from test.TestUtils import TestUtils
+from test.OutputCapture import DISCARD
 
 def check_file_exists(filename):
     """Check if a file exists in the current directory."""
@@ -12,10 +10,7 @@ def check_file_exists(filename):
 
 def safely_import_module(module_name):
     """Safely import a module, returning None if import fails."""
-    try:
-        return importlib.import_module(module_name)
-    except ImportError:
-        return None
+    return TestUtils.modules.import_module(module_name)
 
 def check_function_exists(module, function_name):
     """Check if a function exists in a module."""
@@ -26,7 +21,7 @@ def safely_call_function(module, function_name, *args, **kwargs):
     if not check_function_exists(module, function_name):
         return None
     try:
-        with contextlib.redirect_stdout(io.StringIO()):
+        with DISCARD:
             return getattr(module, function_name)(*args, **kwargs)
     except Exception:
         return None
@@ -34,7 +29,7 @@ def safely_call_function(module, function_name, *args, **kwargs):
 def check_raises_exception(func, args, expected_exception=ValueError):
     """Check if a function raises the expected exception type."""
     try:
-        with contextlib.redirect_stdout(io.StringIO()):
+        with DISCARD:
             func(*args)
         return False  # No exception was raised
     except expected_exception:
@@ -322,7 +317,7 @@ class TestMusicFestivalException(unittest.TestCase):
                 
                 # Test exact capacity limits (should not raise exception)
                 try:
-                    with contextlib.redirect_stdout(io.StringIO()):
+                    with DISCARD:
                         result = func(200, 300, 500)
                     if result != (0, 0, 0):
                         errors.append("calculate_seats_remaining should handle exact capacity limits correctly")
@@ -348,7 +343,7 @@ class TestMusicFestivalException(unittest.TestCase):
                 
                 # Test exact capacity (should not raise exception)
                 try:
-                    with contextlib.redirect_stdout(io.StringIO()):
+                    with DISCARD:
                         result = func(200, 200)
                     if result != 100.0:
                         errors.append("calculate_zone_occupancy should handle exact capacity correctly")
@@ -0,0 +1,102 @@
+import asyncio
+import json
+import unittest
+from unittest import mock
+import festival_server
+from festival_server import FestivalServer, run_load_test
+
+REQUESTS = [
+    {"id": 1, "op": "sell", "zone": "A", "count": 150},
+    {"id": 2, "op": "sell", "zone": "B", "count": 200},
+    {"id": 3, "op": "revenue"},
+    {"id": 4, "op": "remaining"},
+    {"id": 5, "op": "rows"},
+    {"id": 6, "op": "sell", "zone": "A", "count": 51},
+    {"id": 7, "op": "call", "function": "calculate_zone_occupancy", "args": [75, 200]},
+    {"id": 8, "op": "call", "function": "open", "args": ["/etc/passwd"]},
+]
+
+async def pipelined_session():
+    """Send every request in one write and read all responses back"""
+    listener = await FestivalServer().start("127.0.0.1", 0)
+    port = listener.sockets[0].getsockname()[1]
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(b"".join(json.dumps(r).encode() + b"\n" for r in REQUESTS))
+    await writer.drain()
+    responses = [json.loads(await reader.readline()) for _ in REQUESTS]
+    writer.close()
+    listener.close()
+    await listener.wait_closed()
+    return responses
+
+class TestFestivalServer(unittest.TestCase):
+    """Test class for the asyncio box-office server."""
+
+    def test_pipelined_requests(self):
+        """Test pipelined requests are answered in order with correct results"""
+        responses = asyncio.run(pipelined_session())
+        self.assertEqual([r["id"] for r in responses], list(range(1, 9)))
+        self.assertEqual(responses[2]["result"], 150 * 5000 + 200 * 3000)
+        self.assertEqual(responses[3]["result"], [50, 100, 500])
+        self.assertEqual(responses[4]["result"], [[2, 10], [5, 0], [25, 0]])
+        self.assertEqual(responses[5], {"id": 6, "ok": False, "error": "Tickets sold cannot exceed zone capacity"})
+        self.assertEqual(responses[6]["result"], 37.5)
+        self.assertFalse(responses[7]["ok"])
+
+    def test_call_checks_public_arity(self):
+        """Test the call op refuses the validate flag and other argument counts"""
+        server = FestivalServer()
+        def call(function, args):
+            line = json.dumps({"id": 1, "op": "call", "function": function, "args": args})
+            return json.loads(server.respond(line.encode()))
+        self.assertFalse(call("calculate_ticket_revenue", [-1, 0, 0, False])["ok"])
+        self.assertFalse(call("calculate_seats_remaining", [9999, 0, 0, False])["ok"])
+        self.assertFalse(call("calculate_seats_per_row", "12")["ok"])
+        self.assertEqual(call("calculate_ticket_revenue", [-1, 0, 0])["error"], "Number of tickets cannot be negative")
+        self.assertEqual(call("calculate_seats_remaining", [1, 2, 3])["result"], [199, 298, 497])
+
+    def test_unexpected_errors_are_answered(self):
+        """Test an unexpected exception becomes an error response"""
+        server = FestivalServer()
+        response = json.loads(server.respond(b"[" * 100000))
+        self.assertEqual(response, {"id": None, "ok": False, "error": response["error"]})
+        self.assertTrue(response["error"])
+        response = json.loads(server.respond(b'{"id": 3, "op": "call", "function": ["x"]}'))
+        self.assertEqual(response["id"], 3)
+        self.assertFalse(response["ok"])
+
+    def test_unencodable_result_is_answered(self):
+        """Test a result the JSON encoder refuses becomes an error response"""
+        line = json.dumps({"id": 4, "op": "call", "function": "calculate_ticket_revenue",
+                           "args": [int("9" * 4299), 0, 0]})
+        response = json.loads(FestivalServer().respond(line.encode()))
+        self.assertEqual(response["id"], 4)
+        self.assertFalse(response["ok"])
+        self.assertTrue(response["error"])
+
+    def test_overlong_line_closes_connection(self):
+        """Test a request line beyond MAX_LINE is answered with an error and the connection closed"""
+        async def session():
+            listener = await FestivalServer().start("127.0.0.1", 0)
+            port = listener.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b'{"id": 1, "op": "revenue"}\n' + b" " * 200)
+            await writer.drain()
+            responses = [json.loads(line) for line in (await reader.read()).splitlines()]
+            writer.close()
+            listener.close()
+            await listener.wait_closed()
+            return responses
+        with mock.patch.object(festival_server, "MAX_LINE", 100):
+            responses = asyncio.run(session())
+        self.assertEqual(responses, [{"id": 1, "ok": True, "result": 0},
+                                     {"id": None, "ok": False, "error": "Request line too long"}])
+
+    def test_load_test_reports_latency(self):
+        """Test the bundled load test client runs against a local server"""
+        rate, p50, p99 = asyncio.run(run_load_test(connections=20, requests=10, pipeline=5))
+        self.assertGreater(rate, 0)
+        self.assertLessEqual(p50, p99)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,12 +1,8 @@
 import unittest
 import os
-import importlib
 import sys
-import io
-import contextlib
-import inspect
-import re
 from test.TestUtils import TestUtils
+from test.OutputCapture import DISCARD
 
 def check_file_exists(filename):
     """Check if a file exists in the current directory."""
@@ -14,10 +10,7 @@ def check_file_exists(filename):
 
 def safely_import_module(module_name):
     """Safely import a module, returning None if import fails."""
-    try:
-        return importlib.import_module(module_name)
-    except ImportError:
-        return None
+    return TestUtils.modules.import_module(module_name)
 
 def check_function_exists(module, function_name):
     """Check if a function exists in a module."""
@@ -28,7 +21,7 @@ def safely_call_function(module, function_name, *args, **kwargs):
     if not check_function_exists(module, function_name):
         return None
     try:
-        with contextlib.redirect_stdout(io.StringIO()):
+        with DISCARD:
             return getattr(module, function_name)(*args, **kwargs)
     except Exception:
         return None
@@ -131,26 +124,14 @@ class TestMusicFestivalFunctional(unittest.TestCase):
             errors = []
             
             try:
-                with open('music_festival_console.py', 'r') as file:
-                    content = file.read()
+                source = TestUtils.modules.source('music_festival_console.py')
                 
-                required_vars = {
-                    'zone_a_revenue': r'zone_a_revenue\s*=',
-                    'zone_b_revenue': r'zone_b_revenue\s*=',
-                    'zone_c_revenue': r'zone_c_revenue\s*=',
-                    'total_revenue': r'total_revenue\s*=',
-                    'zone_a_left': r'zone_a_left\s*=',
-                    'zone_b_left': r'zone_b_left\s*=',
-                    'zone_c_left': r'zone_c_left\s*=',
-                    'complete_rows': r'complete_rows\s*=',
-                    'remaining_seats': r'remaining_seats\s*='
-                }
+                required_vars = ['zone_a_revenue', 'zone_b_revenue', 'zone_c_revenue', 'total_revenue',
+                                 'zone_a_left', 'zone_b_left', 'zone_c_left',
+                                 'complete_rows', 'remaining_seats']
                 
-                # For functional solutions, check if all required variables are used in the main section
-                missing_vars = []
-                for var_name, pattern in required_vars.items():
-                    if not re.search(pattern, content):
-                        missing_vars.append(var_name)
+                # For functional solutions, check if all required variables are assigned
+                missing_vars = [var_name for var_name in required_vars if var_name not in source.assigned]
                 
                 # If some variables are missing, check if the functions exist and work correctly
                 if missing_vars:
@@ -160,15 +141,15 @@ class TestMusicFestivalFunctional(unittest.TestCase):
                     # If functions work correctly, we can be more lenient about variable names
                 
                 # Check if main program structure exists
-                if "__name__" not in content or "__main__" not in content:
+                if not source.has_main:
                     errors.append("Main program structure (__name__ == '__main__') not found")
                 
                 # Check for input statements
-                if "input(" not in content:
+                if "input" not in source.calls:
                     errors.append("User input functionality not found")
                 
                 # Check for print statements (output functionality)
-                if "print(" not in content:
+                if "print" not in source.calls:
                     errors.append("Output functionality (print statements) not found")
             
             except Exception as e:
@@ -209,21 +190,24 @@ class TestMusicFestivalFunctional(unittest.TestCase):
             
             errors = []
             
+            # Every function is checked against one parse of the module source
+            source = TestUtils.modules.module_source(self.module_obj)
+            
             # Check calculate_ticket_revenue function
             if check_function_exists(self.module_obj, "calculate_ticket_revenue"):
                 try:
-                    revenue_code = inspect.getsource(getattr(self.module_obj, "calculate_ticket_revenue"))
-                    if "*" not in revenue_code:
+                    revenue_facts = source.function("calculate_ticket_revenue")
+                    if "*" not in revenue_facts.operators:
                         errors.append("Multiplication (*) operator not found in calculate_ticket_revenue")
-                    if "+" not in revenue_code:
+                    if "+" not in revenue_facts.operators:
                         errors.append("Addition (+) operator not found in calculate_ticket_revenue")
                     
                     # Check for proper calculation pattern
-                    if "5000" not in revenue_code and "ZONE_A_PRICE" not in revenue_code:
+                    if 5000 not in revenue_facts.constants and "ZONE_A_PRICE" not in revenue_facts.names:
                         errors.append("Zone A price (5000) or constant not found in calculate_ticket_revenue")
-                    if "3000" not in revenue_code and "ZONE_B_PRICE" not in revenue_code:
+                    if 3000 not in revenue_facts.constants and "ZONE_B_PRICE" not in revenue_facts.names:
                         errors.append("Zone B price (3000) or constant not found in calculate_ticket_revenue")
-                    if "1500" not in revenue_code and "ZONE_C_PRICE" not in revenue_code:
+                    if 1500 not in revenue_facts.constants and "ZONE_C_PRICE" not in revenue_facts.names:
                         errors.append("Zone C price (1500) or constant not found in calculate_ticket_revenue")
                 except Exception as e:
                     errors.append(f"Error checking calculate_ticket_revenue source: {str(e)}")
@@ -233,16 +217,16 @@ class TestMusicFestivalFunctional(unittest.TestCase):
             # Check calculate_seats_remaining function
             if check_function_exists(self.module_obj, "calculate_seats_remaining"):
                 try:
-                    seats_code = inspect.getsource(getattr(self.module_obj, "calculate_seats_remaining"))
-                    if "-" not in seats_code:
+                    seats_facts = source.function("calculate_seats_remaining")
+                    if "-" not in seats_facts.operators:
                         errors.append("Subtraction (-) operator not found in calculate_seats_remaining")
                     
                     # Check for proper capacity constants
-                    if "200" not in seats_code and "ZONE_A_CAPACITY" not in seats_code:
+                    if 200 not in seats_facts.constants and "ZONE_A_CAPACITY" not in seats_facts.names:
                         errors.append("Zone A capacity (200) or constant not found in calculate_seats_remaining")
-                    if "300" not in seats_code and "ZONE_B_CAPACITY" not in seats_code:
+                    if 300 not in seats_facts.constants and "ZONE_B_CAPACITY" not in seats_facts.names:
                         errors.append("Zone B capacity (300) or constant not found in calculate_seats_remaining")
-                    if "500" not in seats_code and "ZONE_C_CAPACITY" not in seats_code:
+                    if 500 not in seats_facts.constants and "ZONE_C_CAPACITY" not in seats_facts.names:
                         errors.append("Zone C capacity (500) or constant not found in calculate_seats_remaining")
                 except Exception as e:
                     errors.append(f"Error checking calculate_seats_remaining source: {str(e)}")
@@ -252,14 +236,14 @@ class TestMusicFestivalFunctional(unittest.TestCase):
             # Check calculate_zone_occupancy function
             if check_function_exists(self.module_obj, "calculate_zone_occupancy"):
                 try:
-                    occupancy_code = inspect.getsource(getattr(self.module_obj, "calculate_zone_occupancy"))
-                    if "*" not in occupancy_code:
+                    occupancy_facts = source.function("calculate_zone_occupancy")
+                    if "*" not in occupancy_facts.operators:
                         errors.append("Multiplication (*) operator not found in calculate_zone_occupancy")
-                    if "/" not in occupancy_code:
+                    if "/" not in occupancy_facts.operators:
                         errors.append("Division (/) operator not found in calculate_zone_occupancy")
                     
                     # Check for percentage calculation (multiplication by 100)
-                    if "100" not in occupancy_code:
+                    if 100 not in occupancy_facts.constants:
                         errors.append("Percentage calculation (100) not found in calculate_zone_occupancy")
                 except Exception as e:
                     errors.append(f"Error checking calculate_zone_occupancy source: {str(e)}")
@@ -269,14 +253,14 @@ class TestMusicFestivalFunctional(unittest.TestCase):
             # Check calculate_seats_per_row function
             if check_function_exists(self.module_obj, "calculate_seats_per_row"):
                 try:
-                    rows_code = inspect.getsource(getattr(self.module_obj, "calculate_seats_per_row"))
-                    if "//" not in rows_code:
+                    rows_facts = source.function("calculate_seats_per_row")
+                    if "//" not in rows_facts.operators:
                         errors.append("Floor division (//) operator not found in calculate_seats_per_row")
-                    if "%" not in rows_code:
+                    if "%" not in rows_facts.operators:
                         errors.append("Modulus (%) operator not found in calculate_seats_per_row")
                     
                     # Check for seats per row constant
-                    if "20" not in rows_code and "SEATS_PER_ROW" not in rows_code:
+                    if 20 not in rows_facts.constants and "SEATS_PER_ROW" not in rows_facts.names:
                         errors.append("Seats per row (20) or constant not found in calculate_seats_per_row")
                 except Exception as e:
                     errors.append(f"Error checking calculate_seats_per_row source: {str(e)}")
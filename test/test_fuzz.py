@@ -0,0 +1,31 @@
+import types
+import unittest
+import skeleton
+from benchmarks.fuzz import fuzz
+
+
+class TestFuzz(unittest.TestCase):
+    """Test class for the property-based fuzz harness."""
+
+    def test_skeleton_matches_reference(self):
+        """Test that a short fuzz run finds no disagreement with the reference formulas"""
+        for name, cases, rate, mismatches in fuzz(cases=2000, seed=1):
+            self.assertEqual(mismatches, [], name)
+            self.assertGreater(rate, 0)
+
+    def test_broken_function_is_caught(self):
+        """Test that a wrong formula and missing validation are both reported"""
+        broken = types.SimpleNamespace(
+            calculate_ticket_revenue=skeleton.calculate_ticket_revenue,
+            calculate_seats_remaining=skeleton.calculate_seats_remaining,
+            calculate_zone_occupancy=lambda sold, capacity: (sold * 100) // capacity,
+            calculate_seats_per_row=lambda seats: (seats // 20, seats % 20),
+        )
+        report = {name: mismatches for name, _, _, mismatches in fuzz(cases=500, module=broken)}
+        self.assertEqual(report["calculate_ticket_revenue"], [])
+        self.assertTrue(report["calculate_zone_occupancy"])
+        self.assertTrue(report["calculate_seats_per_row"])
+
+
+if __name__ == '__main__':
+    unittest.main()
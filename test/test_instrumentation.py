@@ -0,0 +1,99 @@
+import json
+import os
+import tempfile
+import unittest
+import instrumentation
+import sales_stream
+import skeleton
+from instrumentation import LatencyHistogram, Registry, bucket_bounds, bucket_index
+
+
+class TestInstrumentation(unittest.TestCase):
+    """Test class for the opt-in call metrics."""
+
+    def setUp(self):
+        """Setup a fresh registry."""
+        self.registry = Registry()
+        self.original = skeleton.calculate_ticket_revenue
+
+    def tearDown(self):
+        """Restore the uninstrumented functions."""
+        instrumentation.disable()
+
+    def test_enable_and_disable_swap_functions(self):
+        """Test that disable restores the exact original functions"""
+        instrumentation.enable(registry=self.registry)
+        self.assertTrue(instrumentation.is_enabled())
+        self.assertIsNot(skeleton.calculate_ticket_revenue, self.original)
+        instrumentation.disable()
+        self.assertFalse(instrumentation.is_enabled())
+        self.assertIs(skeleton.calculate_ticket_revenue, self.original)
+
+    def test_calls_errors_and_validation_are_counted(self):
+        """Test call counts, errors per message and separately timed validation"""
+        instrumentation.enable(sales_stream, registry=self.registry)
+        for i in range(10):
+            self.assertEqual(skeleton.calculate_ticket_revenue(i, 0, 0), i * 5000)
+        for sold in (201, 202):
+            with self.assertRaisesRegex(ValueError, "Sold tickets cannot exceed capacity"):
+                skeleton.calculate_zone_occupancy(sold, 200)
+        tracker = sales_stream.SalesTracker()
+        tracker.apply(0, 20)
+        tracker.report()
+        data = self.registry.snapshot()
+        self.assertEqual(data["calculate_ticket_revenue"]["calls"], 10)
+        self.assertEqual(data["_check_ticket_counts"]["calls"], 10)
+        self.assertEqual(data["calculate_zone_occupancy"]["calls"], 2 + len(skeleton.DEFAULT_ZONES))
+        self.assertEqual(data["calculate_zone_occupancy"]["errors"], {"Sold tickets cannot exceed capacity": 2})
+        self.assertEqual(data["calculate_ticket_revenue"]["latency_ns"]["count"], 10)
+
+    def test_reset_keeps_active_wrappers_recording(self):
+        """Test reset zeroes the metrics and calls made afterwards are still counted"""
+        instrumentation.enable(registry=self.registry)
+        skeleton.calculate_ticket_revenue(1, 0, 0)
+        with self.assertRaises(ValueError):
+            skeleton.calculate_ticket_revenue(-1, 0, 0)
+        self.registry.reset()
+        data = self.registry.snapshot()["calculate_ticket_revenue"]
+        self.assertEqual((data["calls"], data["errors"], data["latency_ns"]["count"]), (0, {}, 0))
+        skeleton.calculate_ticket_revenue(2, 0, 0)
+        data = self.registry.snapshot()["calculate_ticket_revenue"]
+        self.assertEqual((data["calls"], data["latency_ns"]["count"]), (1, 1))
+
+    def test_histogram_buckets(self):
+        """Test that buckets tile the integers and percentiles stay within bucket precision"""
+        previous = -1
+        for index in range(400):
+            low, high = bucket_bounds(index)
+            self.assertEqual(low, previous + 1)
+            self.assertEqual((bucket_index(low), bucket_index(high)), (index, index))
+            self.assertLessEqual(high - low + 1, max(1, low // 16))
+            previous = high
+        histogram = LatencyHistogram()
+        for value in range(1, 10001):
+            histogram.record(value)
+        self.assertAlmostEqual(histogram.percentile(0.5), 5000, delta=5000 / 16)
+        self.assertAlmostEqual(histogram.percentile(0.99), 9900, delta=9900 / 16)
+        self.assertEqual(histogram.percentile(1.0), 10000)
+
+    def test_exports(self):
+        """Test the Prometheus and JSON exports"""
+        calculate = self.registry.wrap(skeleton.calculate_seats_per_row)
+        calculate(45)
+        with self.assertRaises(ValueError):
+            calculate(-1)
+        text = self.registry.to_prometheus()
+        self.assertIn('festival_calls_total{function="calculate_seats_per_row"} 2', text)
+        self.assertIn('festival_errors_total{function="calculate_seats_per_row",message="Seats cannot be negative"} 1',
+                      text)
+        self.assertIn('festival_call_duration_seconds_count{function="calculate_seats_per_row"} 2', text)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "metrics.json")
+            self.registry.write(path, "json")
+            with open(path) as file:
+                self.assertEqual(json.load(file)["calculate_seats_per_row"]["calls"], 2)
+            self.assertEqual(os.listdir(directory), ["metrics.json"])
+
+
+if __name__ == '__main__':
+    unittest.main()
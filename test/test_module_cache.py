@@ -0,0 +1,106 @@
+import os
+import sys
+import tempfile
+import unittest
+from test.ModuleCache import ModuleCache
+
+SOURCE = '''PRICE = 5000
+
+def revenue(tickets):
+    total = tickets * PRICE
+    total += 1 - 1
+    return total
+
+if __name__ == "__main__":
+    count = int(input("Tickets: "))
+    print(revenue(count))
+'''
+
+METHOD_SOURCE = '''
+class Box:
+    def split(self, seats):
+        # seats % 20 in a comment does not count
+        label = "seats // 20"
+        return seats // SEATS_PER_ROW
+'''
+
+
+class TestModuleCache(unittest.TestCase):
+    """Test class for the session-wide module import and parse cache."""
+
+    def setUp(self):
+        """Setup a temporary importable module."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "cached_student.py")
+        with open(self.path, "w") as file:
+            file.write(SOURCE)
+        sys.path.insert(0, self.directory.name)
+        self.cache = ModuleCache()
+
+    def tearDown(self):
+        """Remove the temporary module."""
+        sys.path.remove(self.directory.name)
+        sys.modules.pop("cached_student", None)
+        self.directory.cleanup()
+
+    def touch(self, text):
+        with open(self.path, "w") as file:
+            file.write(text)
+        stat = os.stat(self.path)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+    def test_import_is_cached_until_file_changes(self):
+        """Test that a module is imported once and reloaded after an edit"""
+        module = self.cache.import_module("cached_student")
+        self.assertIs(self.cache.import_module("cached_student"), module)
+        self.assertEqual(module.PRICE, 5000)
+        self.touch(SOURCE.replace("5000", "3000"))
+        self.assertEqual(self.cache.import_module("cached_student").PRICE, 3000)
+
+    def test_missing_module_returns_none(self):
+        """Test that a module that cannot be imported is reported as None"""
+        self.assertIsNone(self.cache.import_module("no_such_student_module"))
+        self.assertIsNone(self.cache.import_module("no_such_student_module"))
+
+    def test_source_facts(self):
+        """Test the facts precomputed from the parsed source"""
+        info = self.cache.source(self.path)
+        self.assertIs(self.cache.source(self.path), info)
+        self.assertEqual(set(info.functions), {"revenue"})
+        self.assertEqual(info.operators, {"*", "+", "-"})
+        self.assertTrue({"PRICE", "total", "count"} <= info.assigned)
+        self.assertTrue({"input", "print", "int"} <= info.calls)
+        self.assertTrue(info.has_main)
+        self.touch(SOURCE.replace("*", "//"))
+        self.assertIn("//", self.cache.source(self.path).operators)
+
+    def test_function_facts(self):
+        """Test that operators, names and constants are recorded per function"""
+        self.touch(SOURCE + METHOD_SOURCE)
+        info = self.cache.source(self.path)
+        revenue = info.function("revenue")
+        self.assertEqual(revenue.operators, {"*", "+", "-"})
+        self.assertIn("PRICE", revenue.names)
+        self.assertEqual(revenue.assigned, {"total"})
+        self.assertEqual(revenue.constants, {1})
+        split = info.function("Box.split")
+        self.assertEqual(split.operators, {"//"})
+        self.assertIn("SEATS_PER_ROW", split.names)
+        self.assertNotIn(20, split.constants)
+        self.assertIsNone(info.function("split"))
+
+    def test_deeply_nested_expression(self):
+        """Test a long expression that Python compiles is walked without RecursionError"""
+        self.touch("def total(x):\n    return " + " + ".join(["x"] * 1500) + "\n")
+        info = self.cache.source(self.path)
+        self.assertEqual(info.function("total").operators, {"+"})
+        self.assertIn("x", info.function("total").names)
+
+    def test_missing_source_raises(self):
+        """Test that reading a missing file raises OSError"""
+        with self.assertRaises(OSError):
+            self.cache.source(os.path.join(self.directory.name, "missing.py"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+from array import array
+from occupancy import (occupancy_at_least, occupancy_at_least_batch, occupancy_bp, occupancy_bp_batch,
+                       occupancy_percent, occupancy_percent_batch)
+from skeleton import calculate_zone_occupancy
+
+class TestOccupancy(unittest.TestCase):
+    """Test class for the integer occupancy engine."""
+
+    def test_percent_is_bit_identical(self):
+        """Test display percentages equal calculate_zone_occupancy for every value in range"""
+        for capacity in (1, 3, 7, 200, 300, 500):
+            sold = array("q", range(capacity + 1))
+            percents = occupancy_percent_batch(sold, array("q", [capacity] * len(sold)))
+            for s, percent in zip(sold, percents):
+                self.assertEqual(percent, calculate_zone_occupancy(s, capacity))
+                self.assertEqual(occupancy_percent(s, capacity), calculate_zone_occupancy(s, capacity))
+
+    def test_basis_points_and_thresholds(self):
+        """Test basis points round down and thresholds compare exactly"""
+        self.assertEqual(occupancy_bp(200, 300), 6666)
+        self.assertEqual(occupancy_bp(199, 200), 9950)
+        self.assertEqual(list(occupancy_bp_batch([0, 1, 200], [200, 3, 200])), [0, 3333, 10000])
+        self.assertTrue(occupancy_at_least(180, 200, 90))
+        self.assertFalse(occupancy_at_least(179, 200, 90))
+        self.assertEqual(list(occupancy_at_least_batch([180, 179], [200, 200], 90)), [True, False])
+
+    def test_invalid_pairs(self):
+        """Test scalar and batch variants raise the calculate_zone_occupancy messages"""
+        with self.assertRaisesRegex(ValueError, "Sold tickets cannot exceed capacity"):
+            occupancy_bp(250, 200)
+        with self.assertRaisesRegex(ValueError, "Sold tickets cannot exceed capacity"):
+            occupancy_bp_batch([1, 250], [200, 200])
+        with self.assertRaisesRegex(ValueError, "Capacity must be positive"):
+            occupancy_bp_batch([0], [0])
+        with self.assertRaisesRegex(ValueError, "Values must be whole numbers"):
+            occupancy_bp_batch([1.5], [200])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import sys
+import unittest
+from test.OutputCapture import DISCARD, OutputCapture, safely_call_many
+
+
+class Noisy:
+    """Stand-in student module whose function prints."""
+
+    @staticmethod
+    def rows(seats):
+        print("computing", seats)
+        if seats < 0:
+            raise ValueError("Seats cannot be negative")
+        return seats // 20, seats % 20
+
+
+class TestOutputCapture(unittest.TestCase):
+    """Test class for the reusable stdout capture."""
+
+    def test_buffer_is_reused_and_reset(self):
+        """Test that one buffer is reused and emptied on every entry"""
+        capture = OutputCapture()
+        with capture:
+            print("first")
+        self.assertEqual(capture.getvalue(), "first\n")
+        stream = capture.stream
+        with capture:
+            print("second")
+        self.assertIs(capture.stream, stream)
+        self.assertEqual(capture.getvalue(), "second\n")
+
+    def test_stdout_restored_after_nesting_and_errors(self):
+        """Test that sys.stdout is restored after nested use and exceptions"""
+        original = sys.stdout
+        with self.assertRaises(ValueError):
+            with DISCARD:
+                with DISCARD:
+                    print("discarded")
+                raise ValueError("boom")
+        self.assertIs(sys.stdout, original)
+
+    def test_safely_call_many(self):
+        """Test that every row returns its result or the exception it raised"""
+        capture = OutputCapture()
+        results = safely_call_many(Noisy, "rows", [45, (20,), -1], capture)
+        self.assertEqual(results[:2], [(2, 5), (1, 0)])
+        self.assertIsInstance(results[2], ValueError)
+        self.assertEqual(capture.getvalue().count("computing"), 3)
+        self.assertIsNone(safely_call_many(Noisy, "missing", [1]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import io
+import os
+import tempfile
+import unittest
+from unittest import mock
+from test.ParallelRunner import collect_test_ids, run
+from test.ResultCollector import ResultCollector
+from test.StubResultReceiver import StubResultReceiver
+from test.TestUtils import TestUtils
+
+
+class AssertingTests(unittest.TestCase):
+    """Tests that only record yakshaAssert results, run by the pool below"""
+    __test__ = False
+
+    def test_results(self):
+        for i in range(7):
+            TestUtils.yakshaAssert(f"TestResult{i}", True, "functional")
+
+
+class TestParallelRunner(unittest.TestCase):
+    """Test class for the process-pool test runner"""
+
+    def test_ids_follow_unittest_order(self):
+        """Test that sharded test ids keep the order of a serial run"""
+        suite = unittest.TestLoader().loadTestsFromName("test.test_occupancy")
+        serial = [test.id() for group in suite for test in group]
+        self.assertEqual(collect_test_ids(["test.test_occupancy"]), serial)
+
+    def test_run_matches_serial_result(self):
+        """Test that a parallel run reports every test and passes when they pass"""
+        out = io.StringIO()
+        self.assertTrue(run(["test.test_occupancy"], workers=2, stream=out))
+        count = len(collect_test_ids(["test.test_occupancy"]))
+        self.assertIn(f"Ran {count} tests", out.getvalue())
+        self.assertTrue(out.getvalue().endswith("OK\n"))
+
+    def test_workers_return_results_to_parent(self):
+        """Test workers hand results and custom.ih data back to the parent instead of uploading"""
+        handle, custom_path = tempfile.mkstemp(suffix=".ih")
+        os.write(handle, b"abc")
+        os.close(handle)
+        self.addCleanup(os.remove, custom_path)
+        with StubResultReceiver() as receiver:
+            collector = ResultCollector(receiver.url, custom_path, flush_size=1)
+            with mock.patch.object(TestUtils, "collector", collector):
+                self.assertTrue(run([f"{__name__}.AssertingTests"], workers=2, stream=io.StringIO()))
+            collector.close()
+        self.assertEqual(receiver.requests, 7)
+        self.assertEqual(collector.customData, "abc")
+
+
+if __name__ == '__main__':
+    unittest.main()
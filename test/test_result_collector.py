@@ -0,0 +1,72 @@
+import json
+import os
+import tempfile
+import unittest
+from test.ResultCollector import ResultCollector
+from test.StubResultReceiver import StubResultReceiver
+from test.TestCaseResultDto import TestCaseResultDto
+
+GUID = "dc66f3c1-630f-40ab-8314-f7bb9ffcb71f"
+
+def make_dto(i):
+    return TestCaseResultDto(f"Test{i}", "functional", 1, 1, "Passed", True, "")
+
+class TestResultCollector(unittest.TestCase):
+    """Test class for batched result publishing against a local stub receiver."""
+
+    def setUp(self):
+        """Setup a stub receiver and a custom.ih file."""
+        self.receiver = StubResultReceiver().start()
+        handle, self.custom_path = tempfile.mkstemp(suffix=".ih")
+        with os.fdopen(handle, "w") as f:
+            f.write("custom-data")
+
+    def tearDown(self):
+        self.receiver.stop()
+        os.remove(self.custom_path)
+
+    def test_bulk_flush(self):
+        """Test a whole session is pushed in one request and custom.ih is read once"""
+        collector = ResultCollector(self.receiver.url, self.custom_path, flush_size=0)
+        collector.add(GUID, make_dto(0))
+        os.remove(self.custom_path)
+        for i in range(1, 10):
+            collector.add(GUID, make_dto(i))
+        open(self.custom_path, "w").close()
+        self.assertEqual(self.receiver.requests, 0)
+        collector.close()
+        self.assertEqual(self.receiver.requests, 1)
+        payload = self.receiver.payloads[0]
+        self.assertEqual(len(payload), 10)
+        self.assertEqual(payload[3]["customData"], "custom-data")
+        self.assertEqual(json.loads(payload[3]["testCaseResults"])[GUID]["methodName"], "Test3")
+
+    def test_flush_size(self):
+        """Test results are pushed every flush_size, singles in the original format"""
+        collector = ResultCollector(self.receiver.url, self.custom_path, flush_size=4)
+        for i in range(9):
+            collector.add(GUID, make_dto(i))
+        collector.close()
+        self.assertEqual(self.receiver.requests, 3)
+        self.assertEqual([len(p) for p in self.receiver.payloads[:2]], [4, 4])
+        self.assertEqual(set(self.receiver.payloads[2]), {"testCaseResults", "customData", "hostName", "attemptId"})
+
+    def test_default_posts_each_result(self):
+        """Test the default pushes every result on its own in the original format"""
+        collector = ResultCollector(self.receiver.url, self.custom_path)
+        for i in range(3):
+            collector.add(GUID, make_dto(i))
+        merged = ResultCollector(self.receiver.url, self.custom_path, flush_size=0)
+        for i in range(3, 7):
+            merged.add(GUID, make_dto(i))
+        collector.add_results(merged.pending)
+        merged.pending = []
+        collector.drain()
+        self.assertEqual(self.receiver.requests, 7)
+        for payload in self.receiver.payloads:
+            self.assertEqual(set(payload), {"testCaseResults", "customData", "hostName", "attemptId"})
+        collector.close()
+        merged.close()
+
+if __name__ == '__main__':
+    unittest.main()
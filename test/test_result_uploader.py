@@ -0,0 +1,61 @@
+import time
+import unittest
+from test.ResultCollector import ResultCollector
+from test.ResultUploader import ResultUploader
+from test.StubResultReceiver import StubResultReceiver
+from test.TestCaseResultDto import TestCaseResultDto
+
+class TestResultUploader(unittest.TestCase):
+    """Test class for the background result uploader against a slow, failing stand-in server."""
+
+    def test_submit_does_not_block_on_latency(self):
+        """Test submitting is not slowed by server latency and retries deliver everything"""
+        with StubResultReceiver(delay=0.05, fail_first=2) as receiver:
+            uploader = ResultUploader(receiver.url, retries=3, backoff=0.01)
+            start = time.perf_counter()
+            for i in range(5):
+                uploader.submit(f'{{"n": {i}}}')
+            self.assertLess(time.perf_counter() - start, 0.05)
+            uploader.close()
+        self.assertEqual(uploader.sent, 5)
+        self.assertEqual(uploader.failed, 0)
+        self.assertEqual(receiver.requests, 7)
+        self.assertEqual(sorted(p["n"] for p in receiver.payloads), [0, 1, 2, 3, 4])
+
+    def test_gives_up_after_retries(self):
+        """Test a payload is reported as failed once its retries are used up"""
+        failures = []
+        with StubResultReceiver(status=503) as receiver:
+            uploader = ResultUploader(receiver.url, retries=2, backoff=0.01,
+                                      on_failure=lambda body, status: failures.append(status))
+            uploader.submit("{}")
+            uploader.drain()
+            uploader.close()
+        self.assertEqual(receiver.requests, 3)
+        self.assertEqual(failures, [503])
+
+    def test_retry_time_is_capped(self):
+        """Test backoff across many payloads stops once the retry budget is spent"""
+        with StubResultReceiver(status=503) as receiver:
+            uploader = ResultUploader(receiver.url, retries=3, backoff=0.1, retry_time=0.35)
+            start = time.perf_counter()
+            for _ in range(10):
+                uploader.submit("{}")
+            uploader.close()
+            elapsed = time.perf_counter() - start
+        self.assertEqual(uploader.failed, 10)
+        self.assertLess(elapsed, 1.0)
+        # 0.1 + 0.2 s of backoff for the first payload, then 0.05 s is left
+        self.assertEqual(receiver.requests, 3 + 9)
+
+    def test_collector_drains_on_close(self):
+        """Test the collector pushes pending results through the uploader on close"""
+        with StubResultReceiver(delay=0.01, fail_first=1) as receiver:
+            collector = ResultCollector(receiver.url, __file__, flush_size=1, backoff=0.01)
+            for i in range(3):
+                collector.add("guid", TestCaseResultDto(f"Test{i}", "boundary", 1, 0, "Failed", True, ""))
+            collector.close()
+        self.assertEqual(len(receiver.payloads), 3)
+
+if __name__ == '__main__':
+    unittest.main()
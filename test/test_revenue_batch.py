@@ -0,0 +1,76 @@
+import unittest
+from array import array
+from unittest import mock
+import skeleton
+from skeleton import calculate_ticket_revenue, calculate_ticket_revenue_batch
+
+
+class RevenueBatchChecks:
+    """Checks shared by the NumPy and buffer paths of calculate_ticket_revenue_batch.
+
+    Each test class defines columns(*values, typecode="q") to build its column type.
+    """
+
+    def test_matches_scalar_function(self):
+        """Test every batch revenue matches calculate_ticket_revenue"""
+        rows = [(0, 0, 0), (1, 2, 3), (200, 300, 500), (150, 0, 499)]
+        revenues = calculate_ticket_revenue_batch(*self.columns(*zip(*rows)))
+        self.assertEqual([int(r) for r in revenues], [calculate_ticket_revenue(*row) for row in rows])
+
+    def test_empty_columns(self):
+        """Test empty columns give an empty result"""
+        self.assertEqual(len(calculate_ticket_revenue_batch(*self.columns((), (), ()))), 0)
+
+    def test_unequal_lengths(self):
+        """Test columns of different lengths raise ValueError"""
+        with self.assertRaisesRegex(ValueError, "^Sales columns must have the same length$"):
+            calculate_ticket_revenue_batch(*self.columns((1, 2), (1, 2), (1,)))
+
+    def test_negative_values(self):
+        """Test a negative count anywhere raises ValueError"""
+        with self.assertRaisesRegex(ValueError, "^Number of tickets cannot be negative$"):
+            calculate_ticket_revenue_batch(*self.columns((1, 2), (1, -2), (1, 2)))
+
+    def test_non_integer_columns(self):
+        """Test float columns raise ValueError"""
+        with self.assertRaisesRegex(ValueError, "^Number of tickets must be whole numbers$"):
+            calculate_ticket_revenue_batch(*self.columns((1.0,), (1.0,), (1.0,), typecode="d"))
+
+    def test_overflow_rejected(self):
+        """Test revenues that do not fit in 64 bits raise ValueError"""
+        with self.assertRaisesRegex(ValueError, "^Number of tickets is too large$"):
+            calculate_ticket_revenue_batch(*self.columns((2 ** 62,), (0,), (0,)))
+        with self.assertRaisesRegex(ValueError, "^Number of tickets is too large$"):
+            calculate_ticket_revenue_batch(*self.columns((2 ** 63 + 5,), (0,), (0,), typecode="Q"))
+
+
+@unittest.skipIf(skeleton.np is None, "NumPy is not installed")
+class TestRevenueBatchNumpy(RevenueBatchChecks, unittest.TestCase):
+    """Test class for the NumPy path of calculate_ticket_revenue_batch."""
+
+    def columns(self, *values, typecode="q"):
+        dtype = {"q": skeleton.np.int64, "Q": skeleton.np.uint64, "d": skeleton.np.float64}[typecode]
+        return [skeleton.np.array(column, dtype=dtype) for column in values]
+
+
+class TestRevenueBatchBuffer(RevenueBatchChecks, unittest.TestCase):
+    """Test class for the buffer path of calculate_ticket_revenue_batch."""
+
+    def setUp(self):
+        """Setup the batch function without NumPy."""
+        patcher = mock.patch.object(skeleton, "np", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def columns(self, *values, typecode="q"):
+        return [array(typecode, column) for column in values]
+
+    def test_plain_sequences(self):
+        """Test lists are accepted and non-integer items rejected"""
+        self.assertEqual(list(calculate_ticket_revenue_batch([1], [1], [1])), [9500])
+        with self.assertRaisesRegex(ValueError, "^Number of tickets must be whole numbers$"):
+            calculate_ticket_revenue_batch(["1"], [1], [1])
+
+
+if __name__ == '__main__':
+    unittest.main()
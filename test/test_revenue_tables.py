@@ -0,0 +1,58 @@
+import unittest
+import skeleton
+from skeleton import calculate_ticket_revenue, calculate_ticket_revenue_grid, revenue_table
+
+
+class TestRevenueTables(unittest.TestCase):
+    """Test class for precomputed revenue tables and the what-if revenue grid."""
+
+    def test_tables_match_arithmetic(self):
+        """Test table lookups equal the arithmetic inside and beyond capacity"""
+        for a in range(0, 260, 13):
+            for b in range(0, 360, 17):
+                for c in (0, 1, 499, 500, 501, 10 ** 6):
+                    expected = a * 5000 + b * 3000 + c * 1500
+                    self.assertEqual(calculate_ticket_revenue(a, b, c, use_table=True), expected)
+                    self.assertEqual(calculate_ticket_revenue(a, b, c), expected)
+        self.assertEqual(revenue_table(3000, 300)[300], 900000)
+        self.assertIs(revenue_table(3000, 300), skeleton._ZONE_B_REVENUE)
+
+    def test_tables_ignore_negative_counts(self):
+        """Test unvalidated negative counts use the arithmetic, not wrapped table indexes"""
+        self.assertEqual(calculate_ticket_revenue(-1, 0, 0, validate=False, use_table=True), -5000)
+        self.assertEqual(calculate_ticket_revenue(0, -300, 2, validate=False, use_table=True), -897000)
+        self.assertEqual(calculate_ticket_revenue(1.5, 0, 0, validate=False, use_table=True), 7500.0)
+
+    def test_invalid_tables(self):
+        """Test revenue tables reject invalid prices and capacities"""
+        with self.assertRaisesRegex(ValueError, "Price cannot be negative"):
+            revenue_table(-1, 10)
+        with self.assertRaisesRegex(ValueError, "Values must be whole numbers"):
+            revenue_table(1.5, 10)
+
+    def test_grid(self):
+        """Test every grid cell equals calculate_ticket_revenue, with and without price overrides"""
+        a, b, c = range(0, 201, 50), range(0, 301, 100), range(0, 501, 250)
+        grid = calculate_ticket_revenue_grid(a, b, c)
+        what_if = calculate_ticket_revenue_grid(a, b, c, prices=(6000, 3000, 1000))
+        for i, zone_a in enumerate(a):
+            for j, zone_b in enumerate(b):
+                for k, zone_c in enumerate(c):
+                    self.assertEqual(grid[i][j][k], calculate_ticket_revenue(zone_a, zone_b, zone_c))
+                    self.assertEqual(what_if[i][j][k], zone_a * 6000 + zone_b * 3000 + zone_c * 1000)
+
+    def test_invalid_grid(self):
+        """Test the grid rejects invalid counts and prices"""
+        with self.assertRaisesRegex(ValueError, "Number of tickets cannot be negative"):
+            calculate_ticket_revenue_grid([-1], [0], [0])
+        with self.assertRaisesRegex(ValueError, "Number of tickets must be whole numbers"):
+            calculate_ticket_revenue_grid([1.5], [0], [0])
+        with self.assertRaisesRegex(ValueError, "Expected one whole-number price per zone"):
+            calculate_ticket_revenue_grid([1], [0], [0], prices=(1, 2))
+        with self.assertRaisesRegex(ValueError, "Number of tickets is too large"):
+            calculate_ticket_revenue_grid([2 ** 62], [0], [0], prices=(2, 0, 0))
+        self.assertEqual(calculate_ticket_revenue_grid([2 ** 61], [0], [0], prices=(2, 0, 0))[0][0][0], 2 ** 62)
+
+
+if __name__ == '__main__':
+    unittest.main()
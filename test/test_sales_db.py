@@ -0,0 +1,130 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from benchmarks.sqlite_ingest import make_events
+from sales_db import SalesDatabase
+from skeleton import ZoneTable, calculate_ticket_revenue, calculate_zone_occupancy
+
+
+class TestSalesDatabase(unittest.TestCase):
+    """Test class for the SQLite sales database."""
+
+    def setUp(self):
+        """Setup an empty database file."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "sales.db")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def fill(self, db):
+        db.add("A", 50, 10)
+        db.add("B", 120, 20)
+        db.add("A", -10, 30)
+        db.add_many([(2, 300, 40), (2, 200, 50), (1, -20, 60)])
+
+    def test_occupancy_at(self):
+        """Test occupancy at a timestamp matches calculate_zone_occupancy"""
+        with SalesDatabase(self.path) as db:
+            self.fill(db)
+            self.assertEqual(db.sold_at(None), [40, 100, 500])
+            self.assertEqual(db.sold_at(30), [40, 120, 0])
+            self.assertEqual(db.occupancy_at(5), (0.0, 0.0, 0.0))
+            self.assertEqual(db.occupancy_at(30), (calculate_zone_occupancy(40, 200), calculate_zone_occupancy(120, 300), 0.0))
+            self.assertEqual(db.occupancy_at(60)[2], 100.0)
+
+    def test_revenue_between(self):
+        """Test revenue in a time window prices sales and refunds per zone"""
+        with SalesDatabase(self.path) as db:
+            self.fill(db)
+            self.assertEqual(db.revenue_between(0, 100), calculate_ticket_revenue(40, 100, 500))
+            self.assertEqual(db.revenue_between(10, 30), calculate_ticket_revenue(50, 120, 0))
+            self.assertEqual(db.revenue_per_zone(30, 61), (-10 * 5000, -20 * 3000, calculate_ticket_revenue(0, 0, 500)))
+            self.assertEqual(db.revenue_between(30, 61), sum(db.revenue_per_zone(30, 61)))
+            self.assertEqual(db.revenue_between(100, 200), 0)
+
+    def test_reopen_restores_inventory(self):
+        """Test events persist across connections and keep the capacity rule"""
+        with SalesDatabase(self.path, batch_size=2) as db:
+            self.fill(db)
+        with SalesDatabase(self.path) as db:
+            self.assertEqual(db.inventory.seats_remaining(), (160, 200, 0))
+            with self.assertRaises(ValueError):
+                db.add("C", 1, 70)
+            db.add("C", -1, 70)
+            self.assertEqual(db.sold_at(None), [40, 100, 499])
+
+    def test_invalid_events(self):
+        """Test invalid events are refused and earlier ones in the batch kept"""
+        with SalesDatabase(self.path) as db:
+            with self.assertRaises(ValueError):
+                db.add_many([(0, 5, 1), (0, 196, 2)])
+            self.assertEqual(db.sold_at(None), [5, 0, 0])
+            for events in ([(3, 1, 1)], [(0, -6, 1)], [(0, 1.5, 1)], [("A", 1, 1)]):
+                with self.assertRaises(ValueError):
+                    db.add_many(events)
+            with self.assertRaises(ValueError):
+                db.add("D", 1, 1)
+            self.assertEqual(db.sold_at(None), [5, 0, 0])
+
+    def test_timestamps_cannot_go_backwards(self):
+        """Test out-of-order events are refused so every point in the history stays valid"""
+        with SalesDatabase(self.path) as db:
+            db.add("A", 10, 100)
+            with self.assertRaisesRegex(ValueError, "^Timestamps cannot go backwards$"):
+                db.add("A", -5, 50)
+            with self.assertRaisesRegex(ValueError, "^Timestamps cannot go backwards$"):
+                db.add_many([(0, -5, 100), (0, -1, 99)])
+            self.assertEqual(db.occupancy_at(60), (0.0, 0.0, 0.0))
+            self.assertEqual(db.sold_at(None), [5, 0, 0])
+        with SalesDatabase(self.path) as db:
+            with self.assertRaises(ValueError):
+                db.add("A", 1, 99)
+            db.add("A", 1, 100)
+            self.assertEqual(db.occupancy_at(100)[0], calculate_zone_occupancy(6, 200))
+
+    def test_values_outside_sqlite_integers(self):
+        """Test counts and timestamps SQLite cannot store are refused before they reach the buffer"""
+        with SalesDatabase(self.path) as db:
+            db.add("A", 1, 2 ** 63 - 1)
+            with self.assertRaisesRegex(ValueError, "^Values do not fit in a 64-bit integer$"):
+                db.add("A", 1, 2 ** 63)
+            with self.assertRaisesRegex(ValueError, "^Values do not fit in a 64-bit integer$"):
+                db.add_many([(0, -2 ** 64, 2 ** 63 - 1)])
+            self.assertEqual((db.sold_at(None), db.last_timestamp), ([1, 0, 0], 2 ** 63 - 1))
+
+    def test_close_after_failed_flush(self):
+        """Test close() still closes the connection when writing the buffer fails"""
+        db = SalesDatabase(self.path)
+        db._pending.append((0, 1, 2 ** 63))
+        with self.assertRaises(OverflowError):
+            db.close()
+        with self.assertRaises(sqlite3.ProgrammingError):
+            db.connection.execute("SELECT 1")
+
+    def test_other_venue(self):
+        """Test a database created for one venue refuses another"""
+        zones = ZoneTable([("Pit", 90, 10), ("Lawn", 30, 40)])
+        with SalesDatabase(self.path, zones) as db:
+            db.add("Pit", 10, 1)
+            self.assertEqual(db.revenue_between(0, 2), 900)
+            self.assertEqual(db.occupancy_at(1), (100.0, 0.0))
+        with self.assertRaises(ValueError):
+            SalesDatabase(self.path)
+
+    def test_benchmark_events_ingest(self):
+        """Test the benchmark's generated events load and total up consistently"""
+        events = make_events(5000, seed=3)
+        with SalesDatabase(self.path, batch_size=700) as db:
+            db.add_many(events)
+            sold = [0, 0, 0]
+            for zone_id, count, _ in events:
+                sold[zone_id] += count
+            self.assertEqual(db.sold_at(None), sold)
+            self.assertEqual(list(db.inventory.sold), sold)
+            self.assertEqual(db.revenue_between(0, len(events)), calculate_ticket_revenue(*sold))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+import json
+import multiprocessing
+import os
+import tempfile
+import unittest
+from sales_ledger import LOG_NAME, SNAPSHOT_NAME, SalesLedger
+from skeleton import ZoneTable, calculate_seats_remaining, calculate_ticket_revenue
+
+
+def sell_and_crash(path):
+    """Sell into a new ledger and exit without flushing or closing it"""
+    ledger = SalesLedger(path)
+    for _ in range(10):
+        ledger.sell("A", 1)
+    os._exit(0)
+
+
+class TestSalesLedger(unittest.TestCase):
+    """Test class for the event-sourced sales ledger."""
+
+    def setUp(self):
+        """Setup an empty ledger directory."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = self.directory.name
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def fill(self, ledger):
+        ledger.sell("A", 50, 1)
+        ledger.sell("B", 120, 2)
+        ledger.refund("A", 10, 3)
+        ledger.sell("C", 499, 4)
+        ledger.sell(2, 1, 5)
+
+    def test_restart_recovers_totals(self):
+        """Test a restart with and without a final snapshot recovers the same totals"""
+        with SalesLedger(self.path) as ledger:
+            self.fill(ledger)
+        ledger = SalesLedger(self.path)
+        self.assertEqual(ledger.sold(), (40, 120, 500))
+        self.assertEqual(ledger.revenue, calculate_ticket_revenue(40, 120, 500))
+        self.assertEqual(ledger.seats_remaining(), calculate_seats_remaining(40, 120, 500))
+        ledger.refund("C", 100)
+        ledger.close(snapshot=False)
+        ledger = SalesLedger(self.path)
+        self.assertEqual(ledger.sold(), (40, 120, 400))
+        self.assertEqual(ledger.events, 6)
+        self.assertEqual(ledger.snapshot_events, 5)
+        ledger.close()
+
+    def test_periodic_snapshots_and_tail_replay(self):
+        """Test snapshots are taken every snapshot_every events and only the tail is replayed"""
+        ledger = SalesLedger(self.path, snapshot_every=2)
+        self.fill(ledger)
+        ledger.close(snapshot=False)
+        with open(os.path.join(self.path, SNAPSHOT_NAME)) as file:
+            self.assertEqual(json.load(file)["events"], 4)
+        ledger = SalesLedger(self.path, snapshot_every=2)
+        self.assertEqual((ledger.snapshot_events, ledger.events), (4, 5))
+        self.assertEqual(ledger.sold(), (40, 120, 500))
+        ledger.close()
+
+    def test_capacity_rules_and_torn_record(self):
+        """Test invalid events are rejected and a torn final record is dropped"""
+        ledger = SalesLedger(self.path)
+        self.fill(ledger)
+        with self.assertRaisesRegex(ValueError, "cannot exceed zone capacity"):
+            ledger.sell("C", 1)
+        with self.assertRaisesRegex(ValueError, "Refunds cannot exceed tickets sold"):
+            ledger.refund("B", 121)
+        with self.assertRaisesRegex(ValueError, "Event does not fit in a sales log record"):
+            ledger.sell("A", 1, 2 ** 63)
+        with self.assertRaisesRegex(ValueError, "Values must be whole numbers"):
+            ledger.refund("A", 1, 1.5)
+        self.assertEqual((ledger.events, ledger.sold()), (5, (40, 120, 500)))
+        ledger.close(snapshot=False)
+        with open(os.path.join(self.path, LOG_NAME), "ab") as file:
+            file.write(b"\x01\x00\x00")
+        ledger = SalesLedger(self.path)
+        self.assertEqual((ledger.events, ledger.sold()), (5, (40, 120, 500)))
+        ledger.close()
+
+    def test_empty_or_short_log_restarts(self):
+        """Test a 0-byte log, or one cut inside its header, is treated as empty"""
+        for contents in (b"", b"MFSAL"):
+            with open(os.path.join(self.path, LOG_NAME), "wb") as file:
+                file.write(contents)
+            with SalesLedger(self.path) as ledger:
+                self.assertEqual((ledger.events, ledger.sold()), (0, (0, 0, 0)))
+                ledger.sell("B", 3)
+            with SalesLedger(self.path) as ledger:
+                self.assertEqual((ledger.events, ledger.sold()), (1, (0, 3, 0)))
+            os.remove(os.path.join(self.path, LOG_NAME))
+            os.remove(os.path.join(self.path, SNAPSHOT_NAME))
+
+    def test_restart_after_crash_before_first_flush(self):
+        """Test a ledger whose process died before flushing its log can be reopened"""
+        process = multiprocessing.get_context().Process(target=sell_and_crash, args=(self.path,))
+        process.start()
+        process.join()
+        with SalesLedger(self.path) as ledger:
+            self.assertEqual(ledger.sold(), (0, 0, 0))
+            ledger.sell("A", 2)
+        with SalesLedger(self.path) as ledger:
+            self.assertEqual(ledger.sold(), (2, 0, 0))
+
+    def test_corrupt_snapshot_is_rejected(self):
+        """Test a snapshot that disagrees with the calculation functions is rejected"""
+        with SalesLedger(self.path) as ledger:
+            self.fill(ledger)
+        snapshot_path = os.path.join(self.path, SNAPSHOT_NAME)
+        with open(snapshot_path) as file:
+            snapshot = json.load(file)
+        snapshot["revenue"] += 1
+        with open(snapshot_path, "w") as file:
+            json.dump(snapshot, file)
+        with self.assertRaisesRegex(ValueError, "does not match ticket sales"):
+            SalesLedger(self.path)
+        with self.assertRaisesRegex(ValueError, "Snapshot does not match the venue's zones"):
+            SalesLedger(self.path, ZoneTable([("A", 1, 10)]))
+
+
+if __name__ == '__main__':
+    unittest.main()
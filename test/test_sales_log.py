@@ -0,0 +1,47 @@
+import os
+import tempfile
+import unittest
+from sales_log import RECORD, SalesLog, SalesLogWriter
+from skeleton import calculate_ticket_revenue, calculate_seats_remaining
+
+class TestSalesLog(unittest.TestCase):
+    """Test class for the memory-mapped binary sales log."""
+
+    def setUp(self):
+        """Setup a temporary log path."""
+        handle, self.path = tempfile.mkstemp(suffix=".bin")
+        os.close(handle)
+        os.remove(self.path)
+
+    def tearDown(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def test_round_trip_totals(self):
+        """Test totals read back from the log match the calculation functions"""
+        with SalesLogWriter(self.path) as log:
+            log.append(0, 10, 1)
+            log.extend([(1, 5, 2), (2, 3, 3), (0, -2, 4)])
+        with SalesLogWriter(self.path) as log:
+            log.append(2, 7, 5)
+        with SalesLog(self.path) as log:
+            self.assertEqual(len(log), 5)
+            self.assertEqual(log.sold_per_zone(), [8, 5, 10])
+            revenue, remaining, occupancy = log.totals()
+        self.assertEqual(revenue, calculate_ticket_revenue(8, 5, 10))
+        self.assertEqual(remaining, calculate_seats_remaining(8, 5, 10))
+        self.assertEqual(occupancy, (4.0, 5 * 100 / 300, 2.0))
+
+    def test_rejects_corrupt_logs(self):
+        """Test files that are not sales logs raise ValueError"""
+        with open(self.path, "wb") as f:
+            f.write(b"not a sales log!" + b"\0" * RECORD.size)
+        with self.assertRaises(ValueError):
+            SalesLog(self.path)
+        with open(self.path, "ab") as f:
+            f.write(b"\0")
+        with self.assertRaises(ValueError):
+            SalesLogWriter(self.path)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import io
+import unittest
+from sales_stream import iter_lines, parse_sale_events, run_stream
+from skeleton import calculate_ticket_revenue, calculate_seats_remaining
+
+SALES = b"""zone,count,timestamp
+A,10,1
+B,5,2
+{"zone": "C", "count": 3, "timestamp": 3}
+A,-2,4
+"""
+
+class TestSalesStream(unittest.TestCase):
+    """Test class for streaming CSV/NDJSON sales ingestion."""
+
+    def test_lines_split_across_chunks(self):
+        """Test lines are reassembled when a chunk ends mid-line"""
+        lines = list(iter_lines(io.BytesIO(SALES), chunk_size=7))
+        self.assertEqual(lines, SALES.split(b"\n")[:-1])
+
+    def test_parse_csv_and_ndjson(self):
+        """Test CSV and NDJSON events parse to (zone_id, count, timestamp)"""
+        events = list(parse_sale_events(iter_lines(io.BytesIO(SALES))))
+        self.assertEqual(events, [(0, 10, 1), (1, 5, 2), (2, 3, 3), (0, -2, 4)])
+
+    def test_run_stream_totals(self):
+        """Test streamed totals agree with the calculation functions"""
+        out = io.StringIO()
+        tracker = run_stream(io.BytesIO(SALES), out=out, every=2)
+        self.assertEqual(tracker.total_revenue, calculate_ticket_revenue(8, 5, 3))
+        self.assertEqual(tracker.inventory.seats_remaining(), calculate_seats_remaining(8, 5, 3))
+        self.assertEqual(out.getvalue().count("Sales Summary"), 2)
+        for every, reports in ((3, 2), (0, 1), (5, 1)):
+            out = io.StringIO()
+            run_stream(io.BytesIO(SALES), out=out, every=every)
+            self.assertEqual(out.getvalue().count("Sales Summary"), reports)
+        self.assertIn("Remaining Seats: 192", out.getvalue())
+
+    def test_malformed_and_oversold_events(self):
+        """Test malformed lines and oversold zones raise ValueError"""
+        with self.assertRaisesRegex(ValueError, "line 1"):
+            run_stream(io.BytesIO(b"A,1.5\n"), out=io.StringIO())
+        with self.assertRaisesRegex(ValueError, "cannot exceed zone capacity"):
+            run_stream(io.BytesIO(b"A,201\n"), out=io.StringIO())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import random
+import unittest
+from benchmarks.seat_allocator import RowScanAllocator, make_requests, replay
+from seat_allocator import SeatAllocator, first_run, longest_run
+from seat_map import SeatMap
+
+
+class TestSeatAllocator(unittest.TestCase):
+    """Test class for the segment-tree contiguous seat allocator."""
+
+    def test_bit_helpers(self):
+        """Test longest and first runs of free seats in a row mask"""
+        self.assertEqual(longest_run(0b0111011110), 4)
+        self.assertEqual(first_run(0b0111011110, 3), 1)
+        self.assertEqual(first_run(0b0111011110, 4), 1)
+        self.assertEqual(first_run(0b0111011110, 5), -1)
+
+    def test_best_row_first(self):
+        """Test groups go to the lowest row with room and fail when no row has room"""
+        allocator = SeatAllocator(45)
+        self.assertEqual(allocator.rows, 3)
+        self.assertEqual(allocator.reserve(15), (0, 0))
+        self.assertEqual(allocator.reserve(6), (1, 0))
+        self.assertEqual(allocator.reserve(5), (0, 15))
+        self.assertEqual(allocator.reserve(5), (1, 6))
+        self.assertIsNone(allocator.reserve(10))
+        self.assertEqual(allocator.reserve(5), (1, 11))
+        self.assertEqual(allocator.reserve(5), (2, 0))
+        allocator.release(1, 0, 6)
+        self.assertEqual(allocator.longest_free_run(), 6)
+        self.assertEqual(allocator.reserve(6), (1, 0))
+        self.assertEqual(allocator.seats_remaining(), 4)
+
+    def test_invalid_requests(self):
+        """Test invalid group sizes and releases"""
+        allocator = SeatAllocator(200)
+        with self.assertRaisesRegex(ValueError, "Group size must be between 1 and 20"):
+            allocator.reserve(21)
+        with self.assertRaisesRegex(ValueError, "Seat is not sold"):
+            allocator.release(0, 0, 2)
+        with self.assertRaisesRegex(ValueError, "No seat at row 0, column 20"):
+            allocator.release(0, 18, 3)
+
+    def test_matches_row_scan_and_seat_map(self):
+        """Test the tree picks the same seats as a full row scan and mirrors a SeatMap"""
+        seat_map = SeatMap(2000)
+        allocator = SeatAllocator(2000, seat_map=seat_map)
+        operations = make_requests(5000, seed=3)
+        self.assertEqual(replay(allocator, operations)[1:], replay(RowScanAllocator(2000), operations)[1:])
+        self.assertEqual(seat_map.seats_remaining(), allocator.seats_remaining())
+        rng = random.Random(0)
+        for _ in range(200):
+            k = rng.randint(1, 20)
+            row = allocator.best_row(k)
+            expected = next((r for r, mask in enumerate(allocator.free) if longest_run(mask) >= k), None)
+            self.assertEqual(row, expected)
+
+    def test_seat_map_sold_seats(self):
+        """Test seats sold in the map before or after construction are never reserved twice"""
+        seat_map = SeatMap(45)
+        seat_map.mark_range(2, 5)
+        seat_map.mark([41])
+        allocator = SeatAllocator(45, seat_map=seat_map)
+        self.assertEqual(allocator.seats_remaining(), seat_map.seats_remaining())
+        self.assertEqual(allocator.longest_free_run(), 20)
+        self.assertEqual(allocator.reserve(3), (0, 5))
+        seat_map.mark_range(8, 10)
+        self.assertEqual(allocator.reserve(4), (0, 10))
+        self.assertEqual(allocator.seats_remaining(), seat_map.seats_remaining())
+        seat_map.mark_range(20, 40)
+        self.assertIsNone(allocator.reserve(20))
+        self.assertEqual(allocator.reserve(3), (0, 14))
+        self.assertEqual(seat_map.seats_remaining(), 45 - 13 - 20 - 3)
+        self.assertEqual(allocator.seats_remaining(), seat_map.seats_remaining())
+
+    def test_release_keeps_map_in_step(self):
+        """Test a release the map refuses changes neither the map nor the allocator"""
+        seat_map = SeatMap(40)
+        allocator = SeatAllocator(40, seat_map=seat_map)
+        self.assertEqual(allocator.reserve(5), (0, 0))
+        seat_map.unmark_range(0, 1)
+        with self.assertRaisesRegex(ValueError, "Seat is not sold"):
+            allocator.release(0, 0, 5)
+        self.assertEqual(allocator.seats_remaining(), 35)
+        self.assertEqual(seat_map.seats_remaining(), 36)
+        with self.assertRaisesRegex(ValueError, "Seat map does not match the zone"):
+            SeatAllocator(45, seat_map=seat_map)
+
+
+if __name__ == '__main__':
+    unittest.main()
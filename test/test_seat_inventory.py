@@ -0,0 +1,51 @@
+import unittest
+from skeleton import SeatInventory, calculate_seats_remaining
+
+class TestSeatInventory(unittest.TestCase):
+    """Test class for the incremental seat inventory."""
+
+    def setUp(self):
+        """Setup an inventory with the default zone capacities."""
+        self.inventory = SeatInventory()
+
+    def test_matches_calculate_seats_remaining(self):
+        """Test remaining seats agree with calculate_seats_remaining"""
+        for sold in [(0, 0, 0), (50, 100, 200), (199, 299, 499), (200, 300, 500)]:
+            inventory = SeatInventory.from_sold(*sold)
+            self.assertEqual(inventory.seats_remaining(), calculate_seats_remaining(*sold))
+
+    def test_sell_and_refund(self):
+        """Test sales and refunds update remaining seats incrementally"""
+        self.assertEqual(self.inventory.sell("A", 150), 50)
+        self.assertEqual(self.inventory.sell(2, 10), 490)
+        self.assertEqual(self.inventory.refund("A", 25), 75)
+        self.assertEqual(self.inventory.seats_remaining(), (75, 300, 490))
+
+    def test_capacity_exceptions(self):
+        """Test overselling and over-refunding raise ValueError"""
+        self.inventory.sell("B", 300)
+        with self.assertRaisesRegex(ValueError, "cannot exceed zone capacity"):
+            self.inventory.sell("B", 1)
+        with self.assertRaises(ValueError):
+            self.inventory.refund("C", 1)
+        with self.assertRaises(ValueError):
+            self.inventory.sell("A", 1.5)
+        with self.assertRaises(ValueError):
+            self.inventory.sell("D", 1)
+        self.assertEqual(self.inventory.seats_remaining(), (200, 0, 500))
+
+    def test_apply_and_try_sell_by_zone_id(self):
+        """Test apply and try_sell update a zone id and keep the capacity rule"""
+        self.assertEqual(self.inventory.apply(0, 150), 50)
+        self.assertEqual(self.inventory.apply(0, -50), 100)
+        with self.assertRaisesRegex(ValueError, "^Tickets sold cannot exceed zone capacity$"):
+            self.inventory.apply(0, 101)
+        with self.assertRaisesRegex(ValueError, "^Refunds cannot exceed tickets sold$"):
+            self.inventory.apply(1, -1)
+        self.assertTrue(self.inventory.try_sell(2, 500))
+        self.assertFalse(self.inventory.try_sell(2, 1))
+        self.assertEqual(self.inventory.seats_remaining(), (100, 300, 0))
+        self.assertEqual(tuple(self.inventory.sold), (100, 0, 500))
+
+if __name__ == '__main__':
+    unittest.main()
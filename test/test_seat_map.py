@@ -0,0 +1,60 @@
+import random
+import unittest
+from seat_map import SeatMap, VenueSeatMap
+from skeleton import calculate_seats_per_row, calculate_seats_remaining
+
+
+class TestSeatMap(unittest.TestCase):
+    """Test class for the per-seat bitmap seat map."""
+
+    def test_ranges_and_popcount(self):
+        """Test bulk range marking, unmarking and popcount counts"""
+        seat_map = SeatMap(500)
+        self.assertEqual(len(seat_map.bits), 63)
+        self.assertEqual(seat_map.rows, 25)
+        seat_map.mark_range(3, 45)
+        seat_map.mark([0, 499])
+        self.assertEqual(seat_map.sold, 44)
+        self.assertEqual(seat_map.count_sold(), 44)
+        self.assertEqual(seat_map.row_free(0), 2)
+        self.assertEqual(seat_map.row_free(2), 15)
+        self.assertTrue(seat_map.is_sold(seat_map.seat(2, 4)))
+        self.assertFalse(seat_map.is_sold(seat_map.seat(2, 5)))
+        seat_map.unmark_range(10, 20)
+        self.assertEqual(seat_map.seats_remaining(), 466)
+        self.assertEqual(seat_map.row_layout(), calculate_seats_per_row(466))
+
+    def test_all_or_nothing(self):
+        """Test that a failed bulk operation changes no seat"""
+        seat_map = SeatMap(200)
+        seat_map.mark_range(0, 10)
+        for operation, args, message in ((seat_map.mark_range, (5, 15), "Seat already sold"),
+                                         (seat_map.mark, ([20, 9],), "Seat already sold"),
+                                         (seat_map.mark, ([20, 20],), "Seat listed more than once"),
+                                         (seat_map.unmark_range, (5, 15), "Seat is not sold"),
+                                         (seat_map.mark, ([200],), "No seat 200"),
+                                         (seat_map.mark, ([-1],), "Seats cannot be negative")):
+            with self.assertRaisesRegex(ValueError, message):
+                operation(*args)
+            self.assertEqual(seat_map.count_sold(), 10)
+            self.assertEqual(seat_map.sold, 10)
+
+    def test_venue_agrees_with_calculate_seats_remaining(self):
+        """Test random sales keep remaining seats equal to calculate_seats_remaining"""
+        rng = random.Random(4)
+        venue = VenueSeatMap()
+        for zone in "ABC":
+            seat_map = venue.zone(zone)
+            seat_map.mark(rng.sample(range(seat_map.capacity), rng.randint(0, seat_map.capacity)))
+        self.assertEqual(venue.seats_remaining(), calculate_seats_remaining(*venue.sold()))
+
+    def test_stadium_size(self):
+        """Test that a 100,000 seat map stays a few kilobytes"""
+        seat_map = SeatMap(100000)
+        seat_map.mark_range(0, 100000)
+        self.assertEqual(len(seat_map.bits), 12500)
+        self.assertEqual(seat_map.seats_remaining(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
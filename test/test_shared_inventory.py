@@ -0,0 +1,107 @@
+import multiprocessing
+import time
+import unittest
+from unittest import mock
+import shared_inventory
+from shared_inventory import SEQUENCE, SharedSeatInventory
+from skeleton import ZoneTable, calculate_seats_remaining_zones
+
+WORKERS = 4
+
+def sell_until_sold_out(inventory, zone, results):
+    """Sell one ticket at a time into zone until it is sold out, reporting the number sold"""
+    sold = 0
+    while inventory.try_sell(zone):
+        sold += 1
+    results.put(sold)
+
+def watch(inventory, zones, results):
+    """Check that every snapshot read during the sale is consistent"""
+    ok = True
+    while True:
+        sold = inventory.sold()
+        ok = ok and all(0 <= s <= c for s, c in zip(sold, zones.capacities))
+        if sold == tuple(zones.capacities):
+            break
+    results.put(("watch", ok))
+
+_pool_inventory = None
+
+def attach_inventory(inventory):
+    """Pool initializer: keep the inventory handed to this worker"""
+    global _pool_inventory
+    _pool_inventory = inventory
+
+def pool_sell(zone):
+    return _pool_inventory.try_sell(zone)
+
+class TestSharedInventory(unittest.TestCase):
+    """Test class for the shared-memory seat inventory."""
+
+    def setUp(self):
+        """Setup a shared inventory large enough to keep several processes contending."""
+        self.zones = ZoneTable([("A", 5000, 2000), ("B", 3000, 3000), ("C", 1500, 5000)])
+        self.inventory = SharedSeatInventory(self.zones)
+
+    def tearDown(self):
+        """Remove the shared memory block."""
+        self.inventory.close()
+
+    def test_no_oversell_across_processes(self):
+        """Test worker processes selling into three zones never oversell"""
+        context = multiprocessing.get_context()
+        results = context.Queue()
+        workers = [context.Process(target=sell_until_sold_out, args=(self.inventory, i % 3, results))
+                   for i in range(WORKERS * 3)]
+        watcher = context.Process(target=watch, args=(self.inventory, self.zones, results))
+        start = time.perf_counter()
+        for process in workers + [watcher]:
+            process.start()
+        counts = [results.get(timeout=60) for _ in range(len(workers) + 1)]
+        for process in workers + [watcher]:
+            process.join()
+        elapsed = time.perf_counter() - start
+
+        self.assertIn(("watch", True), counts)
+        self.assertEqual(sum(c for c in counts if isinstance(c, int)), 10000)
+        self.assertEqual(self.inventory.sold(), (2000, 3000, 5000))
+        self.assertEqual(self.inventory.seats_remaining(),
+                         calculate_seats_remaining_zones(self.inventory.sold(), self.zones))
+        print(f"TestSharedInventory: {10000 / elapsed:,.0f} sales/sec with {len(workers)} processes")
+
+    def test_sell_and_refund_raise_on_capacity(self):
+        """Test sell() and refund() keep the capacity rule"""
+        self.assertEqual(self.inventory.sell("A", 1990), 10)
+        with self.assertRaisesRegex(ValueError, "cannot exceed zone capacity"):
+            self.inventory.sell("A", 11)
+        self.assertFalse(self.inventory.try_sell("A", 11))
+        self.assertEqual(self.inventory.refund("A", 5), 15)
+        self.assertEqual(self.inventory.remaining("A"), 15)
+        with self.assertRaisesRegex(ValueError, "Refunds cannot exceed tickets sold"):
+            self.inventory.refund("B", 1)
+        with self.assertRaisesRegex(ValueError, "Number of tickets cannot be negative"):
+            self.inventory.try_sell("B", -1)
+
+    def test_pool_initializer(self):
+        """Test Pool workers share the inventory passed through the initializer"""
+        context = multiprocessing.get_context()
+        with context.Pool(2, initializer=attach_inventory, initargs=(self.inventory,)) as pool:
+            sales = pool.map(pool_sell, ["A"] * 2100, chunksize=50)
+        self.assertEqual(sales.count(True), 2000)
+        self.assertEqual(self.inventory.sold(), (2000, 0, 0))
+
+    def test_read_gives_up_on_a_stuck_write(self):
+        """Test readers raise TimeoutError when a writer died mid-update"""
+        self.inventory._counters[SEQUENCE] += 1
+        with mock.patch.object(shared_inventory, "READ_TIMEOUT", 0.05):
+            with self.assertRaises(TimeoutError):
+                self.inventory.remaining("A")
+            with self.assertRaises(TimeoutError):
+                self.inventory.sold()
+        self.assertEqual(self.inventory.remaining("B"), 3000)
+        self.inventory._counters[SEQUENCE] += 1
+        self.assertEqual(self.inventory.sold(), (0, 0, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
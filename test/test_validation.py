@@ -0,0 +1,37 @@
+import unittest
+import skeleton
+from skeleton import SalesSnapshot
+
+class TestValidation(unittest.TestCase):
+    """Test class for the shared validation layer and its trusted fast path."""
+
+    def test_snapshot_matches_validated_functions(self):
+        """Test snapshot calculations match the validating public functions"""
+        snapshot = SalesSnapshot(150, 200, 350)
+        self.assertEqual(snapshot.total_revenue(), skeleton.calculate_ticket_revenue(150, 200, 350))
+        self.assertEqual(snapshot.seats_remaining(), skeleton.calculate_seats_remaining(150, 200, 350))
+        self.assertEqual(snapshot.occupancy(), (75.0, 200 * 100 / 300, 70.0))
+        self.assertEqual(snapshot.row_layout(), ((2, 10), (5, 0), (7, 10)))
+
+    def test_snapshot_validates_once(self):
+        """Test invalid snapshots raise the public functions' messages"""
+        with self.assertRaisesRegex(ValueError, "^Number of tickets must be whole numbers$"):
+            SalesSnapshot("10", 20, 30)
+        with self.assertRaisesRegex(ValueError, "^Number of tickets cannot be negative$"):
+            SalesSnapshot(-1, 20, 30)
+        with self.assertRaisesRegex(ValueError, "^Tickets sold cannot exceed zone capacity$"):
+            SalesSnapshot(20, 301, 30)
+
+    def test_validate_false_skips_checks(self):
+        """Test validate=False trusts the caller and skips the checks"""
+        self.assertEqual(skeleton.calculate_ticket_revenue(1, 1, 1, validate=False), 9500)
+        self.assertEqual(skeleton.calculate_zone_occupancy(300, 200, validate=False), 150.0)
+        self.assertEqual(skeleton.calculate_seats_per_row(-1, validate=False), (-1 // 20, -1 % 20))
+        self.assertEqual(skeleton.calculate_seats_per_row_width(-7, 12, validate=False), (-7 // 12, -7 % 12))
+        with self.assertRaisesRegex(ValueError, "^Sold tickets cannot exceed capacity$"):
+            skeleton.calculate_zone_occupancy(300, 200)
+        with self.assertRaisesRegex(ValueError, "^Seats must be a whole number$"):
+            skeleton.calculate_seats_per_row(20.5)
+
+if __name__ == '__main__':
+    unittest.main()
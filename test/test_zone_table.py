@@ -0,0 +1,82 @@
+import unittest
+import skeleton
+from skeleton import (ZoneTable, DEFAULT_ZONES, SeatInventory, calculate_ticket_revenue_zones,
+                      calculate_seats_remaining_zones, calculate_zone_occupancy_zones,
+                      calculate_seats_per_row_zones)
+
+class TestZoneTable(unittest.TestCase):
+    """Test class for the data-driven zone table and N-zone calculations."""
+
+    def setUp(self):
+        """Setup a 40 zone venue."""
+        self.zones = ZoneTable((f"Z{i}", 1000 + i, 20 * (i + 1)) for i in range(40))
+
+    def test_default_zones_match_three_zone_functions(self):
+        """Test the default table reproduces the three zone functions"""
+        sold = (150, 200, 350)
+        self.assertEqual(calculate_ticket_revenue_zones(sold), skeleton.calculate_ticket_revenue(*sold))
+        self.assertEqual(calculate_seats_remaining_zones(sold), skeleton.calculate_seats_remaining(*sold))
+        self.assertEqual(calculate_zone_occupancy_zones(sold),
+                         tuple(skeleton.calculate_zone_occupancy(s, c) for s, c in zip(sold, DEFAULT_ZONES.capacities)))
+        self.assertEqual(calculate_seats_per_row_zones(sold),
+                         tuple(skeleton.calculate_seats_per_row(s) for s in sold))
+
+    def test_many_zones(self):
+        """Test calculations scale to a 40 zone venue"""
+        sold = [i for i in range(40)]
+        expected = sum(i * (1000 + i) for i in range(40))
+        self.assertEqual(calculate_ticket_revenue_zones(sold, self.zones), expected)
+        self.assertEqual(calculate_seats_remaining_zones(sold, self.zones)[39], 800 - 39)
+        self.assertEqual(self.zones.zone_id("Z7"), 7)
+        inventory = SeatInventory(self.zones)
+        self.assertEqual(inventory.sell("Z39", 5), 795)
+
+    def test_integer_zone_names(self):
+        """Test integer zone names do not collide with zone ids"""
+        zones = ZoneTable([(1, 100, 10), (2, 200, 20), (3, 300, 30)])
+        self.assertEqual(zones.zone_id(1), 0)
+        self.assertEqual(zones.zone_id(3), 2)
+        self.assertEqual(zones.zone_id(0), 0)
+        inventory = SeatInventory(zones)
+        inventory.sell(1, 5)
+        self.assertEqual(inventory.seats_remaining(), (5, 20, 30))
+        self.assertEqual(SeatInventory.from_sold(1, 2, 3, zones=zones).seats_remaining(), (9, 18, 27))
+        swapped = ZoneTable([(1, 100, 10), (0, 200, 20)])
+        self.assertEqual((swapped.zone_id(0), swapped.zone_id(1)), (1, 0))
+        with self.assertRaisesRegex(ValueError, "^Unknown zone: 4$"):
+            zones.zone_id(4)
+        with self.assertRaisesRegex(ValueError, "^Duplicate zone: 1$"):
+            ZoneTable([(1, 100, 10), (1, 200, 20)])
+
+    def test_zone_ids_checked_by_range(self):
+        """Test zone ids are accepted only inside the table"""
+        self.assertEqual(DEFAULT_ZONES.zone_id(2), 2)
+        self.assertEqual(DEFAULT_ZONES.zone_id("C"), 2)
+        for zone in (-1, 3, "D", [0]):
+            with self.assertRaises(ValueError):
+                DEFAULT_ZONES.zone_id(zone)
+
+    def test_row_layout_tables(self):
+        """Test table lookups agree with // and % inside and outside the table"""
+        for total_seats in [0, 1, 19, 20, 45, 499, 500, 501, 10007]:
+            self.assertEqual(skeleton.calculate_seats_per_row(total_seats), (total_seats // 20, total_seats % 20))
+            self.assertEqual(skeleton.calculate_seats_per_row_width(total_seats, 12), (total_seats // 12, total_seats % 12))
+        self.assertEqual(calculate_seats_per_row_zones((45, 40), (20, 15)), ((2, 5), (2, 10)))
+        with self.assertRaises(ValueError):
+            skeleton.calculate_seats_per_row_width(10, 0)
+
+    def test_invalid_zone_sales(self):
+        """Test N-zone functions raise the same ValueError messages"""
+        with self.assertRaisesRegex(ValueError, "whole numbers"):
+            calculate_ticket_revenue_zones((1.5, 0, 0))
+        with self.assertRaisesRegex(ValueError, "cannot be negative"):
+            calculate_ticket_revenue_zones((-1, 0, 0))
+        with self.assertRaisesRegex(ValueError, "cannot exceed zone capacity"):
+            calculate_seats_remaining_zones((201, 0, 0))
+        with self.assertRaises(ValueError):
+            calculate_ticket_revenue_zones((1, 2))
+        with self.assertRaises(ValueError):
+            ZoneTable([("A", 100, 0)])
+
+if __name__ == '__main__':
+    unittest.main()